@@ -0,0 +1,71 @@
+"""
+Compara a análise documento a documento (analyze_sentiment em laço) com
+o motor vetorizado em lote, com e sem as listas de palavras
+
+Uso: python -m benchmarks.bench_batch [--docs 100000]
+"""
+
+import argparse
+import time
+
+from sentiment_analysis import SentimentAnalyzer
+from sentiment_analysis.batch import analyze_tokens, iter_details
+from sentiment_analysis.text_processor import tokenize
+from testing import synthetic_corpus, with_phrases
+
+
+def scalar_pass(analyzer, texts):
+    """Caminho antigo: um analyze_sentiment e um dict por documento"""
+    return [analyzer.analyze_sentiment(text) for text in texts]
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def same_results(scalar, columns):
+    """Compara rótulo, confiança e details (listas sem considerar a ordem)"""
+    for expected, (sentiment, confidence, details) in zip(
+        scalar, iter_details(columns)
+    ):
+        for key in ("positivas", "negativas"):
+            if sorted(details[key]) != sorted(expected[2][key]):
+                return False
+            details[key] = expected[2][key]
+        if (sentiment, confidence, details) != expected:
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100_000)
+    args = parser.parse_args()
+
+    analyzer = SentimentAnalyzer()
+    texts = with_phrases(synthetic_corpus(args.docs))
+
+    scalar_time, scalar = timed(scalar_pass, analyzer, texts)
+    tokenize_time, documents = timed(lambda: [tokenize(text) for text in texts])
+    batch_time, columns = timed(analyze_tokens, documents, analyzer.lexicon)
+    label_time, _ = timed(analyze_tokens, documents, analyzer.lexicon, words=False)
+
+    print(f"Documentos: {args.docs} | tokenização: {tokenize_time:.2f}s")
+    print(f"Laço escalar (com tokenização): {scalar_time:.2f}s")
+    print(
+        f"Lote vetorizado:                {tokenize_time + batch_time:.2f}s "
+        f"(pontuação {batch_time:.2f}s, "
+        f"{(scalar_time - tokenize_time) / batch_time:.1f}x)"
+    )
+    print(
+        f"Lote sem listas de palavras:    {tokenize_time + label_time:.2f}s "
+        f"(pontuação {label_time:.2f}s, "
+        f"{(scalar_time - tokenize_time) / label_time:.1f}x)"
+    )
+    print(f"Resultados iguais: {same_results(scalar, columns)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Compara o tempo de coleta sequencial e assíncrona contra um servidor RSS local
+
+Uso: python -m benchmarks.bench_collector [--terms 12] [--latency 0.5]
+"""
+
+import argparse
+import asyncio
+import time
+
+import config
+from news_collector import NewsCollector
+from testing import FixtureRSSServer
+
+
+def run(num_terms, latency, concurrency, interval):
+    """Executa as duas estratégias e retorna os tempos em segundos"""
+    terms = [f"Termo {i} Piauí" for i in range(num_terms)]
+    config.INTERVALO_ENTRE_REQUISICOES = interval
+
+    with FixtureRSSServer(latency=latency) as server:
+        collector = NewsCollector(
+            base_url=server.base_url, search_terms=terms, use_cache=False
+        )
+
+        start = time.perf_counter()
+        sequential = collector.collect_all_news()
+        sequential_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        concurrent = asyncio.run(
+            collector.collect_all_news_async(max_concurrency=concurrency)
+        )
+        async_time = time.perf_counter() - start
+
+    assert len(sequential) == len(concurrent)
+    return sequential_time, async_time, len(concurrent)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terms", type=int, default=12)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--interval", type=float, default=0.1)
+    args = parser.parse_args()
+
+    sequential_time, async_time, items = run(
+        args.terms, args.latency, args.concurrency, args.interval
+    )
+    print(f"Itens coletados: {items}")
+    print(f"Sequencial: {sequential_time:.2f}s")
+    print(f"Assíncrono: {async_time:.2f}s")
+    print(f"Ganho: {sequential_time / async_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Cálculo de confiança: funções escalares em laço versus as versões em
+arrays (sentiment_analysis.confidence), em documentos/s
+
+Uso: python -m benchmarks.bench_confidence [--docs 1000000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from sentiment_analysis.confidence import (
+    calculate_improved_confidence,
+    improved_confidence_array,
+    neutral_confidence_array,
+    neutral_confidence_from_counts,
+)
+
+
+def synthetic_counts(docs, seed=42):
+    """Contadores e pesos aleatórios no formato do motor em lote"""
+    rng = np.random.default_rng(seed)
+    total = rng.integers(0, 60, docs)
+    positive_count = rng.integers(0, 6, docs)
+    negative_count = rng.integers(0, 6, docs)
+    positive = positive_count * rng.choice([0.5, 1.0, 1.5, 2.0], docs)
+    negative = negative_count * rng.choice([0.5, 1.0, 1.5, 2.0], docs)
+    technical = np.minimum(rng.integers(0, 10, docs), total)
+    return positive_count, negative_count, positive, negative, total, technical
+
+
+def scalar(positive_count, negative_count, positive, negative, total, technical):
+    """Caminho escalar: uma chamada por documento"""
+    improved = [
+        calculate_improved_confidence(*row)
+        for row in zip(
+            positive_count.tolist(),
+            negative_count.tolist(),
+            positive.tolist(),
+            negative.tolist(),
+            total.tolist(),
+        )
+    ]
+    neutral = [
+        neutral_confidence_from_counts(*row)
+        for row in zip(total.tolist(), technical.tolist())
+    ]
+    return np.array(improved), np.array(neutral)
+
+
+def vectorized(positive_count, negative_count, positive, negative, total, technical):
+    return (
+        improved_confidence_array(
+            positive_count, negative_count, positive, negative, total
+        ),
+        neutral_confidence_array(total, technical),
+    )
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    counts = synthetic_counts(args.docs)
+    scalar_time, expected = timed(scalar, *counts)
+    array_time, result = timed(vectorized, *counts)
+    equal = all(np.array_equal(a, b) for a, b in zip(expected, result))
+
+    print(f"Documentos: {args.docs}")
+    print(f"Escalar: {args.docs / scalar_time:,.0f} docs/s")
+    print(
+        f"Arrays:  {args.docs / array_time:,.0f} docs/s "
+        f"({scalar_time / array_time:.0f}x, resultados idênticos: {equal})"
+    )
+
+
+if __name__ == "__main__":
+    main()
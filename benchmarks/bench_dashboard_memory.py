@@ -0,0 +1,73 @@
+"""
+Mede a memória do DataFrame de notícias por 100 mil linhas, antes e
+depois do esquema tipado do dashboard
+
+Uso: python -m benchmarks.bench_dashboard_memory [--rows 100000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+from dashboard.data_utils import apply_schema
+
+TERMS = ["IA Piauí", "Inteligência Artificial Piauí", "Piauí tecnologia", "SIA"]
+SENTIMENTS = ["positivo", "negativo", "neutro"]
+
+
+def build_csv(path, rows, seed=42):
+    """Grava um CSV sintético no formato exportado pelo coletor"""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    records = []
+    for i in range(rows):
+        published = now - timedelta(minutes=rng.randrange(300 * 24 * 60))
+        title = f"Notícia {i} sobre inteligência artificial no Piauí"
+        description = f"Descrição da notícia {i} com detalhes sobre o projeto"
+        records.append(
+            {
+                "termo_busca": rng.choice(TERMS),
+                "titulo": title,
+                "link": f"https://news.google.com/rss/articles/{i:012d}",
+                "descricao": description,
+                "data_publicacao": published.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+                "timestamp_publicacao": int(published.timestamp()),
+                "data_coleta": now.replace(tzinfo=None).isoformat(),
+                "texto_completo": f"{title} {description}",
+                "sentimento": rng.choice(SENTIMENTS),
+                "confianca": rng.random(),
+            }
+        )
+    pd.DataFrame(records).to_csv(path, index=False)
+
+
+def memory_per_100k(df):
+    """Memória profunda (MB) normalizada para 100 mil linhas"""
+    return df.memory_usage(deep=True).sum() / len(df) * 100_000 / 1024**2
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "noticias.csv")
+        build_csv(path, args.rows)
+        df = pd.read_csv(path)
+
+    before = memory_per_100k(df)
+    after = memory_per_100k(apply_schema(df))
+
+    print(f"Linhas: {args.rows}")
+    print(f"Memória por 100k linhas (CSV bruto):     {before:.1f} MB")
+    print(f"Memória por 100k linhas (esquema tipado): {after:.1f} MB")
+    print(f"Redução: {1 - after / before:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Avaliação de N variantes do léxico: uma análise completa por variante
+versus tokenização compartilhada (sentiment_analysis.evaluation)
+
+Uso: python -m benchmarks.bench_evaluation [--docs 100000] [--variants 4]
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from sentiment_analysis import compile_lexicon, dictionaries
+from sentiment_analysis.batch import analyze_columns
+from sentiment_analysis.evaluation import evaluate
+from testing import synthetic_corpus, with_phrases
+
+
+def variants(count, seed=7):
+    """Léxico padrão e variantes com pesos positivos/negativos perturbados"""
+    rng = random.Random(seed)
+    lexicons = {"padrao": compile_lexicon()}
+    for i in range(1, count):
+        positive = {
+            word: weight * rng.uniform(0.5, 1.5)
+            for word, weight in dictionaries.POSITIVE_WORDS.items()
+        }
+        negative = {
+            word: weight * rng.uniform(0.5, 1.5)
+            for word, weight in dictionaries.NEGATIVE_WORDS.items()
+        }
+        lexicons[f"v{i}"] = compile_lexicon(positive=positive, negative=negative)
+    return lexicons
+
+
+def sequential(texts, lexicons):
+    """Caminho antigo: uma análise completa (com tokenização) por variante"""
+    return {
+        name: analyze_columns(texts, lexicon, words=False)
+        for name, lexicon in lexicons.items()
+    }
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--variants", type=int, default=4)
+    args = parser.parse_args()
+
+    texts = with_phrases(synthetic_corpus(args.docs))
+    lexicons = variants(args.variants)
+
+    single_time, _ = timed(analyze_columns, texts, lexicons["padrao"], False)
+    sequential_time, expected = timed(sequential, texts, lexicons)
+    shared_time, evaluation = timed(evaluate, texts, lexicons)
+    equal = all(
+        np.array_equal(expected[name]["sentimento"], columns["sentimento"])
+        and np.array_equal(expected[name]["confianca"], columns["confianca"])
+        for name, columns in evaluation.columns.items()
+    )
+
+    print(f"Documentos: {args.docs} | variantes: {args.variants}")
+    print(f"Uma análise:            {single_time:.2f}s")
+    print(f"Uma análise/variante:   {sequential_time:.2f}s")
+    print(
+        f"Tokenização única:      {shared_time:.2f}s "
+        f"({sequential_time / shared_time:.1f}x, resultados iguais: {equal})"
+    )
+    print()
+    print(evaluation.distributions())
+    print()
+    print(evaluation.agreement().round(3))
+    print()
+    if args.variants > 1:
+        changed = len(evaluation.diffs("padrao", "v1"))
+        print(f"Documentos com rótulo diferente (padrao → v1): {changed}")
+
+
+if __name__ == "__main__":
+    main()
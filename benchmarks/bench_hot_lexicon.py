@@ -0,0 +1,98 @@
+"""
+Troca a quente do léxico externo: tempo de recarga do JSON e leitores
+concorrentes analisando enquanto o arquivo é regravado (cada lote deve
+sair inteiro com uma das versões, nunca misturado)
+
+Uso: python -m benchmarks.bench_hot_lexicon [--docs 2000] [--swaps 10] [--readers 4]
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from sentiment_analysis import LexiconWatcher, SentimentAnalyzer, dictionaries
+from sentiment_analysis.batch import analyze_columns
+from sentiment_analysis.lexicon import load_lexicon_file, save_lexicon_file
+from testing import synthetic_corpus
+
+
+def write_variant(path, boost):
+    """Grava o léxico com os pesos positivos multiplicados por boost"""
+    save_lexicon_file(
+        path,
+        positive={w: v * boost for w, v in dictionaries.POSITIVE_WORDS.items()},
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--swaps", type=int, default=10)
+    parser.add_argument("--readers", type=int, default=4)
+    args = parser.parse_args()
+
+    texts = synthetic_corpus(args.docs)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lexicon.json")
+        boosts = [1.0 + 0.5 * (i % 2) for i in range(args.swaps + 1)]
+
+        # Resultado esperado de cada versão, para conferir os lotes
+        expected = {}
+        reload_times = []
+        for boost in sorted(set(boosts)):
+            write_variant(path, boost)
+            start = time.perf_counter()
+            lexicon = load_lexicon_file(path)
+            reload_times.append(time.perf_counter() - start)
+            expected[lexicon.version] = analyze_columns(texts, lexicon, words=False)
+
+        write_variant(path, boosts[0])
+        analyzer = SentimentAnalyzer(LexiconWatcher(path, interval=0))
+        stop = threading.Event()
+        stats = {"batches": 0, "mixed": 0, "versions": set()}
+        lock = threading.Lock()
+
+        def reader():
+            while not stop.is_set():
+                lexicon = analyzer.lexicon
+                columns = analyze_columns(texts, lexicon, words=False)
+                ok = np.array_equal(
+                    columns["confianca"], expected[lexicon.version]["confianca"]
+                )
+                with lock:
+                    stats["batches"] += 1
+                    stats["mixed"] += not ok
+                    stats["versions"].add(lexicon.version)
+
+        threads = [threading.Thread(target=reader) for _ in range(args.readers)]
+        for thread in threads:
+            thread.start()
+        swap_times = []
+        for boost in boosts[1:]:
+            write_variant(path, boost)
+            start = time.perf_counter()
+            analyzer.watcher.refresh()
+            swap_times.append(time.perf_counter() - start)
+            time.sleep(0.2)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    print(f"Documentos por lote: {args.docs} | leitores: {args.readers}")
+    print(f"Compilação do JSON: {np.median(reload_times) * 1000:.1f} ms (mediana)")
+    print(
+        f"Troca a quente: {np.median(swap_times) * 1000:.1f} ms (mediana), "
+        f"{max(swap_times) * 1000:.1f} ms (máx.) em {len(swap_times)} trocas"
+    )
+    print(
+        f"Lotes analisados: {stats['batches']} | versões vistas: "
+        f"{len(stats['versions'])} | lotes inconsistentes: {stats['mixed']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
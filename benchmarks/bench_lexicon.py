@@ -0,0 +1,66 @@
+"""
+Compara o tempo de carga do léxico: importar o módulo de dicionários e
+compilar a tabela versus carregar o artefato binário
+
+Uso: python -m benchmarks.bench_lexicon [--repeat 50]
+"""
+
+import argparse
+import importlib.util
+import os
+import tempfile
+import time
+
+from sentiment_analysis import dictionaries
+from sentiment_analysis.lexicon import Lexicon, compile_lexicon
+
+
+def import_and_compile():
+    """Importa dictionaries.py a partir do fonte e compila a tabela"""
+    spec = importlib.util.spec_from_file_location("_dicts", dictionaries.__file__)
+    module = importlib.util.module_from_spec(spec)
+    code = compile(open(dictionaries.__file__, encoding="utf-8").read(), "d", "exec")
+    exec(code, module.__dict__)
+    return compile_lexicon(
+        module.POSITIVE_WORDS,
+        module.NEGATIVE_WORDS,
+        module.NEUTRAL_WORDS,
+        module.NEGATION_WORDS,
+        module.NEGATION_BREAKERS,
+        module.INTENSIFIERS,
+    )
+
+
+def best_of(func, repeat, *args):
+    """Menor tempo (ms) entre as repetições"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    lexicon = compile_lexicon()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lexicon.bin")
+        lexicon.save(path)
+        loaded = Lexicon.load(path)
+
+        source_ms = best_of(import_and_compile, args.repeat)
+        artifact_ms = best_of(Lexicon.load, args.repeat, path)
+        size = os.path.getsize(path)
+
+    print(f"Entradas: {len(lexicon)} | versão {lexicon.version}")
+    print(f"Módulo Python + compilação: {source_ms:.2f} ms")
+    print(f"Artefato binário ({size} bytes): {artifact_ms:.2f} ms")
+    print(f"Mesma versão após recarga: {loaded.version == lexicon.version}")
+
+
+if __name__ == "__main__":
+    main()
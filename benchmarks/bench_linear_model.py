@@ -0,0 +1,91 @@
+"""
+Classificador linear com hashing versus o motor por regras: vazão de
+predição em lote e acurácia num conjunto de teste
+
+Sem --labeled, o modelo é treinado com rótulos do próprio léxico
+(bootstrap) e a "acurácia" é a concordância com o motor por regras. Com
+um CSV anotado (colunas --text-column e sentimento), os dois são medidos
+contra os rótulos manuais.
+
+Uso: python -m benchmarks.bench_linear_model [--docs 100000]
+     [--labeled anotadas.csv] [--text-column texto_completo]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from sentiment_analysis.batch import analyze_columns
+from sentiment_analysis.linear_model import HashingClassifier, bootstrap_labels
+from testing import synthetic_corpus, with_phrases
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def split(texts, labels, test_fraction, seed=42):
+    """Separa (textos, rótulos) de treino e de teste com uma permutação fixa"""
+    order = np.random.default_rng(seed).permutation(len(texts)).tolist()
+    cut = int(len(texts) * (1 - test_fraction))
+    return [
+        ([texts[i] for i in ids], [labels[i] for i in ids])
+        for ids in (order[:cut], order[cut:])
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--test-fraction", type=float, default=0.2)
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--labeled", help="CSV anotado manualmente")
+    parser.add_argument("--text-column", default="texto_completo")
+    args = parser.parse_args()
+
+    if args.labeled:
+        data = pd.read_csv(args.labeled)
+        texts = data[args.text_column].fillna("").astype(str).tolist()
+        labels = data["sentimento"].tolist()
+        source = f"anotados ({args.labeled})"
+    else:
+        texts = with_phrases(synthetic_corpus(args.docs))
+        labels = [None] * len(texts)
+        source = "bootstrap do léxico"
+
+    (train, train_labels), (test, test_labels) = split(
+        texts, labels, args.test_fraction
+    )
+    if not args.labeled:
+        train, train_labels = bootstrap_labels(train)
+
+    reference_time, reference = timed(analyze_columns, test, words=False)
+    model = HashingClassifier()
+    fit_time, _ = timed(model.fit, train, train_labels, epochs=args.epochs)
+    model_time, predicted = timed(model.analyze_columns, test, words=False)
+
+    # Sem anotação, a referência é o próprio motor por regras
+    expected = (
+        np.array(test_labels, dtype=object) if args.labeled else reference["sentimento"]
+    )
+    rules_accuracy = np.mean(reference["sentimento"] == expected)
+    model_accuracy = np.mean(predicted["sentimento"] == expected)
+    print(f"Rótulos de treino: {source} | treino: {len(train)} | teste: {len(test)}")
+    print(f"Treino do modelo: {fit_time:.2f}s ({args.epochs} épocas)")
+    print(
+        f"Motor por regras: {len(test) / reference_time:,.0f} docs/s "
+        f"| acurácia {rules_accuracy:.3f}"
+    )
+    print(
+        f"Modelo linear:    {len(test) / model_time:,.0f} docs/s "
+        f"| acurácia {model_accuracy:.3f}"
+    )
+    print(f"Memória dos pesos: {model.weights.nbytes / 1024**2:.1f} MB (fixa)")
+
+
+if __name__ == "__main__":
+    main()
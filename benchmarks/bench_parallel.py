@@ -0,0 +1,48 @@
+"""
+Vazão (docs/s) da análise paralela em processos para 1..N workers,
+com o tamanho de bloco automático
+
+Uso: python -m benchmarks.bench_parallel [--docs 200000] [--workers 1 2 4]
+"""
+
+import argparse
+import os
+import time
+
+from sentiment_analysis import SentimentAnalyzer
+from sentiment_analysis.parallel import auto_chunksize
+from testing import synthetic_corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    counts = args.workers or sorted({1, max(1, cores // 2), cores})
+    analyzer = SentimentAnalyzer()
+    texts = synthetic_corpus(args.docs)
+
+    start = time.perf_counter()
+    reference = [r["sentiment"] for r in analyzer.analyze_batch(texts)]
+    baseline = time.perf_counter() - start
+
+    print(f"Documentos: {args.docs} | núcleos: {cores}")
+    print(f"analyze_batch (1 processo): {args.docs / baseline:,.0f} docs/s")
+    for workers in counts:
+        start = time.perf_counter()
+        labels = [
+            r["sentiment"] for r in analyzer.analyze_parallel(texts, workers=workers)
+        ]
+        elapsed = time.perf_counter() - start
+        print(
+            f"{workers} worker(s), bloco {auto_chunksize(len(texts), workers)}: "
+            f"{args.docs / elapsed:,.0f} docs/s ({baseline / elapsed:.1f}x) | "
+            f"mesma ordem: {labels == reference}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Compara a vazão da varredura com expressões de várias palavras (trie
+disparada pela flag PHRASE) com a varredura só de palavras isoladas
+
+Uso: python -m benchmarks.bench_phrases [--docs 100000]
+"""
+
+import argparse
+import time
+
+from sentiment_analysis import compile_lexicon, dictionaries
+from sentiment_analysis.scanner import scan
+from sentiment_analysis.text_processor import tokenize
+from testing import synthetic_corpus, with_phrases
+
+
+def single_token_lexicon():
+    """Léxico sem expressões (o caminho anterior, só palavras isoladas)"""
+    return compile_lexicon(
+        breakers={w for w in dictionaries.NEGATION_BREAKERS if " " not in w},
+        intensifiers={
+            k: v for k, v in dictionaries.INTENSIFIERS.items() if " " not in k
+        },
+        positive_expressions={},
+        negative_expressions={},
+    )
+
+
+def docs_per_second(lexicon, documents, repeat=3):
+    """Melhor vazão entre as repetições"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for words in documents:
+            scan(words, lexicon)
+        best = min(best, time.perf_counter() - start)
+    return len(documents) / best
+
+
+def phrase_hits(lexicon, documents):
+    """Quantas expressões foram casadas no corpus"""
+    hits = 0
+    for words in documents:
+        result = scan(words, lexicon)
+        hits += sum(" " in w for w in result.positive_words + result.negative_words)
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100_000)
+    args = parser.parse_args()
+
+    plain = [tokenize(t) for t in synthetic_corpus(args.docs)]
+    enriched = [tokenize(t) for t in with_phrases(synthetic_corpus(args.docs))]
+    single = single_token_lexicon()
+    full = compile_lexicon()
+
+    print(f"Documentos: {args.docs} | expressões: {len(full.phrases)}")
+    for name, documents in (
+        ("sem expressões", plain),
+        ("30% com expressões", enriched),
+    ):
+        single_rate = docs_per_second(single, documents)
+        phrase_rate = docs_per_second(full, documents)
+        print(
+            f"Corpus {name}: só palavras {single_rate:,.0f} docs/s | "
+            f"com trie {phrase_rate:,.0f} docs/s "
+            f"({single_rate / phrase_rate:.2f}x) | "
+            f"casadas: {phrase_hits(full, documents)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
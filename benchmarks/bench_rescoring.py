@@ -0,0 +1,102 @@
+"""
+Reanálise do corpus após editar alguns pesos do léxico: tudo de novo
+versus só os documentos com tokens alterados (índice invertido)
+
+Uso: python -m benchmarks.bench_rescoring [--docs 100000] [--edits 3]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from sentiment_analysis import compile_lexicon, dictionaries
+from sentiment_analysis.batch import analyze_columns
+from sentiment_analysis.rescoring import InvertedIndex, rescore_store
+from storage import NewsStore
+from testing import synthetic_corpus
+
+
+def fill_store(store, texts):
+    """Grava os textos como notícias (título) no banco"""
+    store.upsert_news(
+        {
+            "termo_busca": "IA Piauí",
+            "titulo": text,
+            "link": f"https://example.com/{i}",
+            "descricao": "",
+        }
+        for i, text in enumerate(texts)
+    )
+
+
+def analyze_all(store, lexicon):
+    """Caminho antigo: reanalisa todas as notícias do banco"""
+    news = store.news_texts()
+    columns = analyze_columns(list(news["texto_completo"]), lexicon)
+    store.save_analysis(
+        list(
+            zip(
+                news["id"].tolist(),
+                columns["sentimento"].tolist(),
+                columns["confianca"].tolist(),
+                map(", ".join, columns["positivas"]),
+                map(", ".join, columns["negativas"]),
+            )
+        )
+    )
+
+
+def edited_lexicon(edits, seed=7):
+    """Léxico com o peso de algumas palavras positivas alterado"""
+    rng = random.Random(seed)
+    positive = dict(dictionaries.POSITIVE_WORDS)
+    for word in rng.sample(sorted(positive), edits):
+        positive[word] = positive[word] + 0.5
+    return compile_lexicon(positive=positive)
+
+
+def snapshot(store):
+    return store.query_news()[["id", "sentimento", "confianca"]]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--edits", type=int, default=3)
+    args = parser.parse_args()
+
+    old, new = compile_lexicon(), edited_lexicon(args.edits)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = NewsStore(os.path.join(tmp, "noticias.db"))
+        fill_store(store, synthetic_corpus(args.docs))
+        analyze_all(store, old)
+
+        index = InvertedIndex()
+        index_time, _ = timed(index.sync, store)
+        selective_time, ids = timed(rescore_store, store, index, old, new)
+        selective = snapshot(store)
+
+        full_time, _ = timed(analyze_all, store, new)
+        full = snapshot(store)
+        store.close()
+
+    print(f"Documentos: {args.docs} | palavras editadas: {args.edits}")
+    print(f"Construção do índice (uma vez): {index_time:.2f}s")
+    print(f"Reanálise completa:  {full_time:.2f}s")
+    print(
+        f"Reanálise seletiva:  {selective_time:.2f}s "
+        f"({len(ids)} documentos, {full_time / selective_time:.1f}x)"
+    )
+    print(f"Resultados iguais: {selective.equals(full)}")
+
+
+if __name__ == "__main__":
+    main()
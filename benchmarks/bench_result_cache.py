@@ -0,0 +1,56 @@
+"""
+Tempo de análise do corpus sem cache, com o cache frio (primeira
+execução), quente (textos já vistos) e após uma troca de léxico
+
+Uso: python -m benchmarks.bench_result_cache [--docs 100000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from sentiment_analysis import ResultCache, SentimentAnalyzer, compile_lexicon
+from testing import synthetic_corpus
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100_000)
+    args = parser.parse_args()
+
+    texts = synthetic_corpus(args.docs)
+    plain_time, plain = timed(SentimentAnalyzer().analyze_columns, texts)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResultCache(os.path.join(tmp, "analysis.db"))
+        analyzer = SentimentAnalyzer(cache=cache)
+        cold_time, _ = timed(analyzer.analyze_columns, texts)
+        warm_time, warm = timed(analyzer.analyze_columns, texts)
+
+        edited = SentimentAnalyzer(compile_lexicon(positive={"bom": 2.0}), cache=cache)
+        edited_time, _ = timed(edited.analyze_columns, texts)
+        size = os.path.getsize(cache.path) / 2**20
+        cache.close()
+
+    same = (plain["sentimento"] == warm["sentimento"]).all() and (
+        plain["confianca"] == warm["confianca"]
+    ).all()
+    print(f"Documentos: {args.docs}")
+    print(f"Sem cache:                 {plain_time:.2f}s")
+    print(f"Cache frio (grava):        {cold_time:.2f}s")
+    print(
+        f"Cache quente:              {warm_time:.2f}s ({plain_time / warm_time:.1f}x)"
+    )
+    print(f"Léxico alterado (invalida): {edited_time:.2f}s")
+    print(f"Tamanho do cache: {size:.1f} MB | resultados iguais: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Custo por documento dos modos de resultado: details montado na hora (o
+dict antigo), details sob demanda (Details) e só rótulo (mode="label").
+Mede docs/s e alocações retidas por resultado (blocos e bytes)
+
+Uso: python -m benchmarks.bench_result_modes [--docs 50000]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from sentiment_analysis import SentimentAnalyzer
+from testing import synthetic_corpus
+
+
+def eager(analyzer, text):
+    """Comportamento antigo: details materializado num dict a cada texto"""
+    sentiment, confidence, details = analyzer.analyze_sentiment(text)
+    return sentiment, confidence, dict(details)
+
+
+def lazy(analyzer, text):
+    return analyzer.analyze_sentiment(text)
+
+
+def label(analyzer, text):
+    return analyzer.analyze_sentiment(text, mode="label")
+
+
+def measure(func, analyzer, texts):
+    """(docs/s, blocos retidos por documento, bytes retidos por documento)"""
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    start = time.perf_counter()
+    results = [func(analyzer, text) for text in texts]
+    elapsed = time.perf_counter() - start
+    retained_blocks = (sys.getallocatedblocks() - blocks) / len(texts)
+    del results
+
+    gc.collect()
+    tracemalloc.start()
+    results = [func(analyzer, text) for text in texts]
+    retained_bytes = tracemalloc.get_traced_memory()[0] / len(texts)
+    tracemalloc.stop()
+    del results
+    return len(texts) / elapsed, retained_blocks, retained_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=50_000)
+    args = parser.parse_args()
+
+    analyzer = SentimentAnalyzer()
+    texts = synthetic_corpus(args.docs)
+
+    print(f"Documentos: {args.docs}")
+    for name, func in (
+        ("dict montado", eager),
+        ("Details sob demanda", lazy),
+        ('mode="label"', label),
+    ):
+        rate, blocks, size = measure(func, analyzer, texts)
+        print(
+            f"{name:<20} {rate:>9,.0f} docs/s | "
+            f"{blocks:5.1f} blocos e {size:6.0f} bytes retidos por documento"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Compara tempo e pico de memória do parse completo (ET.fromstring) com o
+parser incremental para feeds grandes
+
+Uso: python -m benchmarks.bench_rss_parser [--items 20000] [--limit 5]
+"""
+
+import argparse
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+from collector.rss_parser import iter_feed_items, LXML_AVAILABLE
+from testing import build_rss
+
+
+def full_tree(body, limit):
+    """Estratégia antiga: árvore completa e findall antes do limite"""
+    root = ET.fromstring(body)
+    return [item.findtext("title") for item in root.findall(".//item")[:limit]]
+
+
+def streaming(body, limit, use_lxml):
+    """Parser incremental alimentado em blocos, com parada antecipada"""
+    chunks = (body[i : i + 16384] for i in range(0, len(body), 16384))
+    titles = []
+    for item in iter_feed_items(chunks, use_lxml=use_lxml):
+        if len(titles) >= limit:
+            break
+        titles.append(item["title"])
+    return titles
+
+
+def measure(func, *args):
+    """Retorna (segundos, pico de memória em MB) de uma chamada"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--limit", type=int, default=5)
+    args = parser.parse_args()
+
+    body = build_rss("Inteligência Artificial Piauí", args.items)
+    print(f"Feed: {args.items} itens, {len(body) / 1024 / 1024:.1f} MB")
+
+    cases = [("ET.fromstring + findall", full_tree, (body, args.limit))]
+    cases.append(("incremental (stdlib)", streaming, (body, args.limit, False)))
+    if LXML_AVAILABLE:
+        cases.append(("incremental (lxml)", streaming, (body, args.limit, True)))
+
+    for name, func, func_args in cases:
+        elapsed, peak = measure(func, *func_args)
+        print(f"{name:<26} {elapsed * 1000:8.1f} ms  pico {peak:7.2f} MB")
+
+    # Sem parada antecipada: custo de percorrer o feed inteiro
+    for use_lxml in [False] + ([True] if LXML_AVAILABLE else []):
+        elapsed, peak = measure(streaming, body, args.items, use_lxml)
+        label = "lxml" if use_lxml else "stdlib"
+        print(
+            f"{'feed inteiro (' + label + ')':<26} {elapsed * 1000:8.1f} ms  pico {peak:7.2f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Mede o laço interno da análise em lotes de 100 mil documentos: janela
+de negação + score + contadores separados versus a varredura linear
+
+Uso: python -m benchmarks.bench_scanner [--docs 100000]
+"""
+
+import argparse
+import time
+
+from sentiment_analysis import SentimentAnalyzer
+from sentiment_analysis.lexicon import NEGATION, BREAKER, FLAGS, INTENSIFIER
+from sentiment_analysis.lexicon import POSITIVE, NEGATIVE
+from sentiment_analysis.scanner import scan
+from sentiment_analysis.text_processor import tokenize
+from testing import synthetic_corpus
+
+
+def window_context(words, table):
+    """Estratégia antiga: reexamina as 3 palavras anteriores a cada token"""
+    result = []
+    for i, word in enumerate(words):
+        is_negated = False
+        intensifier = 1.0
+        if i > 0 and words[i - 1] in table:
+            intensifier = table[words[i - 1]][INTENSIFIER]
+        for j in range(max(0, i - 3), i):
+            entry = table.get(words[j])
+            if entry is None:
+                continue
+            if entry[FLAGS] & NEGATION:
+                is_negated = True
+            elif entry[FLAGS] & BREAKER:
+                is_negated = False
+        result.append((word, is_negated, intensifier))
+    return result
+
+
+def legacy_score(lexicon, context):
+    """Estratégia antiga: score e listas de palavras sobre o contexto pronto"""
+    positive_score = 0
+    negative_score = 0
+    positive_words = []
+    negative_words = []
+    for word, is_negated, intensifier in context:
+        entry = lexicon.get(word)
+        if entry is None:
+            continue
+        positive_weight = entry[POSITIVE] * intensifier
+        negative_weight = entry[NEGATIVE] * intensifier
+        if is_negated:
+            if positive_weight > 0:
+                negative_score += positive_weight
+                negative_words.append(f"não_{word}")
+            elif negative_weight > 0:
+                positive_score += negative_weight
+                positive_words.append(f"não_{word}")
+        elif positive_weight > 0:
+            positive_score += positive_weight
+            positive_words.append(f"muito_{word}" if intensifier > 1.0 else word)
+        elif negative_weight > 0:
+            negative_score += negative_weight
+            negative_words.append(f"muito_{word}" if intensifier > 1.0 else word)
+    return positive_score, negative_score, positive_words, negative_words
+
+
+def legacy_pass(analyzer, documents):
+    """Contexto, score e as duas contagens em passadas separadas"""
+    table = analyzer.lexicon.table
+    out = []
+    for words in documents:
+        context = window_context(words, table)
+        scores = legacy_score(analyzer.lexicon, context)
+        negations = sum(1 for _, negated, _ in context if negated)
+        intensifiers = sum(1 for _, _, value in context if value != 1.0)
+        out.append((scores[0], scores[1], negations, intensifiers))
+    return out
+
+
+def fused_pass(analyzer, documents):
+    """Varredura única com score e contadores"""
+    out = []
+    for words in documents:
+        result = scan(words, analyzer.lexicon)
+        out.append(
+            (
+                result.positive_score,
+                result.negative_score,
+                result.negations,
+                result.intensifiers,
+            )
+        )
+    return out
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100_000)
+    args = parser.parse_args()
+
+    analyzer = SentimentAnalyzer()
+    documents = [tokenize(text) for text in synthetic_corpus(args.docs)]
+
+    legacy_time, legacy = timed(legacy_pass, analyzer, documents)
+    fused_time, fused = timed(fused_pass, analyzer, documents)
+
+    print(f"Documentos: {args.docs}")
+    print(f"Janela + passadas separadas: {legacy_time:.2f}s")
+    print(f"Varredura linear fundida:    {fused_time:.2f}s")
+    print(
+        f"Speedup: {legacy_time / fused_time:.1f}x | resultados iguais: {legacy == fused}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Textos longos: analyze_sentiment com o texto inteiro na memória versus
+análise em trechos (sentiment_analysis.streaming), em MB/s e pico de memória
+
+Uso: python -m benchmarks.bench_streaming [--sizes 1 4 16] (MB)
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from sentiment_analysis import SentimentAnalyzer
+from sentiment_analysis.streaming import score_file
+from testing import synthetic_corpus, with_phrases
+
+
+def write_text(path, megabytes):
+    """Grava um texto longo (notícias sintéticas emendadas) com o tamanho pedido"""
+    texts = with_phrases(synthetic_corpus(2000))
+    target = megabytes * 1024**2
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < target:
+            for text in texts:
+                written += f.write(text + "\n")
+
+
+def measure(func, *args):
+    """(segundos, pico de memória em MB, resultado)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        return elapsed, tracemalloc.get_traced_memory()[1] / 1024**2, result
+    finally:
+        tracemalloc.stop()
+
+
+def whole_text(analyzer, path):
+    """Caminho antigo: lê o arquivo inteiro e analisa de uma vez"""
+    with open(path, encoding="utf-8") as f:
+        return analyzer.analyze_sentiment(f.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    analyzer = SentimentAnalyzer()
+    with tempfile.TemporaryDirectory() as tmp:
+        for megabytes in args.sizes:
+            path = os.path.join(tmp, f"texto_{megabytes}.txt")
+            write_text(path, megabytes)
+            size = os.path.getsize(path) / 1024**2
+
+            whole_time, whole_peak, expected = measure(whole_text, analyzer, path)
+            stream_time, stream_peak, result = measure(score_file, path)
+            same = expected[:2] == result[:2]
+
+            print(f"Texto de {size:.1f} MB")
+            print(
+                f"  inteiro:    {size / whole_time:4.1f} MB/s | pico {whole_peak:7.1f} MB"
+            )
+            print(
+                f"  em trechos: {size / stream_time:4.1f} MB/s | pico {stream_peak:7.1f} MB "
+                f"| mesmo resultado: {same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
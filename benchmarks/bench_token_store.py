@@ -0,0 +1,113 @@
+"""
+Reanálise do corpus a partir dos tokens armazenados (ids) versus a
+partir dos textos, e pico de memória da CLI em fluxo por tamanho da entrada
+
+Uso: python -m benchmarks.bench_token_store [--docs 100000]
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+import numpy as np
+
+from sentiment_analysis import compile_lexicon
+from sentiment_analysis.__main__ import main as cli_main
+from sentiment_analysis.batch import analyze_columns
+from sentiment_analysis.text_processor import tokenize
+from sentiment_analysis.token_store import TokenStore
+from testing import synthetic_corpus, with_phrases
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def count_words(texts):
+    """Caminho antigo: tokeniza de novo para contar palavras"""
+    counts = Counter()
+    for text in texts:
+        counts.update(tokenize(text))
+    return counts
+
+
+class _Discard(io.TextIOBase):
+    def write(self, text):
+        return len(text)
+
+
+def cli_peak(path):
+    """Pico de memória (MB) da CLI lendo o JSONL e descartando a saída"""
+    streams = sys.stdout, sys.stderr
+    sys.stdout = sys.stderr = _Discard()
+    tracemalloc.start()
+    try:
+        cli_main([path, "--batch-size", "1000"])
+        return tracemalloc.get_traced_memory()[1] / 1024**2
+    finally:
+        tracemalloc.stop()
+        sys.stdout, sys.stderr = streams
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100_000)
+    args = parser.parse_args()
+
+    texts = with_phrases(synthetic_corpus(args.docs))
+    lexicon = compile_lexicon()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = TokenStore(os.path.join(tmp, "tokens"))
+        ingest_time, _ = timed(store.append_texts, range(len(texts)), texts)
+        size = sum(
+            os.path.getsize(os.path.join(store.root, name))
+            for name in os.listdir(store.root)
+        )
+
+        text_time, from_texts = timed(analyze_columns, texts, lexicon)
+        store_time, from_store = timed(store.analyze, lexicon)
+        equal = all(
+            np.array_equal(from_texts[name], from_store[name])
+            for name in ("sentimento", "confianca", "peso_positivo", "peso_negativo")
+        )
+        words_time, word_counts = timed(count_words, texts)
+        ids_time, id_counts = timed(store.token_counts)
+
+        print(f"Documentos: {args.docs}")
+        print(
+            f"Ingestão (tokenizar + gravar): {ingest_time:.2f}s ({size / 1024**2:.1f} MB)"
+        )
+        print(f"Reanálise pelos textos: {text_time:.2f}s")
+        print(
+            f"Reanálise pelos tokens: {store_time:.2f}s "
+            f"({text_time / store_time:.1f}x, resultados iguais: {equal})"
+        )
+        print(f"Frequência pelos textos: {words_time:.2f}s")
+        print(
+            f"Frequência pelos ids:    {ids_time:.2f}s "
+            f"(iguais: {word_counts == id_counts})"
+        )
+
+        # A memória da CLI não deve crescer com o tamanho da entrada
+        for factor in (1, 4):
+            path = os.path.join(tmp, f"corpus_{factor}.jsonl")
+            with open(path, "w", encoding="utf-8") as f:
+                for _ in range(factor):
+                    for i, text in enumerate(texts):
+                        f.write(json.dumps({"id": i, "text": text}, ensure_ascii=False))
+                        f.write("\n")
+            peak = cli_peak(path)
+            print(f"CLI com {factor * args.docs} documentos: pico de {peak:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Microbenchmark do tokenizador: preprocess_text (vários re.sub) versus
+tokenize (tabela de tradução + um padrão compilado), em tokens/s
+
+Uso: python -m benchmarks.bench_tokenizer [--docs 20000]
+"""
+
+import argparse
+import time
+
+from sentiment_analysis.text_processor import preprocess_text, tokenize
+from testing import synthetic_corpus
+
+
+def throughput(func, texts):
+    """Retorna (tokens/s, total de tokens)"""
+    start = time.perf_counter()
+    total = sum(len(func(text)) for text in texts)
+    return total / (time.perf_counter() - start), total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=20_000)
+    args = parser.parse_args()
+
+    texts = synthetic_corpus(args.docs)
+    old_rate, old_total = throughput(preprocess_text, texts)
+    new_rate, new_total = throughput(tokenize, texts)
+    equal = all(preprocess_text(t) == tokenize(t) for t in texts)
+
+    print(f"Documentos: {args.docs} | tokens: {new_total}")
+    print(f"preprocess_text: {old_rate:,.0f} tokens/s")
+    print(f"tokenize:        {new_rate:,.0f} tokens/s ({new_rate / old_rate:.1f}x)")
+    print(f"Mesma sequência de tokens: {equal and old_total == new_total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Infraestrutura de coleta de notícias (rede, limitação de taxa, cache, parse,
+índice de notícias já vistas e detecção de quase-duplicatas)
+"""
+
+from .rate_limit import TokenBucket
+from .http_cache import FeedCache
+from .rss_parser import iter_feed_items, LXML_AVAILABLE
+from .seen_index import SeenIndex, BloomFilter, canonical_key
+from .near_duplicates import NearDuplicateIndex, item_signature
+from .transport import (
+    HttpTransport,
+    CircuitBreaker,
+    TransportError,
+    CircuitOpenError,
+    backoff_delay,
+)
+
+__all__ = [
+    "TokenBucket",
+    "FeedCache",
+    "iter_feed_items",
+    "LXML_AVAILABLE",
+    "SeenIndex",
+    "BloomFilter",
+    "canonical_key",
+    "NearDuplicateIndex",
+    "item_signature",
+    "HttpTransport",
+    "CircuitBreaker",
+    "TransportError",
+    "CircuitOpenError",
+    "backoff_delay",
+]
@@ -0,0 +1,86 @@
+"""
+Cache em disco de respostas de feeds com validação condicional (ETag/Last-Modified)
+"""
+
+import hashlib
+import json
+import os
+import time
+
+
+class FeedCache:
+    """Guarda validadores e itens já extraídos de cada URL de feed
+
+    Guardar os itens (e não apenas o XML) evita repetir o parse e a limpeza
+    quando o feed não mudou. Como o parse para no limite de itens por
+    termo, cada limite tem a sua própria entrada.
+    """
+
+    def __init__(self, cache_dir="data/cache/http", ttl_hours=1):
+        """Inicializa o cache no diretório informado com TTL em horas"""
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_hours * 3600
+
+    def _path(self, url, limit=None):
+        key = hashlib.sha256(f"{url}\n{limit}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, url, limit=None):
+        """Retorna a entrada do cache da URL (e limite de itens) ou None"""
+        try:
+            with open(self._path(url, limit), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("url") != url or entry.get("limit") != limit:
+            return None
+        return entry
+
+    def is_fresh(self, entry):
+        """Indica se a entrada ainda está dentro do TTL"""
+        return time.time() - entry["fetched_at"] < self.ttl_seconds
+
+    @staticmethod
+    def conditional_headers(entry):
+        """Monta os headers If-None-Match/If-Modified-Since da entrada"""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url, response, items, limit=None):
+        """Grava validadores e itens extraídos de uma resposta 200"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = {
+            "url": url,
+            "limit": limit,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "items": items,
+        }
+        self._write_entry(entry)
+        return entry
+
+    def touch(self, url, entry):
+        """Renova o TTL de uma entrada confirmada por um 304"""
+        entry["fetched_at"] = time.time()
+        self._write_entry(entry)
+
+    def _write_entry(self, entry):
+        # Escrita atômica: grava em arquivo temporário e renomeia
+        path = self._path(entry["url"], entry.get("limit"))
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def clear(self):
+        """Remove todas as entradas do cache"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            os.remove(os.path.join(self.cache_dir, name))
@@ -0,0 +1,143 @@
+"""
+Detecção de quase-duplicatas com MinHash e LSH por bandas
+
+Notícias sindicadas chegam com títulos levemente diferentes entre veículos.
+Cada item recebe uma assinatura MinHash calculada sobre shingles de
+palavras do título e da descrição. A assinatura é dividida em bandas:
+itens que coincidem em pelo menos uma banda viram candidatos, e só eles
+têm a similaridade de Jaccard estimada. Assim cada item novo é comparado
+com poucos candidatos, não com todo o histórico.
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+
+# Sufixo " - Veículo" que o Google News acrescenta aos títulos
+SOURCE_SUFFIX_RE = re.compile(r"\s+-\s+[^-]+$")
+WORD_RE = re.compile(r"\w+")
+
+MERSENNE_PRIME = (1 << 61) - 1
+NUM_PERMUTATIONS = 64
+
+# Coeficientes fixos para que as assinaturas sejam estáveis entre execuções
+_rng = random.Random(1729)
+PERMUTATIONS = [
+    (_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+
+def shingles(text, size=2):
+    """Conjunto de shingles de palavras do texto"""
+    words = WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return set(words)
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash(shingle_set):
+    """Calcula a assinatura MinHash de um conjunto de shingles"""
+    if not shingle_set:
+        return (MERSENNE_PRIME,) * NUM_PERMUTATIONS
+
+    hashes = [
+        int.from_bytes(
+            hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little"
+        )
+        for s in shingle_set
+    ]
+    return tuple(
+        min((a * h + b) % MERSENNE_PRIME for h in hashes) for a, b in PERMUTATIONS
+    )
+
+
+def item_signature(item):
+    """Assinatura de uma notícia (título sem o veículo + descrição)"""
+    # Células vazias de CSV chegam como NaN (float) nas linhas do histórico
+    title, description = (
+        value if isinstance(value, str) else ""
+        for value in (item.get("titulo"), item.get("descricao"))
+    )
+    title = SOURCE_SUFFIX_RE.sub("", title)
+    description = SOURCE_SUFFIX_RE.sub("", description)
+    return minhash(shingles(f"{title} {description}"))
+
+
+def estimated_jaccard(sig_a, sig_b):
+    """Estima a similaridade de Jaccard pela fração de posições iguais"""
+    return sum(a == b for a, b in zip(sig_a, sig_b)) / len(sig_a)
+
+
+class NearDuplicateIndex:
+    """Agrupa assinaturas similares em clusters, com persistência opcional"""
+
+    def __init__(self, path=None, threshold=0.6, bands=16):
+        """Inicializa o índice; com path, carrega e grava as assinaturas em JSON Lines"""
+        if NUM_PERMUTATIONS % bands:
+            raise ValueError("O número de bandas deve dividir o de permutações")
+
+        self.path = path
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = NUM_PERMUTATIONS // bands
+        self._tables = [{} for _ in range(bands)]
+        self._signatures = []
+        self._clusters = []
+        self._pending = []
+
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    record = json.loads(line)
+                    self._insert(tuple(record["sig"]), record["cluster"])
+
+    def _band_keys(self, signature):
+        return [
+            signature[i * self.rows : (i + 1) * self.rows] for i in range(self.bands)
+        ]
+
+    def _insert(self, signature, cluster_id):
+        position = len(self._signatures)
+        self._signatures.append(signature)
+        self._clusters.append(cluster_id)
+        for table, key in zip(self._tables, self._band_keys(signature)):
+            table.setdefault(key, []).append(position)
+
+    def find(self, signature):
+        """Retorna o cluster do item mais similar acima do limiar, ou None"""
+        candidates = set()
+        for table, key in zip(self._tables, self._band_keys(signature)):
+            candidates.update(table.get(key, ()))
+
+        best, best_score = None, self.threshold
+        for position in candidates:
+            score = estimated_jaccard(signature, self._signatures[position])
+            if score >= best_score:
+                best, best_score = position, score
+
+        return self._clusters[best] if best is not None else None
+
+    def add(self, signature):
+        """Insere a assinatura e retorna o id do seu cluster"""
+        cluster_id = self.find(signature)
+        if cluster_id is None:
+            digest = hashlib.blake2b(repr(signature).encode(), digest_size=8)
+            cluster_id = digest.hexdigest()
+
+        self._insert(signature, cluster_id)
+        self._pending.append({"sig": list(signature), "cluster": cluster_id})
+        return cluster_id
+
+    def save(self):
+        """Anexa os novos registros ao arquivo do índice"""
+        if not self.path or not self._pending:
+            return
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for record in self._pending:
+                f.write(json.dumps(record) + "\n")
+        self._pending = []
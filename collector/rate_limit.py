@@ -0,0 +1,38 @@
+"""
+Limitação de taxa de requisições por host
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Balde de fichas thread-safe: permite rajadas curtas e taxa média fixa"""
+
+    def __init__(self, rate, capacity=1):
+        """Inicializa com a taxa (fichas por segundo) e a capacidade do balde"""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        """Consome uma ficha e retorna quanto tempo esperar por ela"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+            # Saldo negativo representa fichas já prometidas a outras threads
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Bloqueia até que uma requisição seja permitida"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
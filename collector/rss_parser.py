@@ -0,0 +1,74 @@
+"""
+Parser RSS incremental com parada antecipada
+
+Usa lxml quando disponível e recorre ao xml.etree da biblioteca padrão
+caso contrário. Os itens são processados à medida que os bytes chegam e
+descartados logo em seguida, sem montar a árvore completa do feed.
+"""
+
+import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree as lxml_etree
+
+    LXML_AVAILABLE = True
+except ImportError:
+    lxml_etree = None
+    LXML_AVAILABLE = False
+
+ITEM_FIELDS = ("title", "description", "link", "pubDate", "guid")
+
+
+def _make_parser(use_lxml):
+    if use_lxml:
+        return lxml_etree.XMLPullParser(events=("end",), tag="item")
+    return ET.XMLPullParser(events=("end",))
+
+
+def _release(element, use_lxml):
+    """Libera a memória de um item já processado"""
+    element.clear()
+    if use_lxml:
+        # Remove irmãos anteriores que o lxml ainda mantém na árvore
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+def _item_fields(element):
+    # Uma única passada pelos filhos é mais barata que um findtext por campo
+    fields = dict.fromkeys(ITEM_FIELDS, "")
+    for child in element:
+        if child.tag in fields and fields[child.tag] == "":
+            fields[child.tag] = child.text or ""
+    return fields
+
+
+def iter_feed_items(chunks, use_lxml=None):
+    """Gera os campos de cada <item> do feed a partir de blocos de bytes"""
+    if isinstance(chunks, (bytes, str)):
+        chunks = [chunks]
+    if use_lxml is None:
+        use_lxml = LXML_AVAILABLE
+
+    parser = _make_parser(use_lxml)
+
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                if element.tag != "item":
+                    continue
+                yield _item_fields(element)
+                _release(element, use_lxml)
+
+        parser.close()
+        for _, element in parser.read_events():
+            if element.tag == "item":
+                yield _item_fields(element)
+    except Exception as e:
+        # Normaliza erros do lxml para o mesmo tipo da biblioteca padrão
+        if use_lxml and isinstance(e, lxml_etree.XMLSyntaxError):
+            raise ET.ParseError(str(e)) from e
+        raise
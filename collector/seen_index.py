@@ -0,0 +1,185 @@
+"""
+Índice persistente de notícias já coletadas
+
+Um filtro de Bloom em memória responde rapidamente "nunca vista" para a
+maioria dos itens novos; só quando o filtro indica possível repetição o
+índice completo (chave -> termos) é carregado do disco para confirmar.
+"""
+
+import hashlib
+import json
+import math
+import os
+import struct
+from urllib.parse import urlsplit, urlunsplit
+
+BLOOM_MAGIC = b"BLM1"
+
+
+def _text_field(item, name):
+    """Campo de texto do item; células vazias de CSV (NaN) viram ''"""
+    value = item.get(name)
+    return value.strip() if isinstance(value, str) else ""
+
+
+def canonical_key(item):
+    """Retorna a chave canônica da notícia (GUID ou link normalizado)"""
+    guid = _text_field(item, "guid")
+    if guid:
+        return guid
+
+    link = _text_field(item, "link")
+    if not link:
+        return f"titulo:{_text_field(item, 'titulo').lower()}"
+
+    # Ignora query string e fragmento (ex.: ?oc=5 do Google News)
+    parts = urlsplit(link)
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, "", ""))
+
+
+class BloomFilter:
+    """Filtro de Bloom com double hashing sobre blake2b"""
+
+    def __init__(self, capacity=10000, error_rate=0.001):
+        """Dimensiona o filtro para a capacidade e taxa de falso positivo"""
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key):
+        """Adiciona uma chave ao filtro"""
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(
+            self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+    def to_bytes(self):
+        """Serializa o filtro (cabeçalho + bits)"""
+        header = struct.pack(
+            "<4sQdQQ",
+            BLOOM_MAGIC,
+            self.capacity,
+            self.error_rate,
+            self.num_hashes,
+            self.count,
+        )
+        return header + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Reconstrói um filtro serializado por to_bytes"""
+        header_size = struct.calcsize("<4sQdQQ")
+        magic, capacity, error_rate, num_hashes, count = struct.unpack(
+            "<4sQdQQ", data[:header_size]
+        )
+        if magic != BLOOM_MAGIC:
+            raise ValueError("Arquivo de filtro de Bloom inválido")
+
+        bloom = cls(capacity, error_rate)
+        bloom.num_hashes = num_hashes
+        bloom.bits = bytearray(data[header_size:])
+        bloom.count = count
+        return bloom
+
+
+class SeenIndex:
+    """Índice persistente de chaves de notícias e dos termos que as encontraram"""
+
+    def __init__(self, index_dir="data/index", capacity=10000):
+        """Carrega o filtro de Bloom do disco (o índice completo é carregado sob demanda)"""
+        self.index_dir = index_dir
+        self.keys_path = os.path.join(index_dir, "seen.jsonl")
+        self.bloom_path = os.path.join(index_dir, "seen.bloom")
+        self._terms = None
+        self._pending = []
+
+        try:
+            with open(self.bloom_path, "rb") as f:
+                self.bloom = BloomFilter.from_bytes(f.read())
+        except (OSError, ValueError):
+            self.bloom = BloomFilter(capacity)
+            if os.path.exists(self.keys_path):
+                self._rebuild_bloom(capacity)
+
+    def _load_terms(self):
+        """Carrega o índice completo do disco (log append-only, termos acumulados)"""
+        if self._terms is None:
+            self._terms = {}
+            if os.path.exists(self.keys_path):
+                with open(self.keys_path, encoding="utf-8") as f:
+                    for line in f:
+                        record = json.loads(line)
+                        terms = self._terms.setdefault(record["key"], [])
+                        terms.extend(t for t in record["termos"] if t not in terms)
+
+            # Registros ainda não gravados também fazem parte do índice
+            for record in self._pending:
+                terms = self._terms.setdefault(record["key"], [])
+                terms.extend(t for t in record["termos"] if t not in terms)
+        return self._terms
+
+    def _rebuild_bloom(self, capacity):
+        """Recria o filtro com capacidade suficiente para todas as chaves"""
+        terms = self._load_terms()
+        self.bloom = BloomFilter(max(capacity, len(terms) * 2))
+        for key in terms:
+            self.bloom.add(key)
+
+    def __contains__(self, key):
+        # Negativo do Bloom é definitivo; positivo precisa de confirmação
+        if key not in self.bloom:
+            return False
+        return key in self._load_terms()
+
+    def __len__(self):
+        return len(self._load_terms())
+
+    def terms_for(self, key):
+        """Retorna os termos registrados para a chave"""
+        return list(self._load_terms().get(key, []))
+
+    def add(self, key, terms):
+        """Registra a chave com seus termos; retorna os termos que eram novos"""
+        known = self._load_terms() if key in self else None
+        if known is None:
+            self.bloom.add(key)
+            if self._terms is not None:
+                self._terms[key] = list(terms)
+            self._pending.append({"key": key, "termos": list(terms)})
+            if self.bloom.count > self.bloom.capacity:
+                self._rebuild_bloom(self.bloom.capacity * 2)
+            return list(terms)
+
+        new_terms = [t for t in terms if t not in known[key]]
+        if new_terms:
+            known[key].extend(new_terms)
+            self._pending.append({"key": key, "termos": new_terms})
+        return new_terms
+
+    def save(self):
+        """Anexa as alterações pendentes ao log e grava o filtro de Bloom"""
+        os.makedirs(self.index_dir, exist_ok=True)
+
+        if self._pending:
+            with open(self.keys_path, "a", encoding="utf-8") as f:
+                for record in self._pending:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._pending = []
+
+        tmp_path = f"{self.bloom_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self.bloom.to_bytes())
+        os.replace(tmp_path, self.bloom_path)
@@ -0,0 +1,168 @@
+"""
+Camada de transporte HTTP compartilhada pela coleta
+
+Reúne pool de conexões keep-alive, limitação de taxa por host,
+backoff exponencial com jitter e circuit breaker por feed.
+"""
+
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .rate_limit import TokenBucket
+
+
+class TransportError(Exception):
+    """Falha definitiva ao buscar uma URL"""
+
+
+class CircuitOpenError(TransportError):
+    """O circuito do feed está aberto e a requisição não foi feita"""
+
+
+def backoff_delay(attempt, base=0.5, cap=10.0):
+    """Calcula espera com backoff exponencial e jitter completo"""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def is_client_error(response):
+    """Indica uma resposta 4xx definitiva (429 ainda pode ser retentada)"""
+    if response is None:
+        return False
+    return 400 <= response.status_code < 500 and response.status_code != 429
+
+
+class CircuitBreaker:
+    """Interrompe requisições a um feed após falhas consecutivas"""
+
+    def __init__(self, failure_threshold=3, reset_timeout=300):
+        """Inicializa com o limite de falhas e o tempo de circuito aberto"""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """Retorna 'fechado', 'aberto' ou 'meio_aberto'"""
+        if self.opened_at is None:
+            return "fechado"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "meio_aberto"
+        return "aberto"
+
+    def allow(self):
+        """Indica se uma nova tentativa pode ser feita"""
+        with self._lock:
+            return self.state != "aberto"
+
+    def record_success(self):
+        """Fecha o circuito após uma resposta válida"""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        """Registra uma falha e abre o circuito ao atingir o limite"""
+        with self._lock:
+            self.failures += 1
+            # Em meio aberto, uma única falha reabre o circuito
+            if self.failures >= self.failure_threshold or self.opened_at is not None:
+                self.opened_at = time.monotonic()
+
+
+class HttpTransport:
+    """Cliente HTTP com conexões reaproveitadas e proteção contra feeds instáveis"""
+
+    def __init__(
+        self,
+        pool_size=4,
+        min_interval=1.0,
+        timeout=15,
+        headers=None,
+        failure_threshold=3,
+        reset_timeout=300,
+    ):
+        """Configura a sessão, o pool de conexões e os limitadores"""
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.rate = 1.0 / min_interval if min_interval > 0 else float("inf")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+        self._buckets = {}
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, url):
+        """Retorna o limitador de taxa do host da URL"""
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.pool_size)
+            return self._buckets[host]
+
+    def breaker_for(self, url):
+        """Retorna o circuit breaker do feed"""
+        with self._lock:
+            if url not in self._breakers:
+                self._breakers[url] = CircuitBreaker(
+                    self.failure_threshold, self.reset_timeout
+                )
+            return self._breakers[url]
+
+    def get(self, url, max_retries=3, headers=None, stream=False):
+        """Busca a URL com retentativas, respeitando taxa e circuit breaker
+
+        Com stream=True o corpo é lido sob demanda (iter_content) e quem
+        chama deve fechar a resposta.
+        """
+        breaker = self.breaker_for(url)
+        bucket = self.bucket_for(url)
+        last_error = None
+
+        for attempt in range(max_retries):
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuito aberto para {url}")
+
+            bucket.acquire()
+            response = None
+            try:
+                response = self.session.get(
+                    url, headers=headers, timeout=self.timeout, stream=stream
+                )
+                response.raise_for_status()
+            except requests.RequestException as e:
+                # Libera a conexão de uma resposta em stream antes de tentar de novo
+                if response is not None:
+                    response.close()
+                # Erro do cliente (exceto 429) não melhora com retentativa
+                # nem indica feed instável
+                if is_client_error(response):
+                    raise TransportError(f"Falha ao buscar {url}: {e}") from e
+                breaker.record_failure()
+                last_error = e
+                if attempt < max_retries - 1:
+                    time.sleep(backoff_delay(attempt))
+                continue
+
+            breaker.record_success()
+            return response
+
+        raise TransportError(f"Falha ao buscar {url}: {last_error}")
+
+    def close(self):
+        """Fecha as conexões do pool"""
+        self.session.close()
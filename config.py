@@ -4,6 +4,9 @@
 MAX_NOTICIAS_POR_TERMO = 5
 INTERVALO_ENTRE_REQUISICOES = 1  # segundos
 TIMEOUT_REQUISICAO = 15  # segundos
+MAX_CONEXOES_SIMULTANEAS = 4  # tamanho do pool e rajada máxima por host
+FALHAS_PARA_ABRIR_CIRCUITO = 3
+TEMPO_CIRCUITO_ABERTO = 300  # segundos
 
 # Configurações de análise de sentimento
 CONFIANCA_MINIMA_PADRAO = 0.0
@@ -24,5 +27,13 @@ TERMOS_BUSCA = [
     "SoberanIA Piauí",
 ]
 
+# Banco de notícias (fonte de verdade; CSV/JSON são exportações)
+CAMINHO_BANCO = "data/noticias.db"
+CAMINHO_CSV = "data/noticias.csv"
+SALVAR_PARQUET = True  # requer pyarrow; ignorado se não instalado
+CAMINHO_PARQUET = "data/parquet"
+SALVAR_TOKENS = True  # tokens das notícias como ids (reanálise sem tokenizar)
+CAMINHO_TOKENS = "data/tokens"
+
 # Configurações de cache
-CACHE_EXPIRY_HOURS = 1
+CACHE_EXPIRY_HOURS = 1  # TTL do cache HTTP dos feeds (data/cache/http)
@@ -11,7 +11,8 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Importações dos módulos criados
 from dashboard.config import PAGE_CONFIG, CUSTOM_CSS
-from dashboard.data_utils import load_data, apply_filters
+from dashboard.data_utils import load_data, apply_filters, get_store, sql_filters
+from dashboard.data_utils import get_date_bounds, selected_period
 from dashboard.sentiment import analyze_sentiments
 from dashboard.components.sidebar import render_sidebar
 from dashboard.components.interface import (
@@ -40,22 +41,27 @@ def main():
     # Header
     render_header()
 
-    # Carrega e analisa dados
-    df = load_data()
+    # Carrega e analisa dados (no Parquet, só as partições do período)
+    period = selected_period()
+    df = load_data(period)
+    date_bounds = get_date_bounds()
 
     if df.empty:
-        st.warning(
-            "⚠️ Nenhum dado encontrado. Clique em 'Coletar Novas Notícias' para começar."
-        )
+        if period:
+            st.info("Nenhuma notícia no período selecionado.")
+        else:
+            st.warning(
+                "⚠️ Nenhum dado encontrado. Clique em 'Coletar Novas Notícias' para começar."
+            )
         # Renderiza sidebar mesmo sem dados para permitir coleta
-        render_sidebar(df, df)
+        render_sidebar(df, df, date_bounds)
         return
 
     # Analisa sentimentos
     df_analyzed = analyze_sentiments(df)
 
     # Renderiza sidebar e obtém filtros
-    filters = render_sidebar(df, df_analyzed)
+    filters = render_sidebar(df, df_analyzed, date_bounds)
 
     # Aplica filtros
     df_filtered = apply_filters(
@@ -66,8 +72,21 @@ def main():
         filters["min_confidence"],
     )
 
-    # Métricas principais
-    render_metrics(df_filtered)
+    # Métricas principais (agregadas em SQL quando há banco)
+    store = get_store()
+    sentiment_counts = None
+    if store is not None and "id" in df_filtered.columns:
+        sentiment_counts = store.count_by(
+            "sentimento",
+            **sql_filters(
+                filters["sentimento"],
+                filters["termo"],
+                filters["data"],
+                filters["min_confidence"],
+                df_analyzed,
+            ),
+        )
+    render_metrics(df_filtered, sentiment_counts)
 
     # Visualizações principais
     render_main_visualizations(df_filtered, charts)
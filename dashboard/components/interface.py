@@ -8,6 +8,8 @@ desenvolvidos com assistência de IA para acelerar a prototipagem.
 import streamlit as st
 import pandas as pd
 
+from ..data_utils import prepare_dates
+
 
 def render_header():
     """Renderiza o cabeçalho do dashboard"""
@@ -22,25 +24,32 @@ def render_header():
     )
 
 
-def render_metrics(df_filtered):
-    """Renderiza as métricas principais"""
+def render_metrics(df_filtered, sentiment_counts=None):
+    """Renderiza as métricas principais (contagens podem vir agregadas do banco)"""
+    if sentiment_counts is None:
+        sentiment_counts = df_filtered["sentimento"].value_counts().to_dict()
+
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
         st.metric("📰 Total de Notícias", len(df_filtered))
 
     with col2:
-        positivas = len(df_filtered[df_filtered["sentimento"] == "positivo"])
+        positivas = sentiment_counts.get("positivo", 0)
         st.metric("😊 Notícias Positivas", positivas)
 
     with col3:
-        negativas = len(df_filtered[df_filtered["sentimento"] == "negativo"])
+        negativas = sentiment_counts.get("negativo", 0)
         st.metric("😟 Notícias Negativas", negativas)
 
     with col4:
-        neutras = len(df_filtered[df_filtered["sentimento"] == "neutro"])
+        neutras = sentiment_counts.get("neutro", 0)
         st.metric("😐 Notícias Neutras", neutras)
 
+    # Quase-duplicatas agrupadas na coleta contam como uma única história
+    if "cluster_id" in df_filtered.columns and df_filtered["cluster_id"].notna().any():
+        st.caption(f"📚 Histórias únicas: {df_filtered['cluster_id'].nunique()}")
+
 
 def render_main_visualizations(df_filtered, charts):
     """Renderiza as visualizações principais"""
@@ -96,15 +105,17 @@ def render_data_table(df_filtered, show_confidence):
             "💡 **Dica:** A coluna 'Confiança' mostra o quão certeza o sistema tem da classificação (0% = incerto, 100% = muito certeza)"
         )
 
-    # Preparar dados para exibição
-    display_df = df_filtered.copy()
-    display_df["data_publicacao"] = pd.to_datetime(
-        display_df["data_publicacao"]
-    ).dt.strftime("%d/%m/%Y %H:%M")
-
-    # Truncar títulos muito longos para melhor visualização
-    display_df["titulo_truncado"] = display_df["titulo"].apply(
-        lambda x: x[:80] + "..." if len(x) > 80 else x
+    # Preparar dados para exibição (só as colunas da tabela, sem copiar o frame)
+    display_df = df_filtered[
+        ["titulo", "link", "sentimento", "confianca", "termo_busca"]
+    ].assign(
+        data_publicacao=prepare_dates(df_filtered)["data_publicacao_dt"].dt.strftime(
+            "%d/%m/%Y %H:%M"
+        ),
+        # Truncar títulos muito longos para melhor visualização
+        titulo_truncado=df_filtered["titulo"].apply(
+            lambda x: x[:80] + "..." if len(x) > 80 else x
+        ),
     )
 
     columns_to_show = [
@@ -175,12 +186,13 @@ def render_detailed_statistics(df_filtered):
         with col1:
             st.write("**Distribuição por Termo de Busca:**")
             term_counts = df_filtered["termo_busca"].value_counts()
+            term_counts = term_counts[term_counts > 0]
             st.bar_chart(term_counts)
 
         with col2:
             st.write("**Confiança Média por Sentimento:**")
             confidence_stats = (
-                df_filtered.groupby("sentimento")["confianca"]
+                df_filtered.groupby("sentimento", observed=True)["confianca"]
                 .agg(["mean", "count"])
                 .round(3)
             )
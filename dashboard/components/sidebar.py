@@ -11,45 +11,8 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from news_collector import NewsCollector
-
-
-def get_date_range_local(df):
-    """Obtém intervalo de datas para os filtros (versão local)"""
-    try:
-        import pandas as pd
-        from datetime import datetime, timedelta
-
-        # Tenta usar data de publicação primeiro
-        df["data_publicacao_dt"] = pd.to_datetime(
-            df["data_publicacao"], errors="coerce"
-        )
-
-        # Filtra datas válidas
-        hoje = datetime.now()
-        um_ano_atras = hoje - timedelta(days=365)
-        um_mes_no_futuro = hoje + timedelta(days=30)
-
-        datas_validas = df[
-            (df["data_publicacao_dt"] >= um_ano_atras)
-            & (df["data_publicacao_dt"] <= um_mes_no_futuro)
-            & df["data_publicacao_dt"].notna()
-        ]
-
-        if not datas_validas.empty:
-            data_min = datas_validas["data_publicacao_dt"].min().date()
-            data_max = datas_validas["data_publicacao_dt"].max().date()
-        else:
-            # Fallback para data de coleta
-            df["data_coleta_dt"] = pd.to_datetime(df["data_coleta"])
-            data_min = df["data_coleta_dt"].min().date()
-            data_max = df["data_coleta_dt"].max().date()
-
-        return data_min, data_max
-
-    except Exception:
-        # Fallback para hoje
-        hoje = datetime.now().date()
-        return hoje, hoje
+from ..config import PERIOD_KEY
+from ..data_utils import get_date_range
 
 
 def render_data_collection_controls():
@@ -60,10 +23,13 @@ def render_data_collection_controls():
     if st.button("🔄 Coletar Novas Notícias"):
         with st.spinner("Coletando notícias..."):
             collector = NewsCollector()
-            news_data = collector.collect_all_news(max_per_term=4)
+            news_data = collector.collect_all_news()
 
             if news_data:
-                collector.save_to_csv(news_data)
+                collector.ingest(news_data)
+                # Recarrega banco e dados na próxima execução
+                st.cache_data.clear()
+                st.cache_resource.clear()
                 st.success(f"✅ {len(news_data)} notícias coletadas!")
                 st.rerun()
             else:
@@ -85,8 +51,12 @@ def render_download_controls(df_analyzed):
         st.markdown("---")
 
 
-def render_filters(df, df_analyzed):
-    """Renderiza todos os filtros da sidebar"""
+def render_filters(df, df_analyzed, date_bounds=None):
+    """Renderiza todos os filtros da sidebar
+
+    date_bounds: limites do período vindos da fonte, quando df pode ser só
+    o período já selecionado (Parquet).
+    """
     st.subheader("🔍 Filtros")
 
     # Filtro por sentimento
@@ -108,13 +78,14 @@ def render_filters(df, df_analyzed):
     min_confidence = st.slider("Confiança mínima", 0.0, 1.0, 0.0, 0.1)
 
     # Filtro por data
-    if not df.empty:
-        data_min, data_max = get_date_range_local(df)
+    if date_bounds or not df.empty:
+        data_min, data_max = date_bounds or get_date_range(df)
         filtro_data = st.date_input(
             "Filtrar por período:",
             value=(data_min, data_max),
             min_value=data_min,
             max_value=data_max,
+            key=PERIOD_KEY,
         )
     else:
         filtro_data = ()
@@ -128,7 +99,7 @@ def render_filters(df, df_analyzed):
     }
 
 
-def render_sidebar(df, df_analyzed):
+def render_sidebar(df, df_analyzed, date_bounds=None):
     """Renderiza toda a sidebar"""
     with st.sidebar:
         render_data_collection_controls()
@@ -136,6 +107,6 @@ def render_sidebar(df, df_analyzed):
         if not df_analyzed.empty:
             render_download_controls(df_analyzed)
 
-        filters = render_filters(df, df_analyzed)
+        filters = render_filters(df, df_analyzed, date_bounds)
 
     return filters
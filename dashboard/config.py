@@ -59,5 +59,68 @@ WORDCLOUD_CONFIG = {
     "min_font_size": 10,
 }
 
+# Banco de notícias gerado pelo coletor
+DATABASE_PATH = "data/noticias.db"
+
+# Conjunto Parquet particionado (alternativa ao banco, requer pyarrow)
+PARQUET_PATH = "data/parquet"
+
+# CSV legado exportado pelo coletor
+CSV_PATH = "data/noticias.csv"
+
+# Ordem das fontes de dados: a primeira que existir é usada. O banco vem
+# primeiro porque guarda as análises e executa os filtros em SQL; com
+# "parquet" à frente, o dashboard lê do Parquet só as partições do período
+# selecionado (migre o histórico antes com python -m storage)
+DATA_SOURCES = ["sqlite", "parquet", "csv"]
+
+# Chave do filtro de período na sessão (lida antes de carregar os dados)
+PERIOD_KEY = "filtro_periodo"
+
+# Colunas de data lidas do Parquet para os limites do filtro de período
+PERIOD_COLUMNS = ["data_publicacao", "timestamp_publicacao", "data_coleta"]
+
+# Cache persistente de resultados da análise (chave: texto + versão do léxico)
+RESULT_CACHE_PATH = "data/cache/analysis.db"
+RESULT_CACHE_MAX_ENTRIES = 200_000
+
+# Léxico externo recarregado a quente (JSON; ausente: dicionários do pacote)
+LEXICON_PATH = "data/lexicon.json"
+LEXICON_POLL_SECONDS = 5
+
+# Colunas lidas pelo dashboard (as demais ficam no disco)
+DASHBOARD_COLUMNS = [
+    "termo_busca",
+    "termos_busca",
+    "titulo",
+    "link",
+    "descricao",
+    "data_publicacao",
+    "timestamp_publicacao",
+    "data_coleta",
+    "cluster_id",
+]
+
+# Esquema tipado do DataFrame em memória
+CATEGORY_COLUMNS = ["termo_busca", "sentimento"]
+FLOAT32_COLUMNS = ["confianca"]
+# Strings compactas (Arrow) quando pyarrow está disponível
+TEXT_COLUMNS = [
+    "titulo",
+    "link",
+    "descricao",
+    "termos_busca",
+    "palavras_positivas",
+    "palavras_negativas",
+    "cluster_id",
+]
+# Substituídas por data_publicacao_dt, data_coleta_dt e full_text()
+RAW_COLUMNS = [
+    "texto_completo",
+    "data_publicacao",
+    "timestamp_publicacao",
+    "data_coleta",
+]
+
 # Configurações de validação de data
 DATE_VALIDATION = {"days_back": 365, "days_forward": 30}
@@ -6,29 +6,156 @@ import pandas as pd
 import streamlit as st
 from datetime import datetime, timedelta
 import os
-from .config import DATE_VALIDATION
+import sys
+from .config import DATE_VALIDATION, DATABASE_PATH, PARQUET_PATH, DASHBOARD_COLUMNS
+from .config import CSV_PATH, DATA_SOURCES, PERIOD_KEY, PERIOD_COLUMNS
+from .config import CATEGORY_COLUMNS, FLOAT32_COLUMNS, TEXT_COLUMNS, RAW_COLUMNS
+
+# Adiciona path para importações
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from storage import NewsStore, PARQUET_AVAILABLE
+from storage.sqlite_store import TERMS_SEPARATOR
+from utils.date_parsing import parse_rfc822_utc
+
+if PARQUET_AVAILABLE:
+    from storage import ParquetStore
+
+
+@st.cache_resource
+def get_store():
+    """Abre o banco de notícias, se o coletor já o criou"""
+    if os.path.exists(DATABASE_PATH):
+        return NewsStore(DATABASE_PATH)
+    return None
+
+
+def data_source():
+    """Primeira fonte de DATA_SOURCES com dados gravados (ou None)"""
+    available = {
+        "sqlite": lambda: os.path.exists(DATABASE_PATH),
+        "parquet": lambda: PARQUET_AVAILABLE and ParquetStore(PARQUET_PATH).exists(),
+        "csv": lambda: os.path.exists(CSV_PATH),
+    }
+    return next((source for source in DATA_SOURCES if available[source]()), None)
 
 
 @st.cache_data
-def load_data():
-    """Carrega dados do CSV ou retorna DataFrame vazio se não existir"""
-    csv_path = "data/noticias.csv"
+def load_data(date_range=None):
+    """Carrega as notícias da fonte configurada ou retorna DataFrame vazio
+
+    date_range só é aplicado na leitura do Parquet, que descarta as
+    partições fora do período; banco e CSV são filtrados em apply_filters.
+    """
+    source = data_source()
+    try:
+        if source == "sqlite":
+            df = get_store().query_news()
+        elif source == "parquet":
+            df = load_parquet_data(date_range=date_range)
+        elif source == "csv":
+            df = pd.read_csv(CSV_PATH)
+        else:
+            return pd.DataFrame()
+    except Exception as e:
+        st.error(f"Erro ao carregar dados ({source}): {e}")
+        return pd.DataFrame()
+
+    return apply_schema(df) if not df.empty else df
+
+
+def load_parquet_data(columns=None, date_range=None):
+    """Lê do Parquet (memory-map) só as colunas e partições necessárias"""
+    return ParquetStore(PARQUET_PATH).read(
+        columns=columns or DASHBOARD_COLUMNS, date_range=date_range
+    )
+
+
+@st.cache_data
+def _parquet_dates():
+    """Só as colunas de data do Parquet, para os limites do filtro de período"""
+    return prepare_dates(load_parquet_data(columns=PERIOD_COLUMNS))
+
+
+def get_date_bounds():
+    """Limites do filtro de período lidos da fonte, ou None
+
+    No Parquet os dados carregados podem ser só o período selecionado,
+    então os limites vêm das colunas de data do conjunto inteiro.
+    """
+    if data_source() != "parquet":
+        return None
+    return get_date_range(_parquet_dates())
+
 
-    if os.path.exists(csv_path):
-        try:
-            df = pd.read_csv(csv_path)
-            if not df.empty:
-                return df
-        except Exception as e:
-            st.error(f"Erro ao carregar dados: {e}")
+def selected_period():
+    """Período escolhido na sidebar, se a fonte descarta partições por data
 
-    return pd.DataFrame()
+    O filtro é lido da sessão antes de carregar os dados; sem datas de
+    publicação válidas o filtro usa a coleta e não há o que podar.
+    """
+    period = st.session_state.get(PERIOD_KEY)
+    if data_source() != "parquet" or not period or len(period) != 2:
+        return None
+    if validate_dates(_parquet_dates()).empty:
+        return None
+    return tuple(period)
+
+
+def prepare_dates(df):
+    """Converte as datas para datetime64 (UTC, sem fuso) uma única vez
+
+    Usa o timestamp calculado na coleta; CSVs antigos sem essa coluna
+    passam pelo parser de formato fixo. Chamadas seguintes reaproveitam
+    as colunas já criadas.
+    """
+    if "data_publicacao_dt" not in df.columns and "data_publicacao" in df.columns:
+        if "timestamp_publicacao" in df.columns:
+            seconds = df["timestamp_publicacao"]
+        else:
+            seconds = df["data_publicacao"].map(parse_rfc822_utc)
+        df["data_publicacao_dt"] = pd.to_datetime(
+            pd.to_numeric(seconds, errors="coerce"), unit="s"
+        )
+    if "data_coleta_dt" not in df.columns and "data_coleta" in df.columns:
+        df["data_coleta_dt"] = pd.to_datetime(
+            df["data_coleta"], format="ISO8601", errors="coerce"
+        )
+    return df
+
+
+def apply_schema(df):
+    """Aplica o esquema tipado: categorias, float32 e datas já convertidas"""
+    prepare_dates(df)
+    # Texto e datas brutas são redundantes com as colunas derivadas
+    redundant = [c for c in RAW_COLUMNS if c in df.columns]
+    if redundant:
+        df = df.drop(columns=redundant)
+
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns and not isinstance(
+            df[column].dtype, pd.CategoricalDtype
+        ):
+            df[column] = df[column].astype("category")
+    for column in FLOAT32_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype("float32")
+    if PARQUET_AVAILABLE:
+        for column in TEXT_COLUMNS:
+            if column in df.columns and df[column].dtype == object:
+                df[column] = df[column].astype("string[pyarrow]")
+    return df
+
+
+def full_text(df):
+    """Deriva o texto completo (título + descrição) sob demanda"""
+    return df["titulo"].astype(str) + " " + df["descricao"].fillna("").astype(str)
 
 
 def validate_dates(df, date_column="data_publicacao"):
     """Valida e filtra datas dentro de um intervalo razoável"""
     try:
-        df[f"{date_column}_dt"] = pd.to_datetime(df[date_column], errors="coerce")
+        dates = prepare_dates(df)[f"{date_column}_dt"]
 
         # Define intervalo válido
         hoje = datetime.now()
@@ -37,10 +164,8 @@ def validate_dates(df, date_column="data_publicacao"):
 
         # Filtra datas válidas
         df_valid = df[
-            (df[f"{date_column}_dt"] >= limite_passado)
-            & (df[f"{date_column}_dt"] <= limite_futuro)
-            & df[f"{date_column}_dt"].notna()
-        ].copy()
+            (dates >= limite_passado) & (dates <= limite_futuro) & dates.notna()
+        ]
 
         return df_valid
 
@@ -59,10 +184,8 @@ def get_date_range(df, date_column="data_publicacao"):
             return data_min, data_max
         else:
             # Fallback para data de coleta
-            df["data_coleta_dt"] = pd.to_datetime(df["data_coleta"])
-            data_min = df["data_coleta_dt"].min().date()
-            data_max = df["data_coleta_dt"].max().date()
-            return data_min, data_max
+            dates = prepare_dates(df)["data_coleta_dt"]
+            return dates.min().date(), dates.max().date()
 
     except Exception:
         # Fallback para hoje
@@ -72,7 +195,16 @@ def get_date_range(df, date_column="data_publicacao"):
 
 def apply_filters(df, filtro_sentimento, filtro_termo, filtro_data, min_confidence):
     """Aplica todos os filtros ao DataFrame"""
-    df_filtered = df.copy()
+    store = get_store()
+    if store is not None and "id" in df.columns:
+        # Termo e data em SQL sobre colunas indexadas; sentimento e confiança
+        # vêm do próprio frame, que pode ter rótulos ainda não gravados
+        filters = sql_filters("Todos", filtro_termo, filtro_data, 0, df)
+        df = df[df["id"].isin(store.news_ids(**filters))]
+        filtro_termo, filtro_data = "Todos", ()
+
+    # Máscaras booleanas geram novos frames; não é preciso copiar antes
+    df_filtered = df
 
     # Filtro de confiança
     if min_confidence > 0:
@@ -84,7 +216,7 @@ def apply_filters(df, filtro_sentimento, filtro_termo, filtro_data, min_confiden
 
     # Filtro de termo
     if not df_filtered.empty and filtro_termo != "Todos":
-        df_filtered = df_filtered[df_filtered["termo_busca"] == filtro_termo]
+        df_filtered = df_filtered[term_mask(df_filtered, filtro_termo)]
 
     # Filtro de data
     if not df_filtered.empty and len(filtro_data) == 2:
@@ -93,34 +225,48 @@ def apply_filters(df, filtro_sentimento, filtro_termo, filtro_data, min_confiden
     return df_filtered
 
 
+def term_mask(df, termo):
+    """Notícias encontradas pelo termo: o principal ou um dos agrupados
+
+    Mesmo critério da tabela term_matches do banco.
+    """
+    mask = df["termo_busca"] == termo
+    if "termos_busca" in df.columns:
+        terms = df["termos_busca"].fillna("").astype(str)
+        mask |= (TERMS_SEPARATOR + terms + TERMS_SEPARATOR).str.contains(
+            f"{TERMS_SEPARATOR}{termo}{TERMS_SEPARATOR}", regex=False
+        )
+    return mask
+
+
+def sql_filters(filtro_sentimento, filtro_termo, filtro_data, min_confidence, df):
+    """Converte os filtros da sidebar nos argumentos de consulta do banco"""
+    # Mesmo fallback de apply_date_filter: sem publicação válida, usa a coleta
+    date_field = "coleta" if validate_dates(df).empty else "publicacao"
+
+    return {
+        "sentimento": filtro_sentimento,
+        "termo": filtro_termo,
+        "date_range": filtro_data if len(filtro_data) == 2 else None,
+        "min_confidence": min_confidence,
+        "date_field": date_field,
+    }
+
+
 def apply_date_filter(df, filtro_data):
     """Aplica filtro de data com fallback inteligente"""
     try:
         df_valid = validate_dates(df, "data_publicacao")
         inicio, fim = filtro_data
 
-        if not df_valid.empty:
-            # Use data de publicação se válida
-            df_filtered = df[
-                (
-                    pd.to_datetime(df["data_publicacao"], errors="coerce").dt.date
-                    >= inicio
-                )
-                & (
-                    pd.to_datetime(df["data_publicacao"], errors="coerce").dt.date
-                    <= fim
-                )
-                & pd.to_datetime(df["data_publicacao"], errors="coerce").notna()
-            ]
-        else:
-            # Fallback para data de coleta
-            df["data_coleta_dt"] = pd.to_datetime(df["data_coleta"])
-            df_filtered = df[
-                (df["data_coleta_dt"].dt.date >= inicio)
-                & (df["data_coleta_dt"].dt.date <= fim)
-            ]
+        # Use data de publicação se válida; senão, fallback para data de coleta
+        column = "data_publicacao_dt" if not df_valid.empty else "data_coleta_dt"
+        dates = df[column]
 
-        return df_filtered
+        # Intervalo inclusivo em dias: [início, fim + 1 dia)
+        inicio = pd.Timestamp(inicio)
+        fim = pd.Timestamp(fim) + pd.Timedelta(days=1)
+        return df[(dates >= inicio) & (dates < fim)]
 
     except Exception:
         # Em caso de erro, retorna DataFrame original
@@ -4,35 +4,101 @@ Módulo de análise de sentimento para o dashboard
 
 import pandas as pd
 import streamlit as st
-from sentiment_analysis import SentimentAnalyzer
+from sentiment_analysis import SentimentAnalyzer, ResultCache, LexiconWatcher
+from sentiment_analysis.rescoring import InvertedIndex, rescore_store
+from .config import (
+    RESULT_CACHE_PATH,
+    RESULT_CACHE_MAX_ENTRIES,
+    LEXICON_PATH,
+    LEXICON_POLL_SECONDS,
+)
+from .data_utils import get_store, apply_schema, full_text
+
+
+@st.cache_resource
+def get_analyzer():
+    """Analisador compartilhado, com cache persistente de resultados
+
+    O léxico externo é observado e trocado a quente, inclusive se for
+    criado depois; enquanto não existir, vale o léxico padrão.
+    """
+    cache = ResultCache(RESULT_CACHE_PATH, max_entries=RESULT_CACHE_MAX_ENTRIES)
+    lexicon = LexiconWatcher(LEXICON_PATH, interval=LEXICON_POLL_SECONDS)
+    return SentimentAnalyzer(lexicon, cache=cache)
+
+
+@st.cache_resource
+def get_rescoring_index():
+    """Índice invertido das notícias do banco, para reanalisar após trocas"""
+    return InvertedIndex()
+
+
+def apply_lexicon_changes(store, analyzer):
+    """Reanalisa no banco só as notícias afetadas pelas trocas de léxico"""
+    if analyzer.watcher is None:
+        return []
+    change = analyzer.watcher.pop_change()
+    if change is None:
+        return []
+    old, new = change
+    return rescore_store(store, get_rescoring_index(), old, new)
+
+
+def analyze_pending_in_store(store, analyzer):
+    """Analisa as notícias do banco sem resultado ou analisadas com outro léxico"""
+    apply_lexicon_changes(store, analyzer)
+    # Versão lida antes da análise: se o léxico trocar no meio, o resultado
+    # fica marcado com a versão anterior e é revisto na próxima execução
+    version = analyzer.lexicon_version
+    pending = store.pending_analysis(version)
+    columns = analyzer.analyze_columns(list(map(str, pending["texto_completo"])))
+
+    rows = list(
+        zip(
+            pending["id"].astype(int).tolist(),
+            columns["sentimento"].tolist(),
+            columns["confianca"].tolist(),
+            map(", ".join, columns["positivas"]),
+            map(", ".join, columns["negativas"]),
+        )
+    )
+
+    store.save_analysis(rows, version)
+    return apply_schema(store.query_news())
 
 
-@st.cache_data
 def analyze_sentiments(df):
     """Analisa sentimentos dos textos no DataFrame"""
+    analyzer = get_analyzer()
+    if analyzer.watcher is not None and analyzer.watcher.error:
+        st.warning(
+            f"⚠️ Léxico externo inválido, mantendo o anterior: {analyzer.watcher.error}"
+        )
+    # A versão do léxico entra na chave do cache: trocar o léxico reanalisa
+    return _analyze_sentiments(df, analyzer.lexicon_version)
+
+
+@st.cache_data
+def _analyze_sentiments(df, lexicon_version):
     if df.empty:
         return df
 
-    analyzer = SentimentAnalyzer()
-
-    # Analisa sentimento do texto completo
-    sentiments = []
-    confidences = []
-    positive_words = []
-    negative_words = []
-
-    for text in df["texto_completo"]:
-        sentiment, confidence, details = analyzer.analyze_sentiment(str(text))
-        sentiments.append(sentiment)
-        confidences.append(confidence)
-        positive_words.append(", ".join(details["positivas"]))
-        negative_words.append(", ".join(details["negativas"]))
-
-    # Adiciona colunas de análise
-    df_analyzed = df.copy()
-    df_analyzed["sentimento"] = sentiments
-    df_analyzed["confianca"] = confidences
-    df_analyzed["palavras_positivas"] = positive_words
-    df_analyzed["palavras_negativas"] = negative_words
-
-    return df_analyzed
+    analyzer = get_analyzer()
+
+    # Com banco, resultados persistem e só notícias novas são analisadas
+    store = get_store()
+    if store is not None and "id" in df.columns:
+        return analyze_pending_in_store(store, analyzer)
+
+    # Analisa o texto completo em lote (colunas em vez de um dict por linha)
+    columns = analyzer.analyze_columns(list(map(str, full_text(df))))
+
+    # Adiciona colunas de análise (assign evita a cópia manual do frame)
+    df_analyzed = df.assign(
+        sentimento=columns["sentimento"],
+        confianca=columns["confianca"],
+        palavras_positivas=[", ".join(words) for words in columns["positivas"]],
+        palavras_negativas=[", ".join(words) for words in columns["negativas"]],
+    )
+
+    return apply_schema(df_analyzed)
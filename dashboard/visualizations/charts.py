@@ -8,44 +8,25 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import sys
 import os
-from datetime import datetime, timedelta
 
 # Adiciona path para importações
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from utils.text_processing import clean_text_pipeline
+from ..data_utils import validate_dates, prepare_dates, full_text
 
 # Configurações locais
 COLORS = {"positivo": "#27AE60", "negativo": "#E74C3C", "neutro": "#95A5A6"}
 
 
-def validate_dates_local(df, date_column="data_publicacao"):
-    """Valida datas localmente"""
-    try:
-        df[f"{date_column}_dt"] = pd.to_datetime(df[date_column], errors="coerce")
-
-        hoje = datetime.now()
-        limite_passado = hoje - timedelta(days=365)
-        limite_futuro = hoje + timedelta(days=30)
-
-        df_valid = df[
-            (df[f"{date_column}_dt"] >= limite_passado)
-            & (df[f"{date_column}_dt"] <= limite_futuro)
-            & df[f"{date_column}_dt"].notna()
-        ].copy()
-
-        return df_valid
-
-    except Exception:
-        return pd.DataFrame()
-
-
 def create_sentiment_pie_chart(df):
     """Cria gráfico de pizza dos sentimentos"""
     if df.empty:
         return None
 
+    # Categorias sem notícias no filtro não entram no gráfico
     sentiment_counts = df["sentimento"].value_counts()
+    sentiment_counts = sentiment_counts[sentiment_counts > 0]
 
     fig = px.pie(
         values=sentiment_counts.values,
@@ -72,7 +53,7 @@ def create_wordcloud(df):
         return None
 
     # Combina todos os textos
-    all_text = " ".join(df["texto_completo"].astype(str))
+    all_text = " ".join(full_text(df))
 
     # Limpa o texto
     clean_text = clean_text_pipeline(all_text)
@@ -141,7 +122,9 @@ def create_term_distribution_chart(df):
         return None
 
     term_sentiment = (
-        df.groupby(["termo_busca", "sentimento"]).size().reset_index(name="count")
+        df.groupby(["termo_busca", "sentimento"], observed=True)
+        .size()
+        .reset_index(name="count")
     )
 
     fig = px.bar(
@@ -189,29 +172,31 @@ def create_timeline_chart(df):
 
     try:
         # Valida e usa datas de publicação
-        df_valid = validate_dates_local(df, "data_publicacao")
+        df_valid = validate_dates(df, "data_publicacao")
 
         if not df_valid.empty:
-            df_valid["data"] = df_valid["data_publicacao_dt"].dt.date
+            df_valid = df_valid.assign(data=df_valid["data_publicacao_dt"].dt.date)
             timeline_data = (
-                df_valid.groupby(["data", "sentimento"])
+                df_valid.groupby(["data", "sentimento"], observed=True)
                 .size()
                 .reset_index(name="count")
             )
         else:
             # Fallback para data de coleta
-            df["data_coleta_dt"] = pd.to_datetime(df["data_coleta"])
-            df["data"] = df["data_coleta_dt"].dt.date
+            df = df.assign(data=prepare_dates(df)["data_coleta_dt"].dt.date)
             timeline_data = (
-                df.groupby(["data", "sentimento"]).size().reset_index(name="count")
+                df.groupby(["data", "sentimento"], observed=True)
+                .size()
+                .reset_index(name="count")
             )
 
     except Exception:
         # Em caso de erro, use data de coleta como fallback
-        df["data_coleta_dt"] = pd.to_datetime(df["data_coleta"])
-        df["data"] = df["data_coleta_dt"].dt.date
+        df = df.assign(data=prepare_dates(df)["data_coleta_dt"].dt.date)
         timeline_data = (
-            df.groupby(["data", "sentimento"]).size().reset_index(name="count")
+            df.groupby(["data", "sentimento"], observed=True)
+            .size()
+            .reset_index(name="count")
         )
 
     # Cria gráfico de colunas
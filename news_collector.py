@@ -2,34 +2,77 @@
 Script para coleta de notícias do Google RSS sobre IA no Piauí
 """
 
-import requests
 import xml.etree.ElementTree as ET
 import pandas as pd
 from datetime import datetime
 import re
 from urllib.parse import quote
-import time
 import os
+import argparse
+import asyncio
+
+import config
+from collector import HttpTransport, TransportError, FeedCache, iter_feed_items
+from collector import SeenIndex, canonical_key
+from collector import NearDuplicateIndex, item_signature
+from storage import NewsStore
+from storage.sqlite_store import TERMS_SEPARATOR
+from utils.date_parsing import parse_rfc822_utc
+from storage.parquet_store import ParquetStore, PARQUET_AVAILABLE
+from sentiment_analysis.token_store import TokenStore
 
 
 class NewsCollector:
-    def __init__(self):
-        self.base_url = "https://news.google.com/rss/search"
-        self.search_terms = [
-            "Inteligência Artificial Piauí",
-            "SIA Piauí",
-            "IA Piauí",
-            "Artificial Intelligence Piauí",
-            "Secretaria Inteligência Artificial Piauí",
-            "SoberanIA Piauí",
-        ]
-        self.session = requests.Session()
+    def __init__(
+        self,
+        base_url="https://news.google.com/rss/search",
+        search_terms=None,
+        transport=None,
+        cache=None,
+        use_cache=True,
+        store=None,
+    ):
+        self.base_url = base_url
+        self.search_terms = (
+            list(search_terms)
+            if search_terms is not None
+            else [
+                "Inteligência Artificial Piauí",
+                "SIA Piauí",
+                "IA Piauí",
+                "Artificial Intelligence Piauí",
+                "Secretaria Inteligência Artificial Piauí",
+                "SoberanIA Piauí",
+            ]
+        )
+        self.transport = transport or HttpTransport(
+            pool_size=config.MAX_CONEXOES_SIMULTANEAS,
+            min_interval=config.INTERVALO_ENTRE_REQUISICOES,
+            timeout=config.TIMEOUT_REQUISICAO,
+            failure_threshold=config.FALHAS_PARA_ABRIR_CIRCUITO,
+            reset_timeout=config.TEMPO_CIRCUITO_ABERTO,
+        )
+        self.session = self.transport.session
+        if cache is None and use_cache:
+            cache = FeedCache(ttl_hours=config.CACHE_EXPIRY_HOURS)
+        self.cache = cache
+        self._store = store
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             }
         )
 
+    @property
+    def store(self):
+        """Banco de notícias, aberto sob demanda (migra o CSV legado na criação)"""
+        if self._store is None:
+            is_new = not os.path.exists(config.CAMINHO_BANCO)
+            self._store = NewsStore(config.CAMINHO_BANCO)
+            if is_new and os.path.exists(config.CAMINHO_CSV):
+                self._store.import_csv(config.CAMINHO_CSV)
+        return self._store
+
     def clean_text(self, text):
         """Limpa o texto removendo tags HTML e caracteres especiais"""
         if not text:
@@ -44,124 +87,379 @@ class NewsCollector:
 
         return text.strip()
 
-    def fetch_news_for_term(self, search_term, max_retries=3):
-        """Busca notícias para um termo específico"""
-        base_url = "https://news.google.com/rss/search"
-        query = f"{search_term}"
-        url = f"{base_url}?q={query}&hl=pt-BR&gl=BR&ceid=BR:pt"
+    def parse_feed(self, content, search_term, max_items=None):
+        """Extrai as notícias de um feed RSS (bytes ou blocos de bytes)"""
+        if max_items is None:
+            max_items = config.MAX_NOTICIAS_POR_TERMO
+
+        news_data = []
+
+        # Parse incremental: para assim que o limite por termo é atingido
+        for item in iter_feed_items(content):
+            if len(news_data) >= max_items:
+                break
 
-        for attempt in range(max_retries):
             try:
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                }
-
-                response = requests.get(url, headers=headers, timeout=30)
-                response.raise_for_status()
-
-                try:
-                    root = ET.fromstring(response.content)
-                    news_data = []
-
-                    for i, item in enumerate(root.findall(".//item")):
-                        if i >= 50:  # Limita a 50 itens por termo
-                            break
-
-                        try:
-                            title = item.find("title")
-                            title_text = title.text if title is not None else ""
-                            title_clean = self.clean_text(title_text)
-
-                            description = item.find("description")
-                            desc_text = (
-                                description.text if description is not None else ""
-                            )
-                            desc_clean = self.clean_text(desc_text)
-
-                            link = item.find("link")
-                            link_text = link.text if link is not None else ""
-
-                            pub_date = item.find("pubDate")
-                            pub_date_text = (
-                                pub_date.text if pub_date is not None else ""
-                            )
-
-                            if title_clean:
-                                news_item = {
-                                    "termo_busca": search_term,
-                                    "titulo": title_clean,
-                                    "link": link_text,
-                                    "descricao": desc_clean,
-                                    "data_publicacao": pub_date_text,
-                                    "data_coleta": datetime.now().isoformat(),
-                                    "texto_completo": f"{title_clean} {desc_clean}",
-                                }
-                                news_data.append(news_item)
-
-                        except Exception as e:
-                            continue
-
-                    return news_data
-
-                except ET.ParseError as e:
-                    if attempt < max_retries - 1:
-                        time.sleep(2**attempt)
-                        continue
-                    else:
-                        return []
-
-            except requests.RequestException as e:
-                if attempt < max_retries - 1:
-                    time.sleep(2**attempt)
-                    continue
-                else:
-                    return []
+                title_clean = self.clean_text(item["title"])
+                desc_clean = self.clean_text(item["description"])
+
+                if title_clean:
+                    news_item = {
+                        "termo_busca": search_term,
+                        "titulo": title_clean,
+                        "link": item["link"],
+                        "descricao": desc_clean,
+                        "data_publicacao": item["pubDate"],
+                        "timestamp_publicacao": parse_rfc822_utc(item["pubDate"]),
+                        "data_coleta": datetime.now().isoformat(),
+                        "texto_completo": f"{title_clean} {desc_clean}",
+                    }
+                    news_data.append(news_item)
+
             except Exception as e:
-                return []
+                continue
 
-        return []
+        return news_data
 
-    def collect_all_news(self, max_per_term=4):
+    def fetch_news_for_term(self, search_term, max_retries=3, max_items=None):
+        """Busca notícias para um termo específico"""
+        query = f"{search_term}"
+        url = f"{self.base_url}?q={query}&hl=pt-BR&gl=BR&ceid=BR:pt"
+
+        if max_items is None:
+            max_items = config.MAX_NOTICIAS_POR_TERMO
+
+        cached = self.cache.get(url, max_items) if self.cache is not None else None
+        if cached is not None and self.cache.is_fresh(cached):
+            return self._from_cache(cached)
+
+        try:
+            # Retentativas, backoff e circuit breaker ficam no transporte
+            response = self.transport.get(
+                url,
+                max_retries=max_retries,
+                headers=self.cache.conditional_headers(cached) if cached else None,
+                stream=True,
+            )
+
+            with response:
+                # Feed inalterado: reaproveita os itens já extraídos
+                if response.status_code == 304 and cached is not None:
+                    self.cache.touch(url, cached)
+                    return self._from_cache(cached)
+
+                news_data = self.parse_feed(
+                    response.iter_content(chunk_size=16384), search_term, max_items
+                )
+
+            if self.cache is not None:
+                self.cache.store(url, response, news_data, max_items)
+            return news_data
+        except TransportError as e:
+            return []
+        except ET.ParseError as e:
+            self.transport.breaker_for(url).record_failure()
+            return []
+        except Exception as e:
+            return []
+
+    @staticmethod
+    def _from_cache(entry):
+        """Itens de uma entrada do cache com a data de coleta desta execução"""
+        collected_at = datetime.now().isoformat()
+        return [{**item, "data_coleta": collected_at} for item in entry["items"]]
+
+    def collect_all_news(self, max_per_term=None):
         """Coleta notícias para todos os termos de busca"""
         all_news = []
 
         for term in self.search_terms:
-            news_items = self.fetch_news_for_term(term, max_per_term)
+            news_items = self.fetch_news_for_term(term, max_items=max_per_term)
             all_news.extend(news_items)
-            time.sleep(1)  # Pausa entre requisições
 
         return all_news
 
-    def save_to_csv(self, news_data, filename="data/noticias.csv"):
-        """Salva os dados em CSV"""
+    async def collect_all_news_async(self, max_per_term=None, max_concurrency=4):
+        """Coleta notícias de todos os termos concorrentemente"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(term):
+            async with semaphore:
+                # O limite de taxa por host é aplicado pelo transporte
+                return await asyncio.to_thread(
+                    self.fetch_news_for_term, term, max_items=max_per_term
+                )
+
+        # gather preserva a ordem dos termos
+        results = await asyncio.gather(*(fetch(term) for term in self.search_terms))
+
+        all_news = []
+        for news_items in results:
+            all_news.extend(news_items)
+
+        return all_news
+
+    def save_to_csv(self, filename="data/noticias.csv"):
+        """Exporta o histórico do banco para CSV"""
+        self.store.export_csv(filename)
+
+    def save_to_json(self, filename="data/noticias.json"):
+        """Exporta o histórico do banco para JSON"""
+        self.store.export_json(filename)
+
+    def save_to_parquet(self, news_data, root=None):
+        """Anexa as notícias ao conjunto Parquet particionado por mês"""
         if not news_data:
+            return 0
+
+        return ParquetStore(root or config.CAMINHO_PARQUET).write(news_data)
+
+    def save_tokens(self, root=None):
+        """Tokeniza as notícias novas do banco uma única vez (ids no TokenStore)"""
+        return TokenStore(root or config.CAMINHO_TOKENS).sync(self.store)
+
+    def merge_duplicates(self, news_data):
+        """Agrupa a mesma notícia encontrada por vários termos em um único item"""
+        merged = {}
+
+        for item in news_data:
+            key = canonical_key(item)
+            if key in merged:
+                terms = merged[key]["termos_busca"]
+                if item["termo_busca"] not in terms:
+                    terms.append(item["termo_busca"])
+            else:
+                merged[key] = {**item, "termos_busca": [item["termo_busca"]]}
+
+        return merged
+
+    def ingest_incremental(
+        self,
+        news_data,
+        index=None,
+        csv_filename="data/noticias.csv",
+        json_filename="data/noticias.json",
+        near_duplicates=None,
+    ):
+        """Grava apenas notícias inéditas e acumula os termos das já conhecidas"""
+        if index is None:
+            index = SeenIndex()
+        if near_duplicates is None:
+            near_duplicates = NearDuplicateIndex(
+                os.path.join(index.index_dir, "near_duplicates.jsonl")
+            )
+
+        # Primeira execução incremental: indexa o histórico já existente
+        legacy_clusters = {}
+        if not os.path.exists(index.keys_path) and os.path.exists(csv_filename):
+            for row in pd.read_csv(csv_filename).to_dict("records"):
+                key = canonical_key(row)
+                if key not in index:
+                    legacy_clusters[key] = near_duplicates.add(item_signature(row))
+                index.add(key, self._split_terms(row))
+
+        new_items = []
+        term_updates = {}
+
+        merged = self.merge_duplicates(news_data)
+        for key, item in merged.items():
+            if key not in index:
+                index.add(key, item["termos_busca"])
+                item["cluster_id"] = near_duplicates.add(item_signature(item))
+                new_items.append(item)
+            elif index.add(key, item["termos_busca"]):
+                term_updates[key] = index.terms_for(key)
+
+        # O banco recebe tudo; termos repetidos são ignorados pela chave primária
+        self.store.upsert_news(merged.values())
+
+        self.append_to_csv(new_items, csv_filename, term_updates, legacy_clusters)
+        self.append_to_json(new_items, json_filename, term_updates, legacy_clusters)
+        index.save()
+        near_duplicates.save()
+
+        return new_items
+
+    def ingest(self, news_data, incremental=False):
+        """Grava uma coleta: clusters, banco, CSV/JSON, Parquet e tokens
+
+        Caminho único da linha de comando e do dashboard. Retorna as
+        notícias que eram novas.
+        """
+        if incremental:
+            new_items = self.ingest_incremental(news_data)
+        else:
+            self.assign_clusters(news_data)
+            new_items = self.store.upsert_news(news_data)
+            self.save_to_csv()
+            self.save_to_json()
+
+        if config.SALVAR_PARQUET and PARQUET_AVAILABLE:
+            self.save_to_parquet(new_items)
+
+        if config.SALVAR_TOKENS:
+            self.save_tokens()
+
+        return new_items
+
+    def assign_clusters(self, news_data, near_duplicates=None):
+        """Marca cada notícia com o id do seu cluster de quase-duplicatas"""
+        if near_duplicates is None:
+            near_duplicates = NearDuplicateIndex()
+
+        for item in news_data:
+            item["cluster_id"] = near_duplicates.add(item_signature(item))
+
+        return news_data
+
+    @staticmethod
+    def _split_terms(row):
+        """Lê o campo multivalorado de termos (ou o termo único legado)"""
+        terms = row.get("termos_busca")
+        if isinstance(terms, list):
+            return terms
+        if isinstance(terms, str) and terms:
+            return terms.split(TERMS_SEPARATOR)
+        return [row["termo_busca"]]
+
+    def append_to_csv(
+        self, new_items, filename="data/noticias.csv", term_updates=None, clusters=None
+    ):
+        """Anexa notícias novas ao CSV, reescrevendo-o só se termos mudarem"""
+        if not new_items and not term_updates:
             return
 
+        rows = pd.DataFrame(
+            [
+                {**item, "termos_busca": TERMS_SEPARATOR.join(item["termos_busca"])}
+                for item in new_items
+            ]
+        )
+        if "timestamp_publicacao" in rows.columns:
+            rows["timestamp_publicacao"] = rows["timestamp_publicacao"].astype("Int64")
+
+        if os.path.exists(filename):
+            header = pd.read_csv(filename, nrows=0).columns.tolist()
+            if not term_updates and header == rows.columns.tolist():
+                rows.to_csv(
+                    filename, mode="a", header=False, index=False, encoding="utf-8"
+                )
+                return
+
+            # Esquema legado ou termos atualizados: reescreve o arquivo
+            existing = pd.read_csv(filename)
+            records = existing.to_dict("records")
+            keys = pd.Series([canonical_key(row) for row in records])
+            terms = {}
+            for key, row in zip(keys, records):
+                known = terms.setdefault(key, [])
+                known.extend(t for t in self._split_terms(row) if t not in known)
+            terms.update(term_updates or {})
+
+            # Linhas legadas repetidas entre termos viram uma só
+            first = ~keys.duplicated().to_numpy()
+            existing = existing[first].copy()
+            existing["termos_busca"] = [
+                TERMS_SEPARATOR.join(terms[key]) for key in keys[first]
+            ]
+            if "cluster_id" not in existing.columns:
+                existing["cluster_id"] = [
+                    (clusters or {}).get(key) for key in keys[first]
+                ]
+            if "timestamp_publicacao" not in existing.columns:
+                existing["timestamp_publicacao"] = pd.array(
+                    existing["data_publicacao"].map(parse_rfc822_utc), dtype="Int64"
+                )
+            # Mantém a ordem de colunas das linhas novas para os próximos appends
+            columns = rows.columns.tolist() + [
+                c for c in existing.columns if c not in rows.columns
+            ]
+            rows = pd.concat([existing, rows], ignore_index=True)[columns]
+
         os.makedirs(os.path.dirname(filename), exist_ok=True)
-        df = pd.DataFrame(news_data)
-        df.to_csv(filename, index=False, encoding="utf-8")
+        rows.to_csv(filename, index=False, encoding="utf-8")
 
-    def save_to_json(self, news_data, filename="data/noticias.json"):
-        """Salva os dados em JSON"""
-        if not news_data:
+    def append_to_json(
+        self, new_items, filename="data/noticias.json", term_updates=None, clusters=None
+    ):
+        """Acrescenta notícias novas ao JSON e atualiza os termos das existentes"""
+        if not new_items and not term_updates:
             return
 
         import json
 
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        existing = []
+        if os.path.exists(filename):
+            with open(filename, encoding="utf-8") as f:
+                existing = json.load(f)
+
+        # Une linhas legadas repetidas entre termos
+        merged = {}
+        for item in existing:
+            key = canonical_key(item)
+            if key not in merged:
+                merged[key] = {**item, "termos_busca": []}
+                if "cluster_id" not in item:
+                    merged[key]["cluster_id"] = (clusters or {}).get(key)
+            known = merged[key]["termos_busca"]
+            known.extend(t for t in self._split_terms(item) if t not in known)
+
+        for key, terms in (term_updates or {}).items():
+            if key in merged:
+                merged[key]["termos_busca"] = terms
 
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
         with open(filename, "w", encoding="utf-8") as f:
-            json.dump(news_data, f, ensure_ascii=False, indent=2)
+            json.dump(
+                list(merged.values()) + new_items, f, ensure_ascii=False, indent=2
+            )
+
+
+def parse_args(argv=None):
+    """Lê os argumentos de linha de comando"""
+    parser = argparse.ArgumentParser(description="Coleta notícias do Google RSS")
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Coleta todos os termos concorrentemente",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=config.MAX_CONEXOES_SIMULTANEAS,
+        help="Máximo de requisições simultâneas no modo assíncrono",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Anexa apenas notícias inéditas ao histórico (sem duplicatas)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Ignora o cache HTTP em disco",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Função principal"""
+    args = parse_args(argv)
+    collector = NewsCollector(use_cache=args.use_cache)
 
+    if args.use_async:
+        news_data = asyncio.run(
+            collector.collect_all_news_async(max_concurrency=args.concurrency)
+        )
+    else:
+        news_data = collector.collect_all_news()
 
-def main():
-    """Função principal"""
-    collector = NewsCollector()
-    news_data = collector.collect_all_news(max_per_term=4)
+    if not news_data:
+        return
 
-    if news_data:
-        collector.save_to_csv(news_data)
-        collector.save_to_json(news_data)
+    collector.ingest(news_data, incremental=args.incremental)
 
 
 if __name__ == "__main__":
@@ -3,7 +3,20 @@ Módulo de análise de sentimento modularizado
 """
 
 from .analyzer import SentimentAnalyzer
+from .lexicon import Lexicon, compile_lexicon
+from .lexicon_watcher import LexiconWatcher
+from .linear_model import HashingClassifier
+from .result_cache import ResultCache
+from .results import SentimentResult
 
-__all__ = ["SentimentAnalyzer"]
+__all__ = [
+    "SentimentAnalyzer",
+    "SentimentResult",
+    "Lexicon",
+    "compile_lexicon",
+    "LexiconWatcher",
+    "ResultCache",
+    "HashingClassifier",
+]
 
 __version__ = "2.0.0"
@@ -0,0 +1,242 @@
+"""
+Análise de sentimento em fluxo pela linha de comando
+
+Lê JSONL ou CSV de arquivos (ou da entrada padrão), analisa em lotes e
+grava JSONL ou CSV na saída, registro a registro: a memória fica
+constante, qualquer que seja o tamanho da entrada. Ao final, informa a
+vazão (docs/s) na saída de erro.
+
+Uso: python -m sentiment_analysis [arquivos...] [--format jsonl|csv]
+     [--output-format jsonl|csv] [--batch-size 1000] [--workers N]
+     [--mode full|label] [--lexicon data/lexicon.bin]
+     python -m sentiment_analysis --tokens data/tokens   (reanalisa o TokenStore)
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from collections import deque
+from itertools import islice
+
+from .analyzer import MODES
+from .batch import analyze_columns
+from .lexicon import resolve_lexicon
+from .parallel import iter_parallel
+from .token_store import TokenStore
+
+FORMATS = ("jsonl", "csv")
+# Campos usados como texto, em ordem de preferência
+TEXT_FIELDS = ("texto_completo", "text", "texto")
+
+
+def guess_format(path, default="jsonl"):
+    """Formato pela extensão do arquivo"""
+    if path.endswith(".csv"):
+        return "csv"
+    if path.endswith((".jsonl", ".json", ".ndjson")):
+        return "jsonl"
+    return default
+
+
+def read_records(stream, fmt):
+    """Gera os registros (dicts) de um JSONL ou CSV, um por vez"""
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for line in stream:
+        line = line.strip()
+        if line:
+            record = json.loads(line)
+            yield record if isinstance(record, dict) else {"text": record}
+
+
+def iter_inputs(paths, fmt):
+    """Registros de todos os arquivos ("-" ou nenhum: entrada padrão)"""
+    for path in paths or ["-"]:
+        if path == "-":
+            yield from read_records(sys.stdin, fmt or "jsonl")
+            continue
+        with open(path, encoding="utf-8", newline="") as f:
+            yield from read_records(f, fmt or guess_format(path))
+
+
+def record_text(record, field=None):
+    """Texto do registro: o campo pedido, um campo conhecido ou título + descrição"""
+    if field:
+        return str(record.get(field) or "")
+    for name in TEXT_FIELDS:
+        if record.get(name):
+            return str(record[name])
+    return f"{record.get('titulo') or ''} {record.get('descricao') or ''}".strip()
+
+
+def _result_fields(sentiment, confidence, details):
+    fields = {"sentimento": sentiment, "confianca": confidence}
+    if details is not None:
+        fields["palavras_positivas"] = details["positivas"]
+        fields["palavras_negativas"] = details["negativas"]
+    return fields
+
+
+def analyze_records(records, lexicon, field=None, batch_size=1000, mode="full"):
+    """Registros com as colunas de análise, em lotes de batch_size"""
+    words = mode == "full"
+    records = iter(records)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        columns = analyze_columns(
+            [record_text(r, field) for r in batch], lexicon, words
+        )
+        rows = zip(
+            columns["sentimento"].tolist(),
+            columns["confianca"].tolist(),
+            columns["positivas"] if words else [None] * len(batch),
+            columns["negativas"] if words else [None] * len(batch),
+        )
+        for record, (sentiment, confidence, positive, negative) in zip(batch, rows):
+            details = (
+                None
+                if positive is None
+                else {"positivas": positive, "negativas": negative}
+            )
+            yield {**record, **_result_fields(sentiment, confidence, details)}
+
+
+def analyze_records_parallel(
+    records, lexicon, workers, field=None, batch_size=1000, mode="full"
+):
+    """Como analyze_records, com os lotes distribuídos em processos"""
+    pending = deque()
+
+    def texts():
+        # Guarda o registro até o resultado dele voltar (janela limitada)
+        for record in records:
+            pending.append(record)
+            yield record_text(record, field)
+
+    for _, sentiment, confidence, details in iter_parallel(
+        texts(), lexicon, workers, batch_size, words=mode == "full"
+    ):
+        record = pending.popleft()
+        yield {**record, **_result_fields(sentiment, confidence, details)}
+
+
+def token_store_records(root, lexicon, mode="full"):
+    """Reanalisa o TokenStore inteiro (sem tokenizar): id + colunas de análise"""
+    columns = TokenStore(root).analyze(lexicon, words=mode == "full")
+    for i, (news_id, sentiment, confidence) in enumerate(
+        zip(
+            columns["id"].tolist(),
+            columns["sentimento"].tolist(),
+            columns["confianca"].tolist(),
+        )
+    ):
+        details = None
+        if mode == "full":
+            details = {
+                "positivas": columns["positivas"][i],
+                "negativas": columns["negativas"][i],
+            }
+        yield {"id": news_id, **_result_fields(sentiment, confidence, details)}
+
+
+def write_jsonl(records, stream):
+    count = 0
+    for record in records:
+        stream.write(json.dumps(record, ensure_ascii=False))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(records, stream):
+    """CSV com o cabeçalho do primeiro registro (listas viram texto com vírgulas)
+
+    A saída é gravada em fluxo, então o cabeçalho não muda depois da
+    primeira linha: campos ausentes num registro ficam vazios e campos
+    novos interrompem a gravação com ValueError (use JSONL para entradas
+    com campos variados).
+    """
+    writer = None
+    count = 0
+    for record in records:
+        row = {
+            key: ", ".join(value) if isinstance(value, list) else value
+            for key, value in record.items()
+        }
+        if writer is None:
+            writer = csv.DictWriter(stream, fieldnames=list(row))
+            writer.writeheader()
+        extra = [key for key in row if key not in writer.fieldnames]
+        if extra:
+            raise ValueError(
+                f"O registro {count + 1} tem campos fora do cabeçalho do CSV "
+                f"(definido pelo primeiro registro): {', '.join(extra)}"
+            )
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def main(argv=None):
+    """Analisa JSONL/CSV em fluxo e grava os resultados"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("inputs", nargs="*", help="arquivos (padrão: stdin)")
+    parser.add_argument("--format", choices=FORMATS, help="formato da entrada")
+    parser.add_argument("--output", "-o", default="-", help="arquivo de saída")
+    parser.add_argument("--output-format", choices=FORMATS)
+    parser.add_argument("--text-field", help="campo com o texto a analisar")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--mode", choices=MODES, default="full")
+    parser.add_argument("--lexicon", help="artefato binário do léxico")
+    parser.add_argument("--tokens", help="reanalisa o TokenStore deste diretório")
+    args = parser.parse_args(argv)
+
+    lexicon = resolve_lexicon(args.lexicon)
+    if args.tokens:
+        results = token_store_records(args.tokens, lexicon, args.mode)
+    elif args.workers > 1:
+        results = analyze_records_parallel(
+            iter_inputs(args.inputs, args.format),
+            lexicon,
+            args.workers,
+            args.text_field,
+            args.batch_size,
+            args.mode,
+        )
+    else:
+        results = analyze_records(
+            iter_inputs(args.inputs, args.format),
+            lexicon,
+            args.text_field,
+            args.batch_size,
+            args.mode,
+        )
+
+    output_format = args.output_format or guess_format(args.output, "jsonl")
+    write = write_csv if output_format == "csv" else write_jsonl
+    start = time.perf_counter()
+    try:
+        if args.output == "-":
+            count = write(results, sys.stdout)
+        else:
+            with open(args.output, "w", encoding="utf-8", newline="") as f:
+                count = write(results, f)
+    except ValueError as error:
+        parser.exit(2, f"erro: {error}\n")
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{count} documentos em {elapsed:.2f}s "
+        f"({count / elapsed if elapsed else 0:,.0f} docs/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,98 +6,89 @@ desenvolvidos com assistência de IA, adaptados para o contexto específico.
 """
 
 from collections import Counter
-from .dictionaries import POSITIVE_WORDS, NEGATIVE_WORDS, NEUTRAL_WORDS
-from .text_processor import preprocess_text, analyze_with_context
+from itertools import chain
+from .lexicon import NEUTRAL, resolve_lexicon
+from .lexicon_watcher import LexiconWatcher
+from .text_processor import tokenize
+from .scanner import ScanResult, scan
+from .results import MODES, SentimentResult, Details
+from .streaming import score_chunks
+from .batch import analyze_columns, iter_details
+from .parallel import iter_parallel
+from .result_cache import ResultCache
 from .confidence import calculate_improved_confidence, calculate_neutral_confidence
 
+# Varredura de um texto sem tokens
+EMPTY_SCAN = ScanResult(0, 0, [], [], 0, 0, 0, 0)
+
 
 class SentimentAnalyzer:
     """Analisador de sentimento baseado em regras com tratamento avançado"""
 
-    def __init__(self):
-        """Inicializa o analisador"""
-        pass
-
-    def calculate_sentiment_score(self, words_with_context):
-        """Calcula score considerando negação e intensificadores"""
-        positive_score = 0
-        negative_score = 0
-        positive_words = []
-        negative_words = []
-
-        for word, is_negated, intensifier in words_with_context:
-            base_positive_weight = POSITIVE_WORDS.get(word, 0)
-            base_negative_weight = NEGATIVE_WORDS.get(word, 0)
-
-            # Aplica intensificador
-            positive_weight = base_positive_weight * intensifier
-            negative_weight = base_negative_weight * intensifier
-
-            # Aplica negação (inverte o sentimento)
-            if is_negated:
-                if positive_weight > 0:
-                    # Palavra positiva negada vira negativa
-                    negative_score += positive_weight
-                    negative_words.append(f"não_{word}")
-                elif negative_weight > 0:
-                    # Palavra negativa negada vira positiva
-                    positive_score += negative_weight
-                    positive_words.append(f"não_{word}")
-            else:
-                # Sem negação, aplica normalmente
-                if positive_weight > 0:
-                    positive_score += positive_weight
-                    if intensifier > 1.0:
-                        positive_words.append(f"muito_{word}")
-                    else:
-                        positive_words.append(word)
-                elif negative_weight > 0:
-                    negative_score += negative_weight
-                    if intensifier > 1.0:
-                        negative_words.append(f"muito_{word}")
-                    else:
-                        negative_words.append(word)
-
-        return positive_score, negative_score, positive_words, negative_words
-
-    def analyze_sentiment(self, text):
-        """Analisa o sentimento do texto com cálculo melhorado de confiança"""
-        words = preprocess_text(text)
-
+    def __init__(self, lexicon=None, cache=None, model=None):
+        """Inicializa o analisador com o léxico padrão, um Lexicon ou um artefato
+
+        lexicon também pode ser um LexiconWatcher: cada análise usa o
+        snapshot atual do arquivo observado.
+        cache: ResultCache (ou caminho do banco) consultado antes de analisar.
+        model: backend alternativo (ex.: HashingClassifier) usado no lugar
+        das regras em analyze_sentiment, analyze_columns e derivados.
+        """
+        self.watcher = lexicon if isinstance(lexicon, LexiconWatcher) else None
+        self._lexicon = None if self.watcher else resolve_lexicon(lexicon)
+        self.cache = ResultCache(cache) if isinstance(cache, str) else cache
+        self.model = model
+
+    @property
+    def lexicon(self):
+        """Léxico em uso (com watcher, o snapshot mais recente)"""
+        if self.watcher is not None:
+            return self.watcher.current()
+        return self._lexicon
+
+    @property
+    def lexicon_version(self):
+        """Hash curto do léxico em uso"""
+        return self.lexicon.version
+
+    def analyze_sentiment(self, text, mode="full"):
+        """Analisa o sentimento do texto com cálculo melhorado de confiança
+
+        mode="full" devolve os detalhes (calculados sob demanda); mode="label"
+        devolve só rótulo e confiança, sem montar listas de palavras.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Modo de análise inválido: {mode}")
+        full = mode == "full"
+
+        if self.model is not None:
+            return self.model.analyze_sentiment(text, mode)
+
+        if self.cache is not None and full:
+            return SentimentResult(*self.cache.analyze_sentiment(text, self.lexicon))
+        if self.cache is not None:
+            # Modo rótulo: acerto sem listas de palavras; falta analisada
+            # abaixo (sem montá-las) e não gravada
+            cached = self.cache.label(text, self.lexicon)
+            if cached is not None:
+                return SentimentResult(*cached)
+
+        return self.analyze_words(tokenize(text), mode)
+
+    def analyze_words(self, words, mode="full"):
+        """Analisa um texto já tokenizado (ex.: tokens do TokenStore)"""
+        if mode not in MODES:
+            raise ValueError(f"Modo de análise inválido: {mode}")
+        full = mode == "full"
         if not words:
-            return (
-                "neutro",
-                0.1,
-                {
-                    "positivas": [],
-                    "negativas": [],
-                    "total_palavras": 0,
-                    "palavras_sentimento": 0,
-                    "peso_positivo": 0,
-                    "peso_negativo": 0,
-                    "negacoes_detectadas": 0,
-                    "intensificadores_detectados": 0,
-                },
+            return SentimentResult(
+                "neutro", 0.1, Details(EMPTY_SCAN, 0) if full else None
             )
 
-        # Analisa com contexto (negação e intensificadores)
-        words_with_context = analyze_with_context(words)
-
-        # Calcula scores considerando contexto
-        positive_score, negative_score, positive_words, negative_words = (
-            self.calculate_sentiment_score(words_with_context)
-        )
-
-        # Conta detecções especiais
-        negations_count = sum(
-            1 for _, is_negated, _ in words_with_context if is_negated
-        )
-        intensifiers_count = sum(
-            1 for _, _, intensifier in words_with_context if intensifier != 1.0
-        )
-
-        positive_count = len(positive_words)
-        negative_count = len(negative_words)
+        # Contexto (negação e intensificadores), scores e contadores em uma passada
+        result = scan(words, self.lexicon, collect=full)
+        positive_score = result.positive_score
+        negative_score = result.negative_score
 
         # Determina sentimento baseado no score total
         if positive_score == 0 and negative_score == 0:
@@ -107,8 +98,8 @@ class SentimentAnalyzer:
         elif positive_score > negative_score:
             sentiment = "positivo"
             confidence = calculate_improved_confidence(
-                positive_count,
-                negative_count,
+                result.positive_count,
+                result.negative_count,
                 positive_score,
                 negative_score,
                 len(words),
@@ -116,8 +107,8 @@ class SentimentAnalyzer:
         elif negative_score > positive_score:
             sentiment = "negativo"
             confidence = calculate_improved_confidence(
-                positive_count,
-                negative_count,
+                result.positive_count,
+                result.negative_count,
                 positive_score,
                 negative_score,
                 len(words),
@@ -127,26 +118,34 @@ class SentimentAnalyzer:
             sentiment = "neutro"
             confidence = 0.4 + min(len(words) / 50, 0.2)  # 0.4 a 0.6 baseado no tamanho
 
-        details = {
-            "positivas": list(set(positive_words)),
-            "negativas": list(set(negative_words)),
-            "total_palavras": len(words),
-            "palavras_sentimento": positive_count + negative_count,
-            "peso_positivo": round(positive_score, 2),
-            "peso_negativo": round(negative_score, 2),
-            "negacoes_detectadas": negations_count,
-            "intensificadores_detectados": intensifiers_count,
-        }
+        return SentimentResult(
+            sentiment, confidence, Details(result, len(words)) if full else None
+        )
 
-        return sentiment, confidence, details
+    def analyze_stream(self, chunks, mode="full"):
+        """Analisa um texto longo dado em trechos, com memória limitada
+
+        Usa sempre o motor por regras; details traz as palavras que mais
+        pesaram em vez de todas.
+        """
+        return score_chunks(chunks, self.lexicon, mode)
+
+    def analyze_columns(self, texts, words=True):
+        """Analisa os textos com o motor vetorizado e devolve colunas (arrays)"""
+        if self.model is not None:
+            return self.model.analyze_columns(texts, words)
+        if self.cache is not None:
+            return self.cache.analyze_columns(texts, self.lexicon, words)
+        return analyze_columns(texts, self.lexicon, words)
 
     def analyze_batch(self, texts):
         """Analisa uma lista de textos"""
         results = []
+        columns = self.analyze_columns(texts)
 
-        for i, text in enumerate(texts):
-            sentiment, confidence, details = self.analyze_sentiment(text)
-
+        for i, (text, (sentiment, confidence, details)) in enumerate(
+            zip(texts, iter_details(columns))
+        ):
             result = {
                 "index": i,
                 "text": text,
@@ -159,6 +158,22 @@ class SentimentAnalyzer:
 
         return results
 
+    def analyze_parallel(self, texts, workers=None, chunksize=None):
+        """Analisa em vários processos, gerando resultados na ordem da entrada"""
+        if self.model is not None:
+            # O modelo já prediz em lotes esparsos; roda no próprio processo
+            yield from self.analyze_batch(list(texts))
+            return
+        results = iter_parallel(texts, self.lexicon, workers, chunksize, self.cache)
+        for i, (text, sentiment, confidence, details) in enumerate(results):
+            yield {
+                "index": i,
+                "text": text,
+                "sentiment": sentiment,
+                "confidence": confidence,
+                "details": details,
+            }
+
     def get_sentiment_stats(self, results):
         """Calcula estatísticas dos sentimentos"""
         sentiments = [r["sentiment"] for r in results]
@@ -178,19 +193,27 @@ class SentimentAnalyzer:
 
     def get_word_frequency(self, results, min_length=4):
         """Obtém a frequência de palavras dos textos analisados"""
-        all_words = []
-
-        for result in results:
-            words = preprocess_text(result["text"])
-            # Filtra palavras muito comuns ou neutras
-            filtered_words = [
-                word
-                for word in words
+        counts = Counter(
+            chain.from_iterable(tokenize(result["text"]) for result in results)
+        )
+        return self.filter_word_counts(counts, min_length)
+
+    def filter_word_counts(self, counts, min_length=4):
+        """Filtra contagens token → frequência (ex.: TokenStore.token_counts)"""
+        neutral_words = self.lexicon.words_with_flag(NEUTRAL)
+
+        # Filtra palavras muito comuns ou neutras
+        return Counter(
+            {
+                word: count
+                for word, count in counts.items()
                 if len(word) >= min_length
-                and word not in NEUTRAL_WORDS
+                and word not in neutral_words
                 and word
                 not in {"para", "com", "uma", "como", "mais", "ser", "ter", "fazer"}
-            ]
-            all_words.extend(filtered_words)
+            }
+        )
 
-        return Counter(all_words)
+    def analyze_token_store(self, store, words=True):
+        """Reanalisa o corpus do TokenStore sem tokenizar (colunas + "id")"""
+        return store.analyze(self.lexicon, words)
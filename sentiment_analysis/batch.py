@@ -0,0 +1,290 @@
+"""
+Motor de análise em lote com NumPy
+
+Os tokens de todos os documentos viram ids inteiros de um vocabulário
+comum, numa matriz documento-token em formato CSR (ids + ponteiros de
+início de cada documento). Os pesos saem de vetores do léxico indexados
+pelo id; negação e intensificador são resolvidos com operações de array
+(última posição de controle via maximum.accumulate) e as somas por
+documento com bincount, que acumula na ordem dos tokens e por isso dá
+exatamente os mesmos floats do caminho escalar.
+"""
+
+from itertools import chain
+
+import numpy as np
+
+from .confidence import (
+    improved_confidence_array,
+    neutral_confidence_array,
+    technical_mask,
+    tie_confidence_array,
+)
+from .lexicon import (
+    NEGATION,
+    BREAKER,
+    POSITIVE,
+    NEGATIVE,
+    FLAGS,
+    INTENSIFIER,
+    resolve_lexicon,
+)
+from .scanner import NEGATION_WINDOW
+from .text_processor import tokenize
+
+COUNT_COLUMNS = [
+    "total_palavras",
+    "palavras_sentimento",
+    "negacoes_detectadas",
+    "intensificadores_detectados",
+]
+
+# Prefixo da palavra na lista: sem contexto, negada ou intensificada
+PREFIXES = ("", "não_", "muito_")
+
+
+def encode(documents, vocabulary=None):
+    """Matriz CSR dos documentos: (ids, ponteiros, vocabulário token → id)"""
+    vocabulary = {} if vocabulary is None else vocabulary
+    lengths = np.fromiter(map(len, documents), dtype=np.int64, count=len(documents))
+    indptr = np.zeros(len(documents) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+
+    tokens = list(chain.from_iterable(documents))
+    # Ids novos só para tokens inéditos; o mapeamento em si roda em C (map)
+    for token in dict.fromkeys(tokens):
+        if token not in vocabulary:
+            vocabulary[token] = len(vocabulary)
+    ids = np.fromiter(
+        map(vocabulary.__getitem__, tokens), dtype=np.int64, count=len(tokens)
+    )
+    return ids, indptr, vocabulary
+
+
+def lexicon_vectors(vocabulary, lexicon):
+    """Colunas do léxico indexadas pelo id: (positivo, negativo, flags, intens.)"""
+    get = lexicon.get
+    missing = (0, 0, 0, 1.0)
+    entries = [get(token) or missing for token in vocabulary]
+    size = len(entries)
+    return (
+        np.fromiter((e[POSITIVE] for e in entries), dtype=np.float64, count=size),
+        np.fromiter((e[NEGATIVE] for e in entries), dtype=np.float64, count=size),
+        np.fromiter((e[FLAGS] for e in entries), dtype=np.int64, count=size),
+        np.fromiter((e[INTENSIFIER] for e in entries), dtype=np.float64, count=size),
+    )
+
+
+def _phrase_starts(ids, indptr, vocabulary, lexicon):
+    """Posições com um par (início, continuação) de expressão da trie"""
+    trie = lexicon.trie
+    empty = np.empty(0, dtype=np.int64)
+    if not trie or len(ids) < 2:
+        return empty
+
+    size = len(vocabulary)
+    pairs = [
+        vocabulary[first] * size + vocabulary[second]
+        for first, node in trie.items()
+        if first in vocabulary
+        for second in node
+        if second in vocabulary
+    ]
+    if not pairs:
+        return empty
+
+    hits = np.flatnonzero(np.isin(ids[:-1] * size + ids[1:], pairs))
+    # O par não pode atravessar a fronteira entre documentos
+    docs = np.searchsorted(indptr, hits, side="right") - 1
+    return hits[hits + 1 < indptr[docs + 1]]
+
+
+def _units(documents, ids, indptr, vocabulary, lexicon):
+    """Matriz CSR de unidades: cada expressão casada vira um único id
+
+    Só as posições candidatas passam pela trie, da esquerda para a
+    direita, pulando as que caem dentro de uma expressão já casada (o
+    mesmo casamento guloso da varredura escalar).
+    """
+    starts = _phrase_starts(ids, indptr, vocabulary, lexicon)
+    if not len(starts):
+        return ids, indptr
+
+    units = ids.copy()
+    keep = np.ones(len(ids), dtype=bool)
+    offsets = indptr.tolist()
+    docs = np.searchsorted(indptr, starts, side="right") - 1
+    consumed = 0
+    for position, doc in zip(starts.tolist(), docs.tolist()):
+        if position < consumed:
+            continue
+        match = lexicon.match_phrase(documents[doc], position - offsets[doc])
+        if match is None:
+            continue
+        end, label, _ = match
+        units[position] = vocabulary.setdefault(label, len(vocabulary))
+        consumed = end + offsets[doc]
+        keep[position + 1 : consumed] = False
+
+    count = len(documents)
+    doc = np.repeat(np.arange(count), np.diff(indptr))
+    unit_ptr = np.zeros_like(indptr)
+    np.cumsum(np.bincount(doc[keep], minlength=count), out=unit_ptr[1:])
+    return units[keep], unit_ptr
+
+
+def _word_lists(count, doc, units, prefix, labels):
+    """Listas de palavras (sem repetição) por documento, na ordem do texto"""
+    codes = units * len(PREFIXES) + prefix
+    # Primeira ocorrência de cada (documento, palavra), mantendo a ordem
+    _, first = np.unique(doc * (codes.max(initial=0) + 1) + codes, return_index=True)
+    first.sort()
+    doc, codes = doc[first], codes[first]
+
+    # Cada combinação (unidade, prefixo) vira texto uma vez só
+    distinct, inverse = np.unique(codes, return_inverse=True)
+    names = [
+        PREFIXES[code % len(PREFIXES)] + labels[code // len(PREFIXES)]
+        for code in distinct.tolist()
+    ]
+    words = [names[i] for i in inverse.tolist()]
+    bounds = np.searchsorted(doc, np.arange(count + 1)).tolist()
+    return [words[bounds[i] : bounds[i + 1]] for i in range(count)]
+
+
+def analyze_tokens(documents, lexicon=None, words=True):
+    """Analisa listas de tokens e devolve colunas (arrays) por documento
+
+    Colunas: sentimento, confianca, peso_positivo, peso_negativo, os
+    contadores de COUNT_COLUMNS e, com words=True, positivas/negativas.
+    """
+    ids, indptr, vocabulary = encode(documents)
+    return analyze_encoded(ids, indptr, vocabulary, documents, lexicon, words)
+
+
+def analyze_encoded(ids, indptr, vocabulary, documents, lexicon=None, words=True):
+    """Analisa uma matriz CSR já codificada (ids, ponteiros, vocabulário)
+
+    documents só é consultado (documents[i] → tokens) nos documentos com
+    candidatos a expressão; o vocabulário ganha os rótulos das expressões
+    casadas, então passe uma cópia se ele for compartilhado.
+    """
+    lexicon = resolve_lexicon(lexicon)
+    count = len(indptr) - 1
+    units, unit_ptr = _units(documents, ids, indptr, vocabulary, lexicon)
+    positive, negative, flags, intensifiers = lexicon_vectors(vocabulary, lexicon)
+
+    total = np.diff(indptr)
+    technical = technical_mask(vocabulary)
+    token_doc = np.repeat(np.arange(count), total)
+    technical_count = np.bincount(token_doc[technical[ids]], minlength=count)
+
+    # Documento e posição de início de cada unidade
+    doc = np.repeat(np.arange(count), np.diff(unit_ptr))
+    position = np.arange(len(units))
+    start = unit_ptr[doc]
+    unit_flags = flags[units]
+
+    # Última negação/quebra antes de cada unidade, dentro do mesmo documento
+    control = np.where(unit_flags & (NEGATION | BREAKER) != 0, position, -1)
+    last = np.empty_like(control)
+    last[:1] = -1
+    np.maximum.accumulate(control[:-1], out=last[1:])
+    negated = (
+        (last >= start)
+        & (position - last <= NEGATION_WINDOW)
+        & (unit_flags[last] & NEGATION != 0)
+    )
+
+    # Intensificador vem da unidade anterior do mesmo documento
+    intensifier = np.ones(len(units))
+    intensifier[1:] = intensifiers[units[:-1]]
+    intensifier[position == start] = 1.0
+
+    positive_weight = positive[units] * intensifier
+    negative_weight = negative[units] * intensifier
+    is_positive = positive_weight > 0
+    is_negative = ~is_positive & (negative_weight > 0)
+    to_positive = np.where(negated, is_negative, is_positive)
+    to_negative = np.where(negated, is_positive, is_negative)
+
+    positive_score = np.bincount(
+        doc[to_positive],
+        weights=np.where(negated, negative_weight, positive_weight)[to_positive],
+        minlength=count,
+    ).astype(np.float64, copy=False)
+    negative_score = np.bincount(
+        doc[to_negative],
+        weights=np.where(negated, positive_weight, negative_weight)[to_negative],
+        minlength=count,
+    ).astype(np.float64, copy=False)
+    positive_count = np.bincount(doc[to_positive], minlength=count)
+    negative_count = np.bincount(doc[to_negative], minlength=count)
+
+    neutral = (positive_score == 0) & (negative_score == 0)
+    tie = ~neutral & (positive_score == negative_score)
+    sentiment = np.select(
+        [neutral | tie, positive_score > negative_score],
+        ["neutro", "positivo"],
+        "negativo",
+    ).astype(object)
+    confidence = np.select(
+        [neutral, tie],
+        [neutral_confidence_array(total, technical_count), tie_confidence_array(total)],
+        improved_confidence_array(
+            positive_count, negative_count, positive_score, negative_score, total
+        ),
+    )
+
+    columns = {
+        "sentimento": sentiment,
+        "confianca": confidence,
+        "peso_positivo": positive_score,
+        "peso_negativo": negative_score,
+        "total_palavras": total,
+        "palavras_sentimento": positive_count + negative_count,
+        "negacoes_detectadas": np.bincount(doc[negated], minlength=count),
+        "intensificadores_detectados": np.bincount(
+            doc[intensifier != 1.0], minlength=count
+        ),
+    }
+
+    if words:
+        labels = list(vocabulary)
+        prefix = np.where(negated, 1, np.where(intensifier > 1.0, 2, 0))
+        for column, mask in (("positivas", to_positive), ("negativas", to_negative)):
+            columns[column] = _word_lists(
+                count, doc[mask], units[mask], prefix[mask], labels
+            )
+
+    return columns
+
+
+def analyze_columns(texts, lexicon=None, words=True):
+    """Tokeniza e analisa os textos em lote (ver analyze_tokens)"""
+    return analyze_tokens([tokenize(text) for text in texts], lexicon, words)
+
+
+def iter_details(columns):
+    """Gera (sentimento, confiança, details) no formato de analyze_sentiment"""
+    rows = zip(
+        columns["sentimento"].tolist(),
+        columns["confianca"].tolist(),
+        columns["positivas"],
+        columns["negativas"],
+        columns["peso_positivo"].tolist(),
+        columns["peso_negativo"].tolist(),
+        *(columns[name].tolist() for name in COUNT_COLUMNS),
+    )
+    for sentiment, confidence, pos, neg, pos_w, neg_w, *counts in rows:
+        total, hits, negations, intensifiers = counts
+        yield sentiment, confidence, {
+            "positivas": pos,
+            "negativas": neg,
+            "total_palavras": total,
+            "palavras_sentimento": hits,
+            "peso_positivo": round(pos_w, 2),
+            "peso_negativo": round(neg_w, 2),
+            "negacoes_detectadas": negations,
+            "intensificadores_detectados": intensifiers,
+        }
@@ -1,7 +1,54 @@
 """
 Módulo de cálculo de confiança para análise de sentimento
+
+As funções *_array são as mesmas fórmulas aplicadas a arrays NumPy (um
+elemento por documento), com resultados idênticos às versões escalares.
 """
 
+import numpy as np
+
+# Palavras técnicas/neutras que indicam texto informativo (mais confiança na neutralidade)
+TECHNICAL_WORDS = frozenset(
+    {
+        "sistema",
+        "tecnologia",
+        "projeto",
+        "dados",
+        "informação",
+        "relatório",
+        "apresenta",
+        "desenvolve",
+        "implementa",
+        "utiliza",
+        "funciona",
+        "processo",
+        "método",
+        "análise",
+        "estudo",
+        "pesquisa",
+        "resultado",
+        "modelo",
+        "algoritmo",
+        "software",
+        "hardware",
+        "digital",
+        "eletrônico",
+        "computacional",
+        "secretaria",
+        "governo",
+        "estado",
+        "municipal",
+        "público",
+        "serviço",
+        "piauí",
+        "brasil",
+        "nacional",
+        "federal",
+        "estadual",
+        "regional",
+    }
+)
+
 
 def calculate_improved_confidence(
     positive_count,
@@ -61,50 +108,16 @@ def calculate_neutral_confidence(words):
     if not words:
         return 0.1
 
-    word_count = len(words)
+    # Conta palavras técnicas
+    technical_count = sum(1 for word in words if word in TECHNICAL_WORDS)
+    return neutral_confidence_from_counts(len(words), technical_count)
 
-    # Palavras técnicas/neutras que indicam texto informativo (mais confiança na neutralidade)
-    technical_words = {
-        "sistema",
-        "tecnologia",
-        "projeto",
-        "dados",
-        "informação",
-        "relatório",
-        "apresenta",
-        "desenvolve",
-        "implementa",
-        "utiliza",
-        "funciona",
-        "processo",
-        "método",
-        "análise",
-        "estudo",
-        "pesquisa",
-        "resultado",
-        "modelo",
-        "algoritmo",
-        "software",
-        "hardware",
-        "digital",
-        "eletrônico",
-        "computacional",
-        "secretaria",
-        "governo",
-        "estado",
-        "municipal",
-        "público",
-        "serviço",
-        "piauí",
-        "brasil",
-        "nacional",
-        "federal",
-        "estadual",
-        "regional",
-    }
 
-    # Conta palavras técnicas
-    technical_count = sum(1 for word in words if word in technical_words)
+def neutral_confidence_from_counts(word_count, technical_count):
+    """Confiança de neutros a partir dos contadores (total e palavras técnicas)"""
+    if word_count == 0:
+        return 0.1
+
     technical_ratio = technical_count / word_count
 
     # Confiança base por tamanho do texto
@@ -125,3 +138,49 @@ def calculate_neutral_confidence(words):
 
     # Entre 0.15 e 0.7 para neutros
     return max(0.15, min(final_confidence, 0.7))
+
+
+def technical_mask(vocabulary):
+    """Array booleano por id do vocabulário: o token é palavra técnica?"""
+    return np.fromiter(
+        (token in TECHNICAL_WORDS for token in vocabulary),
+        dtype=bool,
+        count=len(vocabulary),
+    )
+
+
+def improved_confidence_array(
+    positive_count, negative_count, positive_weight, negative_weight, total_words
+):
+    """calculate_improved_confidence aplicada a arrays"""
+    words = positive_count + negative_count
+    weight = positive_weight + negative_weight
+    has_weight = weight > 0
+    safe_weight = np.where(has_weight, weight, 1.0)
+
+    density = words / np.maximum(total_words, 1)
+    ratio = np.maximum(positive_weight, negative_weight) / safe_weight
+    base = np.where(has_weight, 0.35 + (ratio - 0.5) * 0.6, 0.35)
+    density_bonus = np.minimum(density * 0.3, 0.15)
+    average = weight / np.maximum(words, 1)
+    weight_bonus = np.where(words > 0, np.minimum((average - 1) * 0.05, 0.1), 0)
+    clarity = np.abs(positive_weight - negative_weight) / safe_weight
+    clarity_bonus = np.where(has_weight, clarity * 0.1, 0)
+
+    final = base + density_bonus + weight_bonus + clarity_bonus
+    return np.where(words == 0, 0.1, np.maximum(0.2, np.minimum(final, 0.85)))
+
+
+def neutral_confidence_array(word_count, technical_count):
+    """neutral_confidence_from_counts aplicada a arrays"""
+    base = np.select(
+        [word_count < 3, word_count < 8, word_count < 15], [0.15, 0.25, 0.35], 0.45
+    )
+    ratio = technical_count / np.maximum(word_count, 1)
+    final = base + np.minimum(ratio * 0.3, 0.25)
+    return np.where(word_count == 0, 0.1, np.maximum(0.15, np.minimum(final, 0.7)))
+
+
+def tie_confidence_array(word_count):
+    """Confiança do empate entre scores (0.4 a 0.6 pelo tamanho), em arrays"""
+    return 0.4 + np.minimum(word_count / 50, 0.2)
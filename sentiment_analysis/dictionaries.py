@@ -30,6 +30,9 @@ NEGATION_BREAKERS = {
     "mesmo assim",
     "apesar",
     "embora",
+    # "não apenas X" não nega X
+    "não apenas",
+    "não somente",
 }
 
 # Intensificadores (multiplicam o peso das palavras)
@@ -64,6 +67,8 @@ INTENSIFIERS = {
     "quase": 0.9,
     "meio": 0.8,
     "parcialmente": 0.7,
+    # Expressões
+    "cada vez mais": 1.3,
 }
 
 # Palavras positivas com pesos (quanto maior o peso, mais forte a palavra)
@@ -443,3 +448,28 @@ NEUTRAL_WORDS = {
     "inteligência",
     "digital",
 }
+
+# Expressões de várias palavras, casadas como uma unidade antes das palavras
+# isoladas. O tokenizador descarta palavras de até 2 letras, então cada
+# expressão precisa de ao menos duas palavras maiores ("falta de" sozinha
+# viraria a palavra "falta").
+POSITIVE_EXPRESSIONS = {
+    "sem dúvida": 1,
+    "sem dúvidas": 1,
+    "sem problemas": 1,
+    "vale a pena": 2,
+    "deu certo": 2,
+    "dar certo": 2,
+    "saiu do papel": 2,
+}
+
+NEGATIVE_EXPRESSIONS = {
+    "falta de transparência": 2,
+    "falta de investimento": 2,
+    "falta de recursos": 2,
+    "corte de gastos": 2,
+    "cortes de gastos": 2,
+    "perda de empregos": 3,
+    "vazamento de dados": 3,
+    "deixa a desejar": 2,
+}
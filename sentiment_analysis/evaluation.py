@@ -0,0 +1,131 @@
+"""
+Avaliação de variantes do léxico sobre o mesmo corpus
+
+O corpus é tokenizado e codificado (matriz CSR de ids) uma única vez;
+cada variante só monta os seus vetores do léxico, indexados pelo mesmo
+vocabulário, e roda as operações de array do motor em lote. O custo de
+N variantes fica perto do de uma análise, já que a tokenização domina.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .batch import analyze_encoded, encode
+from .lexicon import resolve_lexicon
+from .text_processor import tokenize
+
+LABELS = ["positivo", "negativo", "neutro"]
+
+
+class Evaluation:
+    """Resultados de cada variante: distribuições, concordância e diferenças"""
+
+    def __init__(self, columns, doc_ids=None):
+        """Recebe {variante: colunas do motor em lote} e os ids dos documentos"""
+        self.columns = columns
+        self.names = list(columns)
+        size = len(next(iter(columns.values()))["sentimento"]) if columns else 0
+        self.doc_ids = np.arange(size) if doc_ids is None else np.asarray(doc_ids)
+
+    def __len__(self):
+        return len(self.doc_ids)
+
+    def labels(self):
+        """Rótulo de cada documento (linhas) por variante (colunas)"""
+        return pd.DataFrame(
+            {name: self.columns[name]["sentimento"] for name in self.names},
+            index=pd.Index(self.doc_ids, name="id"),
+        )
+
+    def distributions(self, normalize=False):
+        """Contagem (ou fração) de cada rótulo por variante"""
+        counts = pd.DataFrame(
+            {
+                name: pd.Series(self.columns[name]["sentimento"])
+                .value_counts()
+                .reindex(LABELS, fill_value=0)
+                for name in self.names
+            }
+        ).T
+        if normalize and len(self):
+            return counts / len(self)
+        return counts
+
+    def agreement(self):
+        """Fração de documentos com o mesmo rótulo em cada par de variantes"""
+        labels = {name: self.columns[name]["sentimento"] for name in self.names}
+        matrix = [
+            [
+                float(np.mean(labels[a] == labels[b])) if len(self) else 1.0
+                for b in self.names
+            ]
+            for a in self.names
+        ]
+        return pd.DataFrame(matrix, index=self.names, columns=self.names)
+
+    def confusion(self, base, other):
+        """Matriz de confusão dos rótulos: base (linhas) x other (colunas)"""
+        return pd.crosstab(
+            pd.Categorical(self.columns[base]["sentimento"], LABELS),
+            pd.Categorical(self.columns[other]["sentimento"], LABELS),
+            rownames=[base],
+            colnames=[other],
+            dropna=False,
+        )
+
+    def diffs(self, base, other):
+        """Documentos cujo rótulo muda de base para other"""
+        a, b = self.columns[base], self.columns[other]
+        changed = np.flatnonzero(a["sentimento"] != b["sentimento"])
+        return pd.DataFrame(
+            {
+                "id": self.doc_ids[changed],
+                f"sentimento_{base}": a["sentimento"][changed],
+                f"sentimento_{other}": b["sentimento"][changed],
+                f"confianca_{base}": a["confianca"][changed],
+                f"confianca_{other}": b["confianca"][changed],
+                "delta_positivo": b["peso_positivo"][changed]
+                - a["peso_positivo"][changed],
+                "delta_negativo": b["peso_negativo"][changed]
+                - a["peso_negativo"][changed],
+            }
+        )
+
+
+def _named(lexicons):
+    # Aceita {nome: léxico} ou uma sequência (nomeada pela versão do léxico)
+    if isinstance(lexicons, dict):
+        return {name: resolve_lexicon(lexicon) for name, lexicon in lexicons.items()}
+    named = {}
+    for lexicon in map(resolve_lexicon, lexicons):
+        name = lexicon.version
+        while name in named:
+            name += "'"
+        named[name] = lexicon
+    return named
+
+
+def evaluate_encoded(ids, indptr, vocabulary, documents, lexicons, doc_ids=None):
+    """Avalia as variantes sobre uma matriz CSR já codificada"""
+    columns = {
+        # Cada variante recebe uma cópia: os rótulos de expressão são por léxico
+        name: analyze_encoded(
+            ids, indptr, dict(vocabulary), documents, lexicon, words=False
+        )
+        for name, lexicon in _named(lexicons).items()
+    }
+    return Evaluation(columns, doc_ids)
+
+
+def evaluate(texts, lexicons, doc_ids=None):
+    """Tokeniza os textos uma vez e avalia todas as variantes do léxico"""
+    documents = [tokenize(str(text)) for text in texts]
+    ids, indptr, vocabulary = encode(documents)
+    return evaluate_encoded(ids, indptr, vocabulary, documents, lexicons, doc_ids)
+
+
+def evaluate_store(store, lexicons):
+    """Avalia as variantes direto do TokenStore (sem tokenizar)"""
+    return evaluate_encoded(
+        *store.encoded(), store.documents(), lexicons, store.doc_ids
+    )
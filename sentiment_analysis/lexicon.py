@@ -0,0 +1,345 @@
+"""
+Léxico compilado: uma única tabela token → entrada
+
+Junta os dicionários de palavras positivas, negativas, neutras, negações,
+quebras de negação e intensificadores numa tabela só, consultada uma vez
+por token. Expressões de várias palavras ficam numa trie; o primeiro token
+de cada expressão recebe a flag PHRASE, então só esses tokens disparam a
+busca na trie. A tabela pode ser gravada num artefato binário versionado
+que carrega mais rápido do que importar o módulo de dicionários.
+"""
+
+import hashlib
+import json
+import os
+import struct
+from array import array
+
+from . import dictionaries
+
+# Flags de contexto de cada entrada
+NEGATION = 1
+BREAKER = 2
+NEUTRAL = 4
+PHRASE = 8
+
+# Índices da entrada (peso positivo, peso negativo, flags, intensificador)
+POSITIVE, NEGATIVE, FLAGS, INTENSIFIER = range(4)
+
+MAGIC = b"SALX"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sHII32s")
+# Marca de fim de expressão dentro da trie
+_END = None
+
+# Campos do arquivo JSON de léxico: parâmetros de compile_lexicon e o
+# dicionário do pacote usado quando o campo não aparece no arquivo
+SOURCE_FIELDS = {
+    "positive": "POSITIVE_WORDS",
+    "negative": "NEGATIVE_WORDS",
+    "neutral": "NEUTRAL_WORDS",
+    "negations": "NEGATION_WORDS",
+    "breakers": "NEGATION_BREAKERS",
+    "intensifiers": "INTENSIFIERS",
+    "positive_expressions": "POSITIVE_EXPRESSIONS",
+    "negative_expressions": "NEGATIVE_EXPRESSIONS",
+}
+# Campos que são conjuntos de palavras (os demais mapeiam palavra → peso)
+_WORD_SETS = {"neutral", "negations", "breakers"}
+
+
+def _canonical(key, entry):
+    positive, negative, flags, intensifier = entry
+    return (
+        f"{key}\t{float(positive)!r}\t{float(negative)!r}\t{flags}\t"
+        f"{float(intensifier)!r}\n"
+    )
+
+
+def _digest(table, phrases):
+    """Hash SHA-256 do conteúdo canônico da tabela e das expressões"""
+    h = hashlib.sha256()
+    for token in sorted(table):
+        h.update(_canonical(token, table[token]).encode("utf-8"))
+    for tokens in sorted(phrases):
+        label, entry = phrases[tokens]
+        key = " ".join(tokens) + "\t" + label
+        h.update(_canonical(key, entry).encode("utf-8"))
+    return h.digest()
+
+
+def _write_columns(f, entries):
+    for column in (POSITIVE, NEGATIVE, INTENSIFIER):
+        f.write(array("d", [float(e[column]) for e in entries]).tobytes())
+    f.write(array("B", [e[FLAGS] for e in entries]).tobytes())
+
+
+def _read_columns(data, offset, count):
+    columns = []
+    for _ in range(3):
+        column = array("d")
+        column.frombytes(data[offset : offset + 8 * count])
+        columns.append(column)
+        offset += 8 * count
+    flags = array("B")
+    flags.frombytes(data[offset : offset + count])
+    positive, negative, intensifier = columns
+    return list(zip(positive, negative, flags, intensifier)), offset + count
+
+
+class Lexicon:
+    """Tabela token → (peso positivo, peso negativo, flags, intensificador)"""
+
+    def __init__(self, table, phrases=None, digest=None):
+        """Recebe a tabela e as expressões compiladas {tokens: (rótulo, entrada)}"""
+        self.table = table
+        self.phrases = phrases or {}
+        self.digest = digest or _digest(table, self.phrases)
+
+        self.trie = {}
+        self.labels = {}
+        for tokens, (label, entry) in self.phrases.items():
+            node = self.trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[_END] = (label, entry)
+            self.labels[label] = entry
+
+    @property
+    def version(self):
+        """Identificador curto do conteúdo do léxico"""
+        return self.digest.hex()[:12]
+
+    def __len__(self):
+        return len(self.table)
+
+    def __contains__(self, token):
+        return token in self.table
+
+    def get(self, token):
+        """Entrada do token (ou do rótulo de uma expressão) ou None"""
+        entry = self.table.get(token)
+        return self.labels.get(token) if entry is None else entry
+
+    def match_phrase(self, words, start):
+        """Maior expressão que começa em words[start]: (fim, rótulo, entrada)"""
+        node = self.trie.get(words[start])
+        best = None
+        end = start + 1
+        while node is not None:
+            if _END in node:
+                best = (end, *node[_END])
+            if end == len(words):
+                break
+            node = node.get(words[end])
+            end += 1
+        return best
+
+    def words_with_flag(self, flag):
+        """Conjunto de tokens que têm a flag informada"""
+        return {token for token, entry in self.table.items() if entry[FLAGS] & flag}
+
+    def save(self, path):
+        """Grava o artefato binário: cabeçalho, tokens, colunas e expressões"""
+        tokens = sorted(self.table)
+        encoded = [token.encode("utf-8") for token in tokens]
+        phrases = sorted(self.phrases)
+        # Uma linha "tokens separados por espaço<TAB>rótulo" por expressão
+        phrase_blob = "".join(
+            " ".join(key) + "\t" + self.phrases[key][0] + "\n" for key in phrases
+        ).encode("utf-8")
+
+        with open(path, "wb") as f:
+            f.write(
+                HEADER.pack(
+                    MAGIC, FORMAT_VERSION, len(tokens), len(phrases), self.digest
+                )
+            )
+            f.write(array("I", [len(b) for b in encoded]).tobytes())
+            f.write(b"".join(encoded))
+            _write_columns(f, [self.table[token] for token in tokens])
+            f.write(struct.pack("<I", len(phrase_blob)))
+            f.write(phrase_blob)
+            _write_columns(f, [self.phrases[key][1] for key in phrases])
+
+    @classmethod
+    def load(cls, path):
+        """Carrega um artefato gravado por save()"""
+        with open(path, "rb") as f:
+            data = f.read()
+
+        magic, version, count, phrase_count, digest = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"Arquivo de léxico inválido: {path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Versão de léxico não suportada: {version}")
+
+        offset = HEADER.size
+        lengths = array("I")
+        lengths.frombytes(data[offset : offset + 4 * count])
+        offset += 4 * count
+
+        tokens = []
+        for length in lengths:
+            tokens.append(data[offset : offset + length].decode("utf-8"))
+            offset += length
+        entries, offset = _read_columns(data, offset, count)
+
+        (blob_size,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        lines = data[offset : offset + blob_size].decode("utf-8").splitlines()
+        offset += blob_size
+        phrase_entries, offset = _read_columns(data, offset, phrase_count)
+
+        phrases = {}
+        for line, entry in zip(lines, phrase_entries):
+            key, label = line.split("\t")
+            phrases[tuple(key.split(" "))] = (label, entry)
+
+        return cls(dict(zip(tokens, entries)), phrases, digest)
+
+
+def compile_lexicon(
+    positive=None,
+    negative=None,
+    neutral=None,
+    negations=None,
+    breakers=None,
+    intensifiers=None,
+    positive_expressions=None,
+    negative_expressions=None,
+):
+    """Compila os dicionários (os do módulo, por padrão) numa única tabela"""
+    # Importação local: text_processor depende deste módulo
+    from .text_processor import tokenize
+
+    def pick(value, default):
+        return default if value is None else value
+
+    weights = [
+        (POSITIVE, pick(positive, dictionaries.POSITIVE_WORDS)),
+        (POSITIVE, pick(positive_expressions, dictionaries.POSITIVE_EXPRESSIONS)),
+        (NEGATIVE, pick(negative, dictionaries.NEGATIVE_WORDS)),
+        (NEGATIVE, pick(negative_expressions, dictionaries.NEGATIVE_EXPRESSIONS)),
+        (INTENSIFIER, pick(intensifiers, dictionaries.INTENSIFIERS)),
+    ]
+    flags = [
+        (NEGATION, pick(negations, dictionaries.NEGATION_WORDS)),
+        (BREAKER, pick(breakers, dictionaries.NEGATION_BREAKERS)),
+        (NEUTRAL, pick(neutral, dictionaries.NEUTRAL_WORDS)),
+    ]
+
+    table = {}
+    phrases = {}
+
+    def entry_for(key):
+        """Entrada mutável da palavra ou expressão (None se nada sobrar)"""
+        if " " not in key.strip():
+            return table.setdefault(key, [0, 0, 0, 1.0])
+        tokens = tuple(tokenize(key))
+        if not tokens:
+            return None
+        if len(tokens) == 1:
+            return table.setdefault(tokens[0], [0, 0, 0, 1.0])
+        return phrases.setdefault(tokens, [key, [0, 0, 0, 1.0]])[1]
+
+    for index, source in weights:
+        for key, weight in source.items():
+            entry = entry_for(key)
+            if entry is not None:
+                entry[index] = weight
+    for flag, source in flags:
+        for key in source:
+            entry = entry_for(key)
+            if entry is not None:
+                entry[FLAGS] |= flag
+
+    # O primeiro token de cada expressão dispara a busca na trie
+    for tokens in phrases:
+        table.setdefault(tokens[0], [0, 0, 0, 1.0])[FLAGS] |= PHRASE
+
+    return Lexicon(
+        {token: tuple(entry) for token, entry in table.items()},
+        {tokens: (label, tuple(entry)) for tokens, (label, entry) in phrases.items()},
+    )
+
+
+_default = None
+
+
+def default_lexicon():
+    """Léxico compilado dos dicionários do pacote (compilado uma vez)"""
+    global _default
+    if _default is None:
+        _default = compile_lexicon()
+    return _default
+
+
+def load_lexicon_file(path):
+    """Compila o léxico de um arquivo JSON com os campos de SOURCE_FIELDS
+
+    Campos ausentes usam os dicionários do pacote; campos presentes
+    substituem o dicionário inteiro (como em compile_lexicon).
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"Arquivo de léxico inválido: {path}")
+
+    unknown = sorted(set(data) - SOURCE_FIELDS.keys())
+    if unknown:
+        raise ValueError(f"Campos desconhecidos no léxico {path}: {unknown}")
+    fields = {}
+    for field, value in data.items():
+        if field in _WORD_SETS:
+            if not isinstance(value, list) or not all(
+                isinstance(word, str) for word in value
+            ):
+                raise ValueError(f"{field} deve ser uma lista de palavras: {path}")
+            fields[field] = set(value)
+        else:
+            if not isinstance(value, dict) or not all(
+                isinstance(weight, (int, float)) and not isinstance(weight, bool)
+                for weight in value.values()
+            ):
+                raise ValueError(f"{field} deve mapear palavra → peso: {path}")
+            fields[field] = value
+    return compile_lexicon(**fields)
+
+
+def save_lexicon_file(path, **fields):
+    """Grava um arquivo JSON de léxico de forma atômica
+
+    Sem campos, exporta os dicionários do pacote (ponto de partida para
+    edição). O arquivo é escrito ao lado e trocado com os.replace, então
+    quem lê nunca encontra um JSON pela metade.
+    """
+    unknown = sorted(set(fields) - SOURCE_FIELDS.keys())
+    if unknown:
+        raise ValueError(f"Campos desconhecidos no léxico: {unknown}")
+    if not fields:
+        fields = {
+            field: getattr(dictionaries, name) for field, name in SOURCE_FIELDS.items()
+        }
+    data = {
+        field: sorted(value) if field in _WORD_SETS else dict(value)
+        for field, value in fields.items()
+    }
+
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(temporary, path)
+
+
+def resolve_lexicon(lexicon=None):
+    """Aceita um Lexicon, o caminho de um artefato (ou .json) ou None (padrão)"""
+    if lexicon is None:
+        return default_lexicon()
+    if isinstance(lexicon, Lexicon):
+        return lexicon
+    if str(lexicon).endswith(".json"):
+        return load_lexicon_file(lexicon)
+    return Lexicon.load(lexicon)
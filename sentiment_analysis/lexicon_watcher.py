@@ -0,0 +1,102 @@
+"""
+Léxico externo recarregado a quente, em snapshots versionados
+
+O arquivo (JSON ou artefato binário) é verificado por polling (mtime e
+tamanho) no máximo a cada interval segundos, sem thread própria. Uma
+mudança é compilada por inteiro num Lexicon novo, que só então substitui
+o atual numa única troca de referência: quem chamou current() antes
+segue com o snapshot antigo, completo, e nenhuma sessão vê um léxico
+pela metade. Arquivo inválido (ou ainda sendo gravado) mantém o snapshot
+atual e é tentado de novo no próximo polling. Sem o arquivo vale o léxico
+padrão: criá-lo depois (ou removê-lo) também é uma troca.
+
+Os snapshots não são alterados depois de criados; a versão (hash do
+conteúdo) é a chave dos caches de resultado, e a troca pendente fica
+registrada como o par (antigo, novo) para a reanálise seletiva.
+"""
+
+import os
+import threading
+import time
+
+from .lexicon import default_lexicon, resolve_lexicon
+
+
+class LexiconWatcher:
+    """Snapshot atual do léxico de um arquivo, trocado quando o arquivo muda"""
+
+    def __init__(self, path, interval=2.0):
+        """Carrega o arquivo (ou o léxico padrão, se inválido) e passa a observá-lo"""
+        self.path = path
+        self.interval = interval
+        self.error = None
+        self._lock = threading.Lock()
+        self._change = None
+        self._stamp = None
+        self._snapshot = default_lexicon()
+        self._checked = float("-inf")
+        self.refresh()
+        # A carga inicial não conta como troca
+        self._change = None
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def current(self):
+        """Snapshot em uso (verifica o arquivo se o intervalo já passou)"""
+        if time.monotonic() - self._checked >= self.interval:
+            self.refresh()
+        return self._snapshot
+
+    @property
+    def version(self):
+        """Versão do snapshot em uso"""
+        return self.current().version
+
+    def refresh(self):
+        """Verifica o arquivo agora; True se o snapshot foi trocado"""
+        # Só uma thread recarrega; as demais seguem com o snapshot atual
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._checked = time.monotonic()
+            try:
+                stamp = self._stat()
+            except OSError as error:
+                self.error = str(error)
+                return False
+            if stamp == self._stamp:
+                return False
+
+            try:
+                lexicon = (
+                    default_lexicon() if stamp is None else resolve_lexicon(self.path)
+                )
+            except (OSError, ValueError) as error:
+                # Mantém o snapshot; o mesmo arquivo é tentado de novo depois
+                self.error = str(error)
+                return False
+            self._stamp = stamp
+            self.error = None
+
+            previous = self._snapshot
+            if lexicon.version == previous.version:
+                return False
+            self._snapshot = lexicon
+            # Trocas seguidas não consumidas viram uma só: o diff do
+            # primeiro snapshot antigo para o mais novo cobre todas
+            first = previous if self._change is None else self._change[0]
+            self._change = (first, lexicon)
+            return True
+        finally:
+            self._lock.release()
+
+    def pop_change(self):
+        """Troca (antigo, novo) ainda não consumida, ou None"""
+        with self._lock:
+            change, self._change = self._change, None
+        return change
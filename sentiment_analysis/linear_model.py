@@ -0,0 +1,281 @@
+"""
+Classificador linear sobre atributos com hashing (backend alternativo)
+
+Regressão logística multinomial em NumPy puro: unigramas e bigramas
+viram colunas por CRC32 módulo n_features (memória fixa, sem
+vocabulário), com sinal pelo bit mais alto para compensar colisões e
+linhas normalizadas (L2). O treino usa minilotes com Adagrad e
+regularização L2 só nas colunas tocadas; a predição é uma multiplicação
+esparsa em lote (bincount por classe). Os rótulos podem vir de dados
+anotados ou do próprio léxico (bootstrap_labels).
+
+Devolve o mesmo contrato do analisador por regras: (sentimento,
+confiança, details) e as colunas do motor em lote. peso_positivo e
+peso_negativo são as probabilidades das classes; as listas de palavras
+trazem os unigramas que mais puxam para cada lado.
+"""
+
+import zlib
+
+import numpy as np
+
+from .analyzer import MODES
+from .batch import analyze_columns, encode, iter_details
+from .results import SentimentResult
+from .text_processor import tokenize
+
+CLASSES = ("positivo", "negativo", "neutro")
+N_FEATURES = 2**18
+# Palavras listadas em positivas/negativas por documento
+TOP_WORDS = 5
+
+
+def _hash(token):
+    return zlib.crc32(token.encode("utf-8"))
+
+
+class HashedFeatures:
+    """Matriz esparsa documento x atributo em CSR (linhas, colunas, valores)"""
+
+    def __init__(self, rows, columns, values, count, words):
+        self.rows = rows
+        self.columns = columns
+        self.values = values
+        self.count = count
+        # Unigramas por posição: (linha, id, coluna, sinal, vocabulário)
+        self.words = words
+
+    def __len__(self):
+        return self.count
+
+    def slice(self, start, stop):
+        """Documentos [start, stop) como uma nova matriz (sem as palavras)"""
+        lo, hi = np.searchsorted(self.rows, [start, stop])
+        return HashedFeatures(
+            self.rows[lo:hi] - start,
+            self.columns[lo:hi],
+            self.values[lo:hi],
+            stop - start,
+            None,
+        )
+
+
+def hash_features(documents, n_features=N_FEATURES, ngrams=2):
+    """Atributos com hashing de listas de tokens (unigramas e bigramas)"""
+    count = len(documents)
+    ids, indptr, vocabulary = encode(documents)
+    labels = list(vocabulary)
+    # Cada token distinto é hasheado uma vez só
+    hashes = np.fromiter(map(_hash, labels), dtype=np.int64, count=len(labels))
+    row = np.repeat(np.arange(count), np.diff(indptr))
+
+    rows, codes = [row], [hashes[ids]]
+    if ngrams >= 2 and len(ids) > 1:
+        same = row[:-1] == row[1:]
+        size = len(labels)
+        pairs, inverse = np.unique(
+            ids[:-1][same] * size + ids[1:][same], return_inverse=True
+        )
+        pair_hashes = np.fromiter(
+            (_hash(f"{labels[p // size]} {labels[p % size]}") for p in pairs.tolist()),
+            dtype=np.int64,
+            count=len(pairs),
+        )
+        rows.append(row[:-1][same])
+        codes.append(pair_hashes[inverse])
+
+    code = np.concatenate(codes)
+    column = code % n_features
+    sign = 1.0 - 2.0 * ((code >> 31) & 1)
+
+    # Soma as ocorrências de cada (documento, coluna); colisões se cancelam
+    keys, inverse = np.unique(
+        np.concatenate(rows) * n_features + column, return_inverse=True
+    )
+    values = np.bincount(inverse, weights=sign)
+    keep = values != 0
+    keys, values = keys[keep], values[keep]
+    feature_rows = keys // n_features
+
+    norms = np.sqrt(np.bincount(feature_rows, weights=values**2, minlength=count))
+    values = values / norms[feature_rows]
+    words = (row, ids, column[: len(ids)], sign[: len(ids)], labels)
+    return HashedFeatures(feature_rows, keys % n_features, values, count, words)
+
+
+def _softmax(scores):
+    scores = scores - scores.max(axis=1, keepdims=True)
+    np.exp(scores, out=scores)
+    scores /= scores.sum(axis=1, keepdims=True)
+    return scores
+
+
+class HashingClassifier:
+    """Regressão logística multinomial sobre atributos com hashing"""
+
+    def __init__(self, n_features=N_FEATURES, ngrams=2, alpha=1e-6):
+        """n_features: colunas do hashing; alpha: regularização L2"""
+        self.n_features = n_features
+        self.ngrams = ngrams
+        self.alpha = alpha
+        self.weights = np.zeros((n_features, len(CLASSES)))
+        self.bias = np.zeros(len(CLASSES))
+
+    def features(self, texts):
+        """Tokeniza e aplica o hashing aos textos"""
+        return hash_features(
+            [tokenize(str(text)) for text in texts], self.n_features, self.ngrams
+        )
+
+    def _scores(self, features):
+        # X @ W esparso: uma soma por classe, acumulada por linha
+        rows, columns, values = features.rows, features.columns, features.values
+        scores = np.empty((features.count, len(CLASSES)))
+        for k in range(len(CLASSES)):
+            scores[:, k] = np.bincount(
+                rows,
+                weights=values * self.weights[columns, k],
+                minlength=features.count,
+            )
+        return scores + self.bias
+
+    def fit(self, texts, labels, epochs=3, batch_size=512, learning_rate=0.2, seed=0):
+        """Treina com minilotes (Adagrad) sobre textos e rótulos de CLASSES"""
+        rng = np.random.default_rng(seed)
+        order = rng.permutation(len(texts))
+        texts = [texts[i] for i in order]
+        target = np.array([CLASSES.index(label) for label in labels])[order]
+
+        features = self.features(texts)
+        accumulated = np.full_like(self.weights, 1e-8)
+        bias_accumulated = np.full_like(self.bias, 1e-8)
+        batches = [
+            (start, min(start + batch_size, len(texts)))
+            for start in range(0, len(texts), batch_size)
+        ]
+        for _ in range(epochs):
+            for b in rng.permutation(len(batches)):
+                start, stop = batches[b]
+                batch = features.slice(start, stop)
+                gradient = _softmax(self._scores(batch))
+                gradient[np.arange(stop - start), target[start:stop]] -= 1.0
+                gradient /= stop - start
+
+                # Gradiente só nas colunas presentes no lote
+                touched, inverse = np.unique(batch.columns, return_inverse=True)
+                update = np.empty((len(touched), len(CLASSES)))
+                for k in range(len(CLASSES)):
+                    update[:, k] = np.bincount(
+                        inverse,
+                        weights=batch.values * gradient[batch.rows, k],
+                        minlength=len(touched),
+                    )
+                update += self.alpha * self.weights[touched]
+
+                accumulated[touched] += update**2
+                self.weights[touched] -= (
+                    learning_rate * update / np.sqrt(accumulated[touched])
+                )
+                bias_update = gradient.sum(axis=0)
+                bias_accumulated += bias_update**2
+                self.bias -= learning_rate * bias_update / np.sqrt(bias_accumulated)
+        return self
+
+    def predict_proba(self, texts):
+        """Probabilidades (documentos x CLASSES)"""
+        return _softmax(self._scores(self.features(texts)))
+
+    def analyze_columns(self, texts, words=True):
+        """Colunas no formato do motor em lote (ver batch.analyze_tokens)"""
+        features = self.features(texts)
+        probabilities = _softmax(self._scores(features))
+        best = probabilities.argmax(axis=1)
+        count = len(features)
+
+        row, ids, column, sign, labels = features.words
+        # Contribuição de cada unigrama para positivo contra negativo
+        contribution = sign * (self.weights[column, 0] - self.weights[column, 1])
+        total = np.bincount(row, minlength=count)
+        # Sem tokens: neutro com confiança mínima, como no motor por regras
+        empty = total == 0
+        sentiment = np.array(CLASSES, dtype=object)[best]
+        sentiment[empty] = "neutro"
+        columns = {
+            "sentimento": sentiment,
+            "confianca": np.where(empty, 0.1, probabilities[np.arange(count), best]),
+            "peso_positivo": probabilities[:, 0],
+            "peso_negativo": probabilities[:, 1],
+            "total_palavras": total,
+            "palavras_sentimento": np.bincount(row[contribution != 0], minlength=count),
+            # O modelo não resolve contexto explicitamente (vem dos bigramas)
+            "negacoes_detectadas": np.zeros(count, dtype=np.int64),
+            "intensificadores_detectados": np.zeros(count, dtype=np.int64),
+        }
+        if words:
+            columns["positivas"] = _top_words(count, row, ids, contribution, labels)
+            columns["negativas"] = _top_words(count, row, ids, -contribution, labels)
+        return columns
+
+    def analyze_sentiment(self, text, mode="full"):
+        """Mesmo contrato de SentimentAnalyzer.analyze_sentiment"""
+        if mode not in MODES:
+            raise ValueError(f"Modo de análise inválido: {mode}")
+        columns = self.analyze_columns([text], words=mode == "full")
+        if mode != "full":
+            return SentimentResult(
+                columns["sentimento"][0], float(columns["confianca"][0])
+            )
+        return SentimentResult(*next(iter_details(columns)))
+
+    def save(self, path):
+        """Grava pesos e parâmetros num .npz"""
+        np.savez_compressed(
+            path,
+            weights=self.weights,
+            bias=self.bias,
+            params=np.array([self.n_features, self.ngrams]),
+            alpha=np.array(self.alpha),
+        )
+
+    @classmethod
+    def load(cls, path):
+        """Carrega um modelo gravado por save()"""
+        with np.load(path) as data:
+            n_features, ngrams = data["params"].tolist()
+            model = cls(n_features, ngrams, float(data["alpha"]))
+            model.weights = data["weights"]
+            model.bias = data["bias"]
+        return model
+
+
+def _top_words(count, row, ids, contribution, labels):
+    """Até TOP_WORDS unigramas distintos com maior contribuição positiva"""
+    mask = contribution > 0
+    row, ids, contribution = row[mask], ids[mask], contribution[mask]
+    # Uma entrada por (documento, palavra), da maior contribuição para a menor
+    order = np.lexsort((-contribution, ids, row))
+    row, ids, contribution = row[order], ids[order], contribution[order]
+    first = np.ones(len(row), dtype=bool)
+    first[1:] = (row[1:] != row[:-1]) | (ids[1:] != ids[:-1])
+    row, ids, contribution = row[first], ids[first], contribution[first]
+
+    order = np.lexsort((-contribution, row))
+    row, ids = row[order], ids[order]
+    bounds = np.searchsorted(row, np.arange(count + 1))
+    rank = np.arange(len(row)) - bounds[row]
+    row, ids = row[rank < TOP_WORDS], ids[rank < TOP_WORDS]
+
+    words = [labels[i] for i in ids.tolist()]
+    bounds = np.searchsorted(row, np.arange(count + 1)).tolist()
+    return [words[bounds[i] : bounds[i + 1]] for i in range(count)]
+
+
+def bootstrap_labels(texts, lexicon=None, min_confidence=0.0):
+    """Rótulos do motor por regras para treinar sem anotação manual
+
+    Retorna (textos, rótulos) só com as análises de confiança mínima.
+    """
+    columns = analyze_columns([str(text) for text in texts], lexicon, words=False)
+    keep = np.flatnonzero(columns["confianca"] >= min_confidence).tolist()
+    labels = columns["sentimento"].tolist()
+    return [texts[i] for i in keep], [labels[i] for i in keep]
@@ -0,0 +1,133 @@
+"""
+Análise paralela em processos para grandes volumes (backfills)
+
+Os textos são fatiados em blocos grandes o bastante para diluir o custo
+de IPC e distribuídos num ProcessPoolExecutor. O léxico vai uma única vez
+para cada processo, pelo initializer; cada bloco volta como colunas do
+motor em lote (arrays compactos) e só é expandido no processo principal.
+A janela de blocos em voo é limitada, então a entrada pode ser um gerador
+e os resultados saem na ordem original, à medida que ficam prontos.
+
+Com um ResultCache, cada bloco é consultado no processo principal e só
+os textos sem resultado guardado vão para os processos; os resultados
+novos são gravados no cache ao voltar.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .batch import analyze_columns, iter_details
+from .lexicon import resolve_lexicon
+
+# Limites do tamanho automático de bloco (documentos por tarefa)
+MIN_CHUNKSIZE = 500
+MAX_CHUNKSIZE = 20_000
+# Blocos por processo quando o total é conhecido (equilibra a carga)
+CHUNKS_PER_WORKER = 4
+# Blocos em voo por processo
+PENDING_PER_WORKER = 2
+
+_worker_lexicon = None
+
+
+def _init_worker(lexicon):
+    """Guarda o léxico no processo de trabalho"""
+    global _worker_lexicon
+    _worker_lexicon = lexicon
+
+
+def _analyze_chunk(texts, words=True):
+    return analyze_columns(texts, _worker_lexicon, words)
+
+
+def auto_chunksize(total, workers):
+    """Tamanho de bloco para o total de textos (None se desconhecido)"""
+    if total is None:
+        return MAX_CHUNKSIZE // 4
+    size = -(-total // (workers * CHUNKS_PER_WORKER))
+    return max(MIN_CHUNKSIZE, min(size, MAX_CHUNKSIZE))
+
+
+def _expand(chunk, columns):
+    if "positivas" not in columns:
+        # Sem listas de palavras (words=False): details fica None
+        rows = zip(chunk, columns["sentimento"].tolist(), columns["confianca"].tolist())
+        for row in rows:
+            yield (*row, None)
+        return
+    for text, result in zip(chunk, iter_details(columns)):
+        yield (text, *result)
+
+
+def _submit(pool, chunk, lexicon, cache, words):
+    """Envia o bloco (ou só o que falta no cache) e devolve (consulta, futuro)"""
+    if cache is None:
+        return None, pool.submit(_analyze_chunk, chunk, words)
+    lookup = cache.lookup(chunk, lexicon)
+    if not lookup.missing:
+        return lookup, None
+    # O cache guarda as palavras, então os textos novos vêm sempre com elas
+    return lookup, pool.submit(_analyze_chunk, list(lookup.missing.values()))
+
+
+def _collect(cache, lookup, future, words):
+    """Colunas do bloco inteiro a partir do futuro e da consulta ao cache"""
+    columns = future.result() if future is not None else None
+    return columns if lookup is None else cache.complete(lookup, columns, words)
+
+
+def _chunks(texts, size):
+    iterator = iter(texts)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_parallel(
+    texts, lexicon=None, workers=None, chunksize=None, cache=None, words=True
+):
+    """Gera (texto, sentimento, confiança, details) na ordem da entrada
+
+    workers=None usa todos os núcleos; com 1 processo (ou um único bloco)
+    a análise roda no próprio processo, sem pool. cache: ResultCache
+    consultado antes de enviar cada bloco. words=False não monta as listas
+    de palavras e details vem None.
+    """
+    lexicon = resolve_lexicon(lexicon)
+    workers = workers or os.cpu_count() or 1
+    total = len(texts) if hasattr(texts, "__len__") else None
+    chunksize = chunksize or auto_chunksize(total, workers)
+
+    if workers == 1 or (total is not None and total <= chunksize):
+        for chunk in _chunks(texts, chunksize):
+            if cache is not None:
+                columns = cache.analyze_columns(chunk, lexicon, words)
+            else:
+                columns = analyze_columns(chunk, lexicon, words)
+            yield from _expand(chunk, columns)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(lexicon,)
+    ) as pool:
+        pending = deque()
+        try:
+            for chunk in _chunks(texts, chunksize):
+                pending.append((chunk, *_submit(pool, chunk, lexicon, cache, words)))
+                if len(pending) < workers * PENDING_PER_WORKER:
+                    continue
+                chunk, lookup, future = pending.popleft()
+                yield from _expand(chunk, _collect(cache, lookup, future, words))
+
+            while pending:
+                chunk, lookup, future = pending.popleft()
+                yield from _expand(chunk, _collect(cache, lookup, future, words))
+        finally:
+            # Consumidor parou no meio: descarta os blocos ainda na fila
+            for _, _, future in pending:
+                if future is not None:
+                    future.cancel()
@@ -0,0 +1,136 @@
+"""
+Reanálise seletiva após edições no léxico
+
+Um índice invertido token → documentos permite reanalisar só o que pode
+ter mudado: o diff entre o léxico antigo e o novo dá os tokens com
+entrada alterada (pesos, flags ou intensificador) e o primeiro token das
+expressões alteradas. Documento sem nenhum desses tokens faz exatamente
+as mesmas consultas com os dois léxicos, então o resultado não muda.
+"""
+
+import numpy as np
+
+from .batch import analyze_columns
+from .lexicon import resolve_lexicon
+from .text_processor import tokenize
+
+
+def changed_tokens(old, new):
+    """Tokens cujos documentos podem ter resultado diferente entre os léxicos"""
+    old, new = resolve_lexicon(old), resolve_lexicon(new)
+    tokens = {
+        token
+        for token in old.table.keys() | new.table.keys()
+        if old.table.get(token) != new.table.get(token)
+    }
+    # Expressão nova, removida ou alterada: só casa onde aparece o 1º token
+    tokens.update(
+        key[0]
+        for key in old.phrases.keys() | new.phrases.keys()
+        if old.phrases.get(key) != new.phrases.get(key)
+    )
+    return tokens
+
+
+class InvertedIndex:
+    """Índice token → ids dos documentos que contêm o token"""
+
+    def __init__(self, postings=None, last_id=None):
+        """Recebe as listas {token: [ids]} e o maior id já indexado"""
+        self.postings = postings or {}
+        self.last_id = last_id
+
+    def __len__(self):
+        return len(self.postings)
+
+    def add(self, doc_id, words):
+        """Indexa os tokens de um documento"""
+        postings = self.postings
+        for token in set(words):
+            ids = postings.get(token)
+            if ids is None:
+                postings[token] = [doc_id]
+            else:
+                ids.append(doc_id)
+        if self.last_id is None or doc_id > self.last_id:
+            self.last_id = doc_id
+
+    def add_texts(self, ids, texts):
+        """Tokeniza e indexa os textos"""
+        for doc_id, text in zip(ids, texts):
+            self.add(int(doc_id), tokenize(str(text)))
+
+    def sync(self, store):
+        """Indexa as notícias do banco inseridas depois da última sincronização"""
+        news = store.news_texts(after_id=self.last_id)
+        self.add_texts(news["id"], news["texto_completo"])
+        return len(news)
+
+    def documents(self, tokens):
+        """Ids (ordenados, sem repetição) dos documentos com algum dos tokens"""
+        lists = [self.postings[t] for t in tokens if t in self.postings]
+        if not lists:
+            return []
+        return np.unique(np.concatenate(lists)).tolist()
+
+    def save(self, path):
+        """Grava o índice em formato CSR (tokens, ponteiros e ids) num .npz"""
+        tokens = list(self.postings)
+        lengths = [len(self.postings[t]) for t in tokens]
+        np.savez_compressed(
+            path,
+            tokens=np.array("\n".join(tokens)),
+            indptr=np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)]),
+            ids=np.fromiter(
+                (i for t in tokens for i in self.postings[t]),
+                dtype=np.int64,
+                count=sum(lengths),
+            ),
+            last_id=np.array(-1 if self.last_id is None else self.last_id),
+        )
+
+    @classmethod
+    def load(cls, path):
+        """Carrega um índice gravado por save()"""
+        with np.load(path) as data:
+            joined = str(data["tokens"])
+            tokens = joined.split("\n") if joined else []
+            indptr = data["indptr"].tolist()
+            ids = data["ids"].tolist()
+            last_id = int(data["last_id"])
+        postings = {
+            token: ids[indptr[i] : indptr[i + 1]] for i, token in enumerate(tokens)
+        }
+        return cls(postings, None if last_id < 0 else last_id)
+
+
+def rescore_store(store, index, old_lexicon, new_lexicon):
+    """Reanalisa no banco só as notícias afetadas pela troca de léxico
+
+    Retorna os ids reanalisados. O índice é sincronizado antes, então
+    notícias novas também entram no diff. Os demais resultados gravados
+    com o léxico antigo passam para a versão nova sem reanálise.
+    """
+    old_lexicon, new_lexicon = resolve_lexicon(old_lexicon), resolve_lexicon(
+        new_lexicon
+    )
+    index.sync(store)
+    ids = index.documents(changed_tokens(old_lexicon, new_lexicon))
+
+    if ids:
+        news = store.news_texts(ids)
+        columns = analyze_columns(list(map(str, news["texto_completo"])), new_lexicon)
+        store.save_analysis(
+            list(
+                zip(
+                    news["id"].astype(int).tolist(),
+                    columns["sentimento"].tolist(),
+                    columns["confianca"].tolist(),
+                    map(", ".join, columns["positivas"]),
+                    map(", ".join, columns["negativas"]),
+                )
+            ),
+            new_lexicon.version,
+        )
+    store.relabel_analysis(old_lexicon.version, new_lexicon.version)
+    return ids
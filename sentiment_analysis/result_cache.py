@@ -0,0 +1,243 @@
+"""
+Cache persistente de resultados de análise endereçado pelo conteúdo
+
+A chave é o SHA-256 do texto normalizado (minúsculas, espaços colapsados,
+o que não altera os tokens) junto com a versão do léxico: trocar o léxico
+muda todas as chaves, então resultados antigos nunca são reaproveitados
+e saem pelo descarte LRU. O tamanho é limitado por max_entries.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from .batch import COUNT_COLUMNS, analyze_columns, iter_details
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key BLOB PRIMARY KEY,
+    sentimento TEXT NOT NULL,
+    confianca REAL NOT NULL,
+    peso_positivo REAL NOT NULL,
+    peso_negativo REAL NOT NULL,
+    total_palavras INTEGER NOT NULL,
+    palavras_sentimento INTEGER NOT NULL,
+    negacoes_detectadas INTEGER NOT NULL,
+    intensificadores_detectados INTEGER NOT NULL,
+    positivas TEXT NOT NULL,
+    negativas TEXT NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_last_used ON results(last_used);
+"""
+
+# Colunas do motor em lote, na ordem da tabela
+COLUMNS = ["sentimento", "confianca", "peso_positivo", "peso_negativo"] + COUNT_COLUMNS
+# Palavras e expressões nunca contêm quebra de linha
+WORD_SEPARATOR = "\n"
+# Uso recente só é regravado quando mais velho que isso (segundos): a
+# ordem LRU fica aproximada, mas leituras repetidas não viram escritas
+TOUCH_INTERVAL = 60
+# Limite de parâmetros por consulta do SQLite
+_BATCH = 900
+# Fração do limite liberada a cada descarte: a contagem exata só roda
+# de novo depois de tantas gravações, não a cada lote
+EVICT_HEADROOM = 0.1
+
+# Consulta de um lote ao cache: chaves, linhas encontradas e textos a analisar
+Lookup = namedtuple("Lookup", "keys found missing")
+
+
+def normalize(text):
+    """Forma canônica do texto: mesma sequência de tokens, sem variações"""
+    return " ".join(text.lower().split())
+
+
+def cache_key(text, version):
+    """Chave do resultado: hash do texto normalizado + versão do léxico"""
+    data = f"{version}\0{normalize(text)}".encode("utf-8")
+    return hashlib.sha256(data).digest()
+
+
+class ResultCache:
+    """Resultados por chave de conteúdo num SQLite, com descarte LRU"""
+
+    def __init__(self, path="data/cache/analysis.db", max_entries=200_000):
+        """Abre (ou cria) o cache no caminho informado"""
+        self.path = path
+        self.max_entries = max_entries
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # O Streamlit executa o script em threads diferentes
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            # Limite superior do número de linhas, atualizado a cada gravação
+            # (substituições contam como novas); a contagem exata fica para
+            # quando ele passa de max_entries
+            (self._size,) = self._conn.execute(
+                "SELECT COUNT(*) FROM results"
+            ).fetchone()
+
+    def close(self):
+        """Fecha a conexão com o cache"""
+        self._conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def get_many(self, keys):
+        """Linhas encontradas {chave: (colunas..., positivas, negativas)}"""
+        found = {}
+        keys = list(dict.fromkeys(keys))
+        now = time.time()
+        with self._lock, self._conn:
+            for i in range(0, len(keys), _BATCH):
+                batch = keys[i : i + _BATCH]
+                marks = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, last_used, {', '.join(COLUMNS)}, positivas, "
+                    f"negativas FROM results WHERE key IN ({marks})",
+                    batch,
+                ).fetchall()
+                stale = []
+                for key, last_used, *values in rows:
+                    found[key] = values
+                    if now - last_used > TOUCH_INTERVAL:
+                        stale.append(key)
+                # Marca o uso para o descarte LRU
+                if stale:
+                    self._conn.execute(
+                        "UPDATE results SET last_used = ? WHERE key IN "
+                        f"({','.join('?' * len(stale))})",
+                        [now, *stale],
+                    )
+        return found
+
+    def put_many(self, items):
+        """Grava (chave, colunas..., positivas, negativas) e aplica o limite"""
+        now = time.time()
+        rows = [
+            (
+                key,
+                *values[:-2],
+                WORD_SEPARATOR.join(values[-2]),
+                WORD_SEPARATOR.join(values[-1]),
+                now,
+            )
+            for key, *values in items
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO results (key, {', '.join(COLUMNS)}, "
+                f"positivas, negativas, last_used) VALUES "
+                f"({', '.join('?' * (len(COLUMNS) + 4))})",
+                rows,
+            )
+            self._size += len(rows)
+            if self._size > self.max_entries:
+                self._evict()
+
+    def _evict(self):
+        # Remove os menos usados recentemente, deixando folga até o limite
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()
+        target = self.max_entries - int(self.max_entries * EVICT_HEADROOM)
+        if count > target:
+            self._conn.execute(
+                "DELETE FROM results WHERE key IN "
+                "(SELECT key FROM results ORDER BY last_used LIMIT ?)",
+                (count - target,),
+            )
+        self._size = min(count, target)
+
+    def clear(self):
+        """Remove todos os resultados"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+            self._size = 0
+
+    def analyze_columns(self, texts, lexicon, words=True):
+        """analyze_columns consultando o cache; só os textos novos são analisados
+
+        Textos repetidos no mesmo lote são analisados uma vez.
+        """
+        lookup = self.lookup(texts, lexicon)
+        columns = None
+        if lookup.missing:
+            columns = analyze_columns(list(lookup.missing.values()), lexicon)
+        return self.complete(lookup, columns, words)
+
+    def lookup(self, texts, lexicon):
+        """Consulta o lote no cache; missing: {chave: texto} ainda sem resultado"""
+        keys = [cache_key(text, lexicon.version) for text in texts]
+        found = self.get_many(keys)
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                missing.setdefault(key, text)
+        return Lookup(keys, found, missing)
+
+    def complete(self, lookup, columns, words=True):
+        """Grava as colunas dos textos de lookup.missing e monta as do lote
+
+        columns é a saída de analyze_columns (com palavras) para
+        list(lookup.missing.values()), na mesma ordem.
+        """
+        keys, found, missing = lookup
+        if missing:
+            computed = [
+                (key, *values)
+                for key, values in zip(
+                    missing,
+                    zip(
+                        *(columns[name].tolist() for name in COLUMNS),
+                        columns["positivas"],
+                        columns["negativas"],
+                    ),
+                )
+            ]
+            self.put_many(computed)
+            found.update((key, values) for key, *values in computed)
+
+        values = list(zip(*(found[key] for key in keys))) or [()] * (len(COLUMNS) + 2)
+        dtypes = [object] + [np.float64] * 3 + [np.int64] * len(COUNT_COLUMNS)
+        merged = {
+            name: np.array(column, dtype=dtype)
+            for name, column, dtype in zip(COLUMNS, values, dtypes)
+        }
+        if words:
+            merged["positivas"] = list(map(_words, values[-2]))
+            merged["negativas"] = list(map(_words, values[-1]))
+        return merged
+
+    def analyze_sentiment(self, text, lexicon):
+        """Resultado (sentimento, confiança, details) de um texto pelo cache"""
+        return next(iter_details(self.analyze_columns([text], lexicon)))
+
+    def label(self, text, lexicon):
+        """(sentimento, confiança) já gravados para o texto, ou None
+
+        Não monta as listas de palavras; uma falta não é analisada aqui,
+        já que a entrada do cache exige os detalhes completos.
+        """
+        key = cache_key(text, lexicon.version)
+        values = self.get_many([key]).get(key)
+        return None if values is None else (values[0], values[1])
+
+
+def _words(value):
+    # Vem do banco como texto e do lote recém-analisado como lista
+    if isinstance(value, str):
+        return value.split(WORD_SEPARATOR) if value else []
+    return list(value)
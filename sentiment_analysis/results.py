@@ -0,0 +1,73 @@
+"""
+Tipos de resultado da análise
+
+SentimentResult é uma NamedTuple (desempacota como a tupla antiga
+sentimento, confiança, details). Details é um Mapping com __slots__ que
+guarda o resultado bruto da varredura e só monta as listas sem repetição
+e os pesos arredondados quando a chave é lida.
+"""
+
+from collections.abc import Mapping
+from typing import NamedTuple, Optional
+
+# Modos de analyze_sentiment: detalhes completos ou só rótulo e confiança
+MODES = ("full", "label")
+
+DETAIL_KEYS = (
+    "positivas",
+    "negativas",
+    "total_palavras",
+    "palavras_sentimento",
+    "peso_positivo",
+    "peso_negativo",
+    "negacoes_detectadas",
+    "intensificadores_detectados",
+)
+
+
+class SentimentResult(NamedTuple):
+    """Rótulo, confiança e detalhes (None no modo "label")"""
+
+    sentiment: str
+    confidence: float
+    details: Optional[Mapping] = None
+
+
+class Details(Mapping):
+    """Detalhes da análise calculados sob demanda a partir da varredura"""
+
+    __slots__ = ("_scan", "_total")
+
+    def __init__(self, scan, total_words):
+        """Recebe o ScanResult e o número de tokens do texto"""
+        self._scan = scan
+        self._total = total_words
+
+    def __getitem__(self, key):
+        scan = self._scan
+        if key == "positivas":
+            return list(set(scan.positive_words))
+        if key == "negativas":
+            return list(set(scan.negative_words))
+        if key == "total_palavras":
+            return self._total
+        if key == "palavras_sentimento":
+            return scan.positive_count + scan.negative_count
+        if key == "peso_positivo":
+            return round(scan.positive_score, 2)
+        if key == "peso_negativo":
+            return round(scan.negative_score, 2)
+        if key == "negacoes_detectadas":
+            return scan.negations
+        if key == "intensificadores_detectados":
+            return scan.intensifiers
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(DETAIL_KEYS)
+
+    def __len__(self):
+        return len(DETAIL_KEYS)
+
+    def __repr__(self):
+        return repr(dict(self))
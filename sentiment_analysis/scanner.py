@@ -0,0 +1,204 @@
+"""
+Varredura linear do contexto fundida com o cálculo do score
+
+Em vez de reexaminar a janela de 3 palavras anteriores para cada token,
+uma máquina de estados guarda a posição e o tipo da última negação (ou
+quebra de negação) e o intensificador do token anterior. Score, listas
+de palavras e contadores são acumulados na mesma passada.
+
+O estado e os acumuladores saem no ScanResult, então um texto pode ser
+varrido em partes (ver streaming) com o mesmo resultado de uma passada.
+"""
+
+from collections import namedtuple
+
+from .lexicon import NEGATION, BREAKER, PHRASE, FLAGS, INTENSIFIER, resolve_lexicon
+
+# Alcance da negação: até 3 palavras antes do token
+NEGATION_WINDOW = 3
+
+# Contexto levado de uma parte do texto para a seguinte: última negação ou
+# quebra (posição e tipo), intensificador pendente e posição da próxima unidade
+ScanState = namedtuple(
+    "ScanState", ["last_control", "control_negates", "intensifier", "position"]
+)
+INITIAL_STATE = ScanState(-NEGATION_WINDOW - 1, False, 1.0, 0)
+
+ScanResult = namedtuple(
+    "ScanResult",
+    [
+        "positive_score",
+        "negative_score",
+        "positive_words",
+        "negative_words",
+        "negations",
+        "intensifiers",
+        "positive_count",
+        "negative_count",
+        "state",
+        "consumed",
+    ],
+    defaults=(INITIAL_STATE, 0),
+)
+
+
+def iter_context(words, lexicon=None):
+    """Gera (palavra ou expressão, negada, intensificador) em uma única passada"""
+    lexicon = resolve_lexicon(lexicon)
+    table = lexicon.table
+    last_control = -NEGATION_WINDOW - 1
+    control_negates = False
+    intensifier = 1.0
+    position = 0
+    skip = 0
+
+    for i, word in enumerate(words):
+        if skip:
+            skip -= 1
+            continue
+
+        entry = table.get(word)
+        if entry is not None and entry[FLAGS] & PHRASE:
+            match = lexicon.match_phrase(words, i)
+            if match is not None:
+                end, word, entry = match
+                skip = end - i - 1
+
+        negated = control_negates and position - last_control <= NEGATION_WINDOW
+        yield word, negated, intensifier
+
+        if entry is None:
+            intensifier = 1.0
+        else:
+            flags = entry[FLAGS]
+            if flags & NEGATION:
+                last_control, control_negates = position, True
+            elif flags & BREAKER:
+                last_control, control_negates = position, False
+            intensifier = entry[INTENSIFIER]
+        position += 1
+
+
+def scan(words, lexicon=None, collect=True, carry=None, stop=None, contributions=None):
+    """Calcula scores, palavras e contadores de contexto em uma passada
+
+    Expressões do léxico são casadas na mesma passada: só tokens com a
+    flag PHRASE consultam a trie, e a expressão casada conta como uma
+    unidade (para a janela de negação e para o intensificador). Com
+    collect=False as listas de palavras ficam vazias e só os contadores
+    são acumulados (sem montar strings com prefixo).
+
+    Varredura em partes: carry é o ScanResult da parte anterior (estado e
+    acumuladores continuam de onde pararam); stop limita as posições em que
+    uma unidade pode começar (uma expressão ainda pode passar dele) e
+    consumed informa quantos tokens foram usados. contributions, um par
+    de dicts palavra → peso (ex.: defaultdict(float)), soma o peso de cada
+    palavra positiva e negativa.
+    """
+    lexicon = resolve_lexicon(lexicon)
+    table = lexicon.table
+    trie = lexicon.trie
+    count = len(words)
+    if carry is None:
+        carry = EMPTY_RESULT
+    positive_score, negative_score = carry.positive_score, carry.negative_score
+    positive_words = list(carry.positive_words)
+    negative_words = list(carry.negative_words)
+    negations, intensifiers = carry.negations, carry.intensifiers
+    positive_count, negative_count = carry.positive_count, carry.negative_count
+    last_control, control_negates, intensifier, position = carry.state
+    if stop is None or stop > count:
+        stop = count
+    skip = 0
+
+    for i, word in enumerate(words if stop == count else words[:stop]):
+        if skip:
+            skip -= 1
+            continue
+
+        is_negated = control_negates and position - last_control <= NEGATION_WINDOW
+        if is_negated:
+            negations += 1
+        if intensifier != 1.0:
+            intensifiers += 1
+
+        entry = table.get(word)
+        if entry is None:
+            intensifier = 1.0
+            position += 1
+            continue
+        base_positive, base_negative, flags, next_intensifier = entry
+
+        # Só entra na trie se o próximo token continua alguma expressão
+        if flags & PHRASE and i + 1 < count and words[i + 1] in trie[word]:
+            match = lexicon.match_phrase(words, i)
+            if match is not None:
+                end, word, entry = match
+                skip = end - i - 1
+                base_positive, base_negative, flags, next_intensifier = entry
+
+        if base_positive or base_negative:
+            # Aplica intensificador
+            positive_weight = base_positive * intensifier
+            negative_weight = base_negative * intensifier
+
+            if is_negated:
+                # Negação inverte o sentimento
+                if positive_weight > 0:
+                    negative_score += positive_weight
+                    negative_count += 1
+                    if collect:
+                        negative_words.append(f"não_{word}")
+                    if contributions is not None:
+                        contributions[1][f"não_{word}"] += positive_weight
+                elif negative_weight > 0:
+                    positive_score += negative_weight
+                    positive_count += 1
+                    if collect:
+                        positive_words.append(f"não_{word}")
+                    if contributions is not None:
+                        contributions[0][f"não_{word}"] += negative_weight
+            elif positive_weight > 0:
+                positive_score += positive_weight
+                positive_count += 1
+                if collect:
+                    positive_words.append(
+                        f"muito_{word}" if intensifier > 1.0 else word
+                    )
+                if contributions is not None:
+                    label = f"muito_{word}" if intensifier > 1.0 else word
+                    contributions[0][label] += positive_weight
+            elif negative_weight > 0:
+                negative_score += negative_weight
+                negative_count += 1
+                if collect:
+                    negative_words.append(
+                        f"muito_{word}" if intensifier > 1.0 else word
+                    )
+                if contributions is not None:
+                    label = f"muito_{word}" if intensifier > 1.0 else word
+                    contributions[1][label] += negative_weight
+
+        if flags & NEGATION:
+            last_control, control_negates = position, True
+        elif flags & BREAKER:
+            last_control, control_negates = position, False
+        intensifier = next_intensifier
+        position += 1
+
+    return ScanResult(
+        positive_score,
+        negative_score,
+        positive_words,
+        negative_words,
+        negations,
+        intensifiers,
+        positive_count,
+        negative_count,
+        ScanState(last_control, control_negates, intensifier, position),
+        # Uma expressão iniciada antes de stop pode ter consumido tokens além dele
+        stop + skip,
+    )
+
+
+EMPTY_RESULT = ScanResult(0, 0, (), (), 0, 0, 0, 0)
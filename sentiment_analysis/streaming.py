@@ -0,0 +1,144 @@
+"""
+Análise de textos longos em trechos, com memória limitada
+
+O texto chega em pedaços (arquivo, socket, transcrição) e nunca é
+materializado inteiro. Entre um trecho e outro ficam só:
+
+- a palavra possivelmente cortada no fim do trecho;
+- os últimos tokens ainda não varridos, no máximo o tamanho da maior
+  expressão do léxico (para casar expressões que atravessam trechos);
+- o estado da varredura (última negação/quebra e intensificador);
+- os agregados: scores, contadores e a contribuição de cada palavra do
+  léxico, de onde saem as palavras que mais pesaram.
+
+Para o mesmo texto, rótulo, confiança, scores e contadores são os mesmos
+de SentimentAnalyzer.analyze_sentiment.
+"""
+
+import heapq
+from collections import defaultdict
+
+from .confidence import (
+    TECHNICAL_WORDS,
+    calculate_improved_confidence,
+    neutral_confidence_from_counts,
+)
+from .lexicon import resolve_lexicon
+from .results import DETAIL_KEYS, MODES, SentimentResult
+from .scanner import EMPTY_RESULT, scan
+from .text_processor import tokenize_partial
+
+# Palavras mantidas em positivas/negativas no resultado
+TOP_WORDS = 20
+# Caracteres lidos por vez de arquivos
+CHUNK_SIZE = 1 << 16
+
+
+class StreamingScorer:
+    """Varredura incremental: feed(trecho) quantas vezes for preciso e result()"""
+
+    def __init__(self, lexicon=None, top_words=TOP_WORDS):
+        """Usa o léxico padrão, um Lexicon ou um artefato"""
+        self.lexicon = resolve_lexicon(lexicon)
+        self.top_words = top_words
+        # Tokens necessários à frente para casar a maior expressão
+        self._lookahead = max(map(len, self.lexicon.phrases), default=1)
+        self._rest = ""
+        self._pending = []
+
+        self.total_words = 0
+        self.technical_words = 0
+        # Estado e agregados da varredura, passados de volta a scan
+        self._carry = None
+        self._contributions = (defaultdict(float), defaultdict(float))
+
+    def feed(self, chunk):
+        """Consome um trecho do texto"""
+        words, self._rest = tokenize_partial(self._rest + chunk)
+        self.total_words += len(words)
+        self.technical_words += sum(1 for word in words if word in TECHNICAL_WORDS)
+        self._pending.extend(words)
+        self._scan(final=False)
+        return self
+
+    def _scan(self, final):
+        # Varre os tokens pendentes que já têm lookahead suficiente
+        words = self._pending
+        stop = len(words) if final else len(words) - self._lookahead + 1
+        if stop <= 0:
+            return
+        self._carry = scan(
+            words,
+            self.lexicon,
+            collect=False,
+            carry=self._carry,
+            stop=stop,
+            contributions=self._contributions,
+        )
+        del words[: self._carry.consumed]
+
+    def _top(self, contributions):
+        return [
+            word
+            for word, _ in heapq.nlargest(
+                self.top_words, contributions.items(), key=lambda item: item[1]
+            )
+        ]
+
+    def result(self, mode="full"):
+        """Fecha o texto e devolve (sentimento, confiança, details)"""
+        if mode not in MODES:
+            raise ValueError(f"Modo de análise inválido: {mode}")
+        if self._rest:
+            self.feed(" ")
+        self._scan(final=True)
+
+        totals = self._carry or EMPTY_RESULT
+        positive, negative = totals.positive_score, totals.negative_score
+        total = self.total_words
+        if total == 0:
+            sentiment, confidence = "neutro", 0.1
+        elif positive == 0 and negative == 0:
+            sentiment = "neutro"
+            confidence = neutral_confidence_from_counts(total, self.technical_words)
+        elif positive == negative:
+            # Empate nos scores - neutralidade por equilíbrio
+            sentiment = "neutro"
+            confidence = 0.4 + min(total / 50, 0.2)
+        else:
+            sentiment = "positivo" if positive > negative else "negativo"
+            confidence = calculate_improved_confidence(
+                totals.positive_count,
+                totals.negative_count,
+                positive,
+                negative,
+                total,
+            )
+
+        if mode != "full":
+            return SentimentResult(sentiment, confidence)
+        values = (
+            self._top(self._contributions[0]),
+            self._top(self._contributions[1]),
+            total,
+            totals.positive_count + totals.negative_count,
+            round(positive, 2),
+            round(negative, 2),
+            totals.negations,
+            totals.intensifiers,
+        )
+        return SentimentResult(sentiment, confidence, dict(zip(DETAIL_KEYS, values)))
+
+
+def score_chunks(chunks, lexicon=None, mode="full", top_words=TOP_WORDS):
+    """Analisa um texto dado como iterável de trechos (str)"""
+    scorer = StreamingScorer(lexicon, top_words)
+    for chunk in chunks:
+        scorer.feed(chunk)
+    return scorer.result(mode)
+
+
+def score_file(path, lexicon=None, mode="full", chunk_size=CHUNK_SIZE):
+    """Analisa um arquivo de texto lendo chunk_size caracteres por vez"""
+    with open(path, encoding="utf-8") as f:
+        return score_chunks(iter(lambda: f.read(chunk_size), ""), lexicon, mode)
@@ -3,7 +3,37 @@ Módulo de processamento de texto para análise de sentimento
 """
 
 import re
-from .dictionaries import NEGATION_WORDS, NEGATION_BREAKERS, INTENSIFIERS
+from .dictionaries import NEGATION_WORDS
+from .scanner import iter_context
+
+# Pontuação que preprocess_text mantém para contexto e depois tira das palavras
+_DROP_PUNCTUATION = str.maketrans("", "", ".!?")
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """Tokenização em uma passada, com o mesmo resultado de preprocess_text
+
+    Qualquer caractere fora de \\w vira separador, exceto ".!?", que são
+    apagados antes (preprocess_text os remove de dentro das palavras).
+    """
+    return [
+        word
+        for word in _WORD.findall(text.lower().translate(_DROP_PUNCTUATION))
+        if len(word) > 2 or word in NEGATION_WORDS
+    ]
+
+
+def tokenize_partial(text):
+    """Tokeniza um trecho de um texto maior: (tokens, resto)
+
+    Se o trecho termina no meio de uma palavra, ela não entra nos tokens e
+    volta como resto, para ser prefixada ao trecho seguinte.
+    """
+    text = text.lower().translate(_DROP_PUNCTUATION)
+    words = _WORD.findall(text)
+    rest = words.pop() if words and _WORD.match(text[-1]) else ""
+    return [word for word in words if len(word) > 2 or word in NEGATION_WORDS], rest
 
 
 def preprocess_text(text):
@@ -35,29 +65,6 @@ def preprocess_text(text):
     return filtered_words
 
 
-def analyze_with_context(words):
+def analyze_with_context(words, lexicon=None):
     """Analisa palavras considerando negação e intensificadores"""
-    result = []
-    i = 0
-
-    while i < len(words):
-        word = words[i]
-        is_negated = False
-        intensifier = 1.0
-
-        # Verifica intensificador na palavra anterior
-        if i > 0 and words[i - 1] in INTENSIFIERS:
-            intensifier = INTENSIFIERS[words[i - 1]]
-
-        # Verifica negação nas 2-3 palavras anteriores
-        negation_window = max(0, i - 3)
-        for j in range(negation_window, i):
-            if words[j] in NEGATION_WORDS:
-                is_negated = True
-            elif words[j] in NEGATION_BREAKERS:
-                is_negated = False  # Quebra a negação
-
-        result.append((word, is_negated, intensifier))
-        i += 1
-
-    return result
+    return list(iter_context(words, lexicon))
@@ -0,0 +1,169 @@
+"""
+Armazenamento dos tokens de cada notícia como ids inteiros
+
+A tokenização é feita uma vez, na ingestão: cada documento vira um
+array de ids uint32 de um vocabulário compartilhado (um token por linha
+em vocabulary.txt, id = número da linha). Reanalisar o corpus inteiro,
+contar palavras ou extrair palavras-chave passa a ser só consulta por id,
+sem regex. Os arquivos só crescem por anexação:
+
+    vocabulary.txt  tokens (UTF-8, um por linha)
+    tokens.u32      ids de todos os documentos, concatenados
+    lengths.u32     número de tokens de cada documento
+    doc_ids.i64     id da notícia de cada documento (gravado por último)
+"""
+
+import os
+from collections import Counter
+
+import numpy as np
+
+from .batch import analyze_encoded
+from .text_processor import tokenize
+
+VOCABULARY = "vocabulary.txt"
+TOKENS = "tokens.u32"
+LENGTHS = "lengths.u32"
+DOC_IDS = "doc_ids.i64"
+
+
+class DecodedDocuments:
+    """Acesso documento → lista de tokens (strings) sobre a matriz de ids"""
+
+    def __init__(self, ids, indptr, vocabulary):
+        self.ids = ids
+        self.indptr = indptr
+        self.vocabulary = vocabulary
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def __getitem__(self, i):
+        vocabulary = self.vocabulary
+        tokens = self.ids[self.indptr[i] : self.indptr[i + 1]].tolist()
+        return [vocabulary[t] for t in tokens]
+
+
+class TokenStore:
+    """Tokens das notícias em arrays de ids com vocabulário compartilhado"""
+
+    def __init__(self, root="data/tokens"):
+        """Abre (ou cria) o armazenamento no diretório informado"""
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self.vocabulary = self._read_vocabulary()
+        self._index = {token: i for i, token in enumerate(self.vocabulary)}
+        self.doc_ids, self.ids, self.indptr = self._read_documents()
+
+    def _path(self, name):
+        return os.path.join(self.root, name)
+
+    def _read_vocabulary(self):
+        try:
+            with open(self._path(VOCABULARY), encoding="utf-8") as f:
+                return f.read().splitlines()
+        except FileNotFoundError:
+            return []
+
+    def _read_array(self, name, dtype):
+        path = self._path(name)
+        if not os.path.exists(path):
+            return np.empty(0, dtype=dtype)
+        return np.fromfile(path, dtype=dtype)
+
+    def _read_documents(self):
+        # doc_ids é gravado por último: documentos sem id são descartados
+        doc_ids = self._read_array(DOC_IDS, np.int64)
+        lengths = self._read_array(LENGTHS, np.uint32)[: len(doc_ids)]
+        indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        ids = self._read_array(TOKENS, np.uint32)[: indptr[-1]]
+
+        # Descarta sobras de uma gravação interrompida antes de anexar de novo
+        for name, size in ((LENGTHS, len(lengths) * 4), (TOKENS, len(ids) * 4)):
+            path = self._path(name)
+            if os.path.exists(path) and os.path.getsize(path) > size:
+                os.truncate(path, size)
+        return doc_ids, ids, indptr
+
+    def __len__(self):
+        return len(self.doc_ids)
+
+    @property
+    def last_id(self):
+        """Maior id de notícia armazenado (None se vazio)"""
+        return int(self.doc_ids.max()) if len(self.doc_ids) else None
+
+    def append(self, doc_ids, documents):
+        """Anexa documentos já tokenizados (listas de tokens)"""
+        documents = list(documents)
+        if not documents:
+            return
+
+        index = self._index
+        new_tokens = []
+        for words in documents:
+            for token in words:
+                if token not in index:
+                    index[token] = len(index)
+                    new_tokens.append(token)
+
+        lengths = np.fromiter(map(len, documents), dtype=np.uint32)
+        ids = np.fromiter(
+            (index[token] for words in documents for token in words),
+            dtype=np.uint32,
+            count=int(lengths.sum()),
+        )
+        doc_ids = np.asarray(list(doc_ids), dtype=np.int64)
+
+        with open(self._path(VOCABULARY), "a", encoding="utf-8") as f:
+            f.writelines(f"{token}\n" for token in new_tokens)
+        for name, array in ((TOKENS, ids), (LENGTHS, lengths), (DOC_IDS, doc_ids)):
+            with open(self._path(name), "ab") as f:
+                array.tofile(f)
+
+        self.vocabulary.extend(new_tokens)
+        self.ids = np.concatenate([self.ids, ids])
+        self.indptr = np.concatenate(
+            [self.indptr, self.indptr[-1] + np.cumsum(lengths, dtype=np.int64)]
+        )
+        self.doc_ids = np.concatenate([self.doc_ids, doc_ids])
+
+    def append_texts(self, doc_ids, texts):
+        """Tokeniza e anexa os textos"""
+        self.append(doc_ids, (tokenize(str(text)) for text in texts))
+
+    def sync(self, store):
+        """Tokeniza as notícias do banco inseridas depois do último id"""
+        news = store.news_texts(after_id=self.last_id)
+        self.append_texts(news["id"].tolist(), news["texto_completo"])
+        return len(news)
+
+    def documents(self):
+        """Tokens (strings) de cada documento, decodificados sob demanda"""
+        return DecodedDocuments(self.ids, self.indptr, self.vocabulary)
+
+    def encoded(self):
+        """Matriz CSR no formato de batch.encode: (ids, ponteiros, vocabulário)"""
+        return self.ids.astype(np.int64), self.indptr, dict(self._index)
+
+    def analyze(self, lexicon=None, words=True):
+        """Analisa todos os documentos direto dos ids (sem tokenizar)
+
+        Retorna as colunas do motor em lote mais "id" (id da notícia).
+        """
+        columns = analyze_encoded(*self.encoded(), self.documents(), lexicon, words)
+        columns["id"] = self.doc_ids
+        return columns
+
+    def token_counts(self):
+        """Frequência de cada token no corpus, contada sobre os ids"""
+        counts = np.bincount(self.ids, minlength=len(self.vocabulary))
+        order = np.flatnonzero(counts)
+        return Counter(
+            dict(
+                zip(
+                    (self.vocabulary[i] for i in order.tolist()), counts[order].tolist()
+                )
+            )
+        )
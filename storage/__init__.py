@@ -0,0 +1,13 @@
+"""
+Armazenamento das notícias e dos resultados de análise
+"""
+
+from .sqlite_store import NewsStore
+from .parquet_store import PARQUET_AVAILABLE
+
+__all__ = ["NewsStore", "PARQUET_AVAILABLE"]
+
+if PARQUET_AVAILABLE:
+    from .parquet_store import ParquetStore, migrate_csv
+
+    __all__.extend(["ParquetStore", "migrate_csv"])
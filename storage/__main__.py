@@ -0,0 +1,24 @@
+"""
+Migração única do CSV legado para o conjunto Parquet particionado
+
+Uso: python -m storage [--csv data/noticias.csv] [--root data/parquet]
+"""
+
+import argparse
+
+from .parquet_store import migrate_csv
+
+
+def main(argv=None):
+    """Converte o CSV legado para Parquet particionado"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--csv", default="data/noticias.csv")
+    parser.add_argument("--root", default="data/parquet")
+    args = parser.parse_args(argv)
+
+    count = migrate_csv(args.csv, args.root)
+    print(f"{count} notícias migradas para {args.root}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Armazenamento colunar em Parquet particionado por mês de publicação
+
+Cada gravação do coletor vira um novo arquivo dentro da partição
+``mes=AAAA-MM``. Colunas categóricas (termo e sentimento) usam
+codificação de dicionário. A leitura usa memory-map, lê só as colunas
+pedidas e descarta partições fora do período selecionado.
+
+Requer pyarrow (dependência opcional); sem ele PARQUET_AVAILABLE é False.
+"""
+
+import os
+import uuid
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from .sqlite_store import publication_timestamp, TERMS_SEPARATOR, _day_bounds
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+    import pyarrow.parquet as pq
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+DICTIONARY_COLUMNS = ["termo_busca", "sentimento"]
+PARTITION_COLUMN = "mes"
+# Partição das notícias sem data de publicação válida
+UNDATED_PARTITION = "sem-data"
+
+
+def _month(timestamp):
+    if pd.isna(timestamp):
+        return UNDATED_PARTITION
+    return datetime.fromtimestamp(int(timestamp), timezone.utc).strftime("%Y-%m")
+
+
+def _months_between(date_range):
+    """Lista as partições mensais cobertas por um intervalo de datas"""
+    inicio, fim = date_range
+    months = []
+    year, month = inicio.year, inicio.month
+    while (year, month) <= (fim.year, fim.month):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+class ParquetStore:
+    """Conjunto de dados Parquet particionado por mês de publicação"""
+
+    def __init__(self, root="data/parquet"):
+        """Define o diretório raiz do conjunto de dados"""
+        if not PARQUET_AVAILABLE:
+            raise ImportError("pyarrow é necessário para o armazenamento Parquet")
+        self.root = root
+
+    def exists(self):
+        """Indica se já há arquivos gravados"""
+        return os.path.isdir(self.root) and any(
+            name.endswith(".parquet")
+            for _, _, files in os.walk(self.root)
+            for name in files
+        )
+
+    def _to_frame(self, news_data):
+        df = pd.DataFrame(list(news_data))
+        if "texto_completo" in df.columns:
+            # Derivado de título + descrição na leitura
+            df = df.drop(columns="texto_completo")
+        if "termos_busca" in df.columns:
+            df["termos_busca"] = [
+                TERMS_SEPARATOR.join(t) if isinstance(t, list) else t
+                for t in df["termos_busca"]
+            ]
+        df["timestamp_publicacao"] = pd.array(
+            [publication_timestamp(item) for item in df.to_dict("records")],
+            dtype="Int64",
+        )
+        df[PARTITION_COLUMN] = [_month(ts) for ts in df["timestamp_publicacao"]]
+        for column in DICTIONARY_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype("category")
+        return df
+
+    def write(self, news_data):
+        """Grava as notícias como novos arquivos nas partições mensais"""
+        df = self._to_frame(news_data)
+        if df.empty:
+            return 0
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_to_dataset(
+            table,
+            self.root,
+            partition_cols=[PARTITION_COLUMN],
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            use_dictionary=[c for c in DICTIONARY_COLUMNS if c in df.columns],
+            compression="zstd",
+        )
+        return len(df)
+
+    def _dataset(self):
+        # use_mmap: páginas do arquivo são mapeadas em vez de copiadas
+        filesystem = pafs.LocalFileSystem(use_mmap=True)
+        return ds.dataset(
+            self.root, format="parquet", partitioning="hive", filesystem=filesystem
+        )
+
+    def read(self, columns=None, date_range=None):
+        """Lê as colunas pedidas, só das partições do período (se informado)"""
+        dataset = self._dataset()
+        expression = None
+
+        if date_range and len(date_range) == 2:
+            start, end = _day_bounds(date_range)
+            expression = (
+                pc.field(PARTITION_COLUMN).isin(_months_between(date_range))
+                & (pc.field("timestamp_publicacao") >= start)
+                & (pc.field("timestamp_publicacao") < end)
+            )
+
+        wanted = None
+        if columns is not None:
+            available = set(dataset.schema.names)
+            wanted = [c for c in columns if c in available]
+            # texto_completo é derivado; garante as colunas de origem
+            if "texto_completo" in columns:
+                wanted += [c for c in ("titulo", "descricao") if c not in wanted]
+
+        table = dataset.to_table(columns=wanted, filter=expression)
+        df = table.to_pandas()
+
+        if columns is None or "texto_completo" in columns:
+            df["texto_completo"] = (
+                df["titulo"].astype(str) + " " + df["descricao"].fillna("").astype(str)
+            )
+        return df
+
+
+def migrate_csv(csv_path="data/noticias.csv", root="data/parquet"):
+    """Migração única do CSV existente para o conjunto Parquet"""
+    store = ParquetStore(root)
+    if store.exists():
+        raise FileExistsError(f"O conjunto Parquet já existe em {root}")
+
+    df = pd.read_csv(csv_path)
+    df = df.astype(object).where(df.notna(), None)
+    return store.write(df.to_dict("records"))
@@ -0,0 +1,397 @@
+"""
+Banco SQLite com notícias, termos encontrados e resultados de análise
+
+O banco é a fonte de verdade da coleta; CSV e JSON passam a ser apenas
+exportações. Filtros e agregações do dashboard são executados em SQL
+sobre colunas indexadas em vez de varreduras completas no pandas.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, time, timedelta, timezone
+
+import pandas as pd
+
+from collector.seen_index import canonical_key
+from utils.date_parsing import parse_rfc822_utc
+
+TERMS_SEPARATOR = "|"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS news (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    termo_busca TEXT NOT NULL,
+    titulo TEXT NOT NULL,
+    link TEXT,
+    descricao TEXT,
+    data_publicacao TEXT,
+    published_at INTEGER,
+    data_coleta TEXT,
+    cluster_id TEXT
+);
+CREATE TABLE IF NOT EXISTS term_matches (
+    news_id INTEGER NOT NULL REFERENCES news(id) ON DELETE CASCADE,
+    termo TEXT NOT NULL,
+    PRIMARY KEY (news_id, termo)
+);
+CREATE TABLE IF NOT EXISTS analysis (
+    news_id INTEGER PRIMARY KEY REFERENCES news(id) ON DELETE CASCADE,
+    sentimento TEXT NOT NULL,
+    confianca REAL NOT NULL,
+    palavras_positivas TEXT,
+    palavras_negativas TEXT,
+    lexicon_version TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_news_published_at ON news(published_at);
+CREATE INDEX IF NOT EXISTS idx_news_termo_busca ON news(termo_busca);
+CREATE INDEX IF NOT EXISTS idx_term_matches_termo ON term_matches(termo, news_id);
+CREATE INDEX IF NOT EXISTS idx_analysis_sentimento ON analysis(sentimento, confianca);
+"""
+
+# texto_completo é derivado (título + descrição), não armazenado
+NEWS_COLUMNS = """
+    n.id,
+    n.termo_busca,
+    n.titulo,
+    n.link,
+    n.descricao,
+    n.data_publicacao,
+    n.published_at AS timestamp_publicacao,
+    n.data_coleta,
+    n.titulo || ' ' || COALESCE(n.descricao, '') AS texto_completo,
+    (SELECT GROUP_CONCAT(t.termo, '|') FROM term_matches t WHERE t.news_id = n.id)
+        AS termos_busca,
+    n.cluster_id
+"""
+
+ANALYSIS_COLUMNS = """
+    a.sentimento,
+    a.confianca,
+    a.palavras_positivas,
+    a.palavras_negativas
+"""
+
+EXPORT_COLUMNS = [
+    "termo_busca",
+    "titulo",
+    "link",
+    "descricao",
+    "data_publicacao",
+    "timestamp_publicacao",
+    "data_coleta",
+    "texto_completo",
+    "termos_busca",
+    "cluster_id",
+]
+
+
+def publication_timestamp(item):
+    """Timestamp UTC da publicação: o calculado na coleta ou parseado agora"""
+    timestamp = item.get("timestamp_publicacao")
+    if timestamp is not None and not pd.isna(timestamp):
+        return int(timestamp)
+    return parse_rfc822_utc(item.get("data_publicacao"))
+
+
+def _day_bounds(date_range):
+    """Converte um intervalo de datas (inclusivo) em timestamps UTC [início, fim)"""
+    inicio, fim = date_range
+    start = datetime.combine(inicio, time.min, tzinfo=timezone.utc)
+    end = datetime.combine(fim, time.min, tzinfo=timezone.utc) + timedelta(days=1)
+    return int(start.timestamp()), int(end.timestamp())
+
+
+class NewsStore:
+    """Repositório SQLite (modo WAL) das notícias coletadas"""
+
+    def __init__(self, path="data/noticias.db"):
+        """Abre (ou cria) o banco no caminho informado"""
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # O Streamlit executa o script em threads diferentes
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(SCHEMA)
+            self._migrate()
+
+    def _migrate(self):
+        # Bancos anteriores à versão do léxico: resultados sem versão ficam
+        # pendentes e são reanalisados uma vez
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(analysis)")}
+        if "lexicon_version" not in columns:
+            self._conn.execute("ALTER TABLE analysis ADD COLUMN lexicon_version TEXT")
+
+    def close(self):
+        """Fecha a conexão com o banco"""
+        self._conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM news").fetchone()[0]
+
+    # Escrita
+
+    def upsert_news(self, news_data):
+        """Insere notícias inéditas e registra os termos; retorna as que eram novas"""
+        inserted = []
+
+        with self._lock, self._conn:
+            for item in news_data:
+                terms = item.get("termos_busca") or [item["termo_busca"]]
+                if isinstance(terms, str):
+                    terms = terms.split(TERMS_SEPARATOR)
+
+                cursor = self._conn.execute(
+                    """
+                    INSERT OR IGNORE INTO news (
+                        key, termo_busca, titulo, link, descricao,
+                        data_publicacao, published_at, data_coleta, cluster_id
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        canonical_key(item),
+                        item["termo_busca"],
+                        item["titulo"],
+                        item.get("link"),
+                        item.get("descricao"),
+                        item.get("data_publicacao"),
+                        publication_timestamp(item),
+                        item.get("data_coleta"),
+                        item.get("cluster_id"),
+                    ),
+                )
+                if cursor.rowcount:
+                    inserted.append(item)
+
+                self._conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO term_matches (news_id, termo)
+                    SELECT id, ? FROM news WHERE key = ?
+                    """,
+                    [(term, canonical_key(item)) for term in terms],
+                )
+
+        return inserted
+
+    def import_csv(self, filename):
+        """Migra um CSV existente para o banco"""
+        df = pd.read_csv(filename)
+        df = df.astype(object).where(df.notna(), None)
+        return self.upsert_news(df.to_dict("records"))
+
+    def save_analysis(self, rows, lexicon_version=None):
+        """Grava resultados de análise: (news_id, sentimento, confiança, positivas, negativas)
+
+        lexicon_version identifica o léxico que produziu os resultados.
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO analysis (
+                    news_id, sentimento, confianca,
+                    palavras_positivas, palavras_negativas, lexicon_version
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (tuple(row) + (lexicon_version,) for row in rows),
+            )
+
+    def relabel_analysis(self, old_version, new_version):
+        """Marca com a nova versão os resultados que a troca de léxico não altera"""
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "UPDATE analysis SET lexicon_version = ? WHERE lexicon_version = ?",
+                (new_version, old_version),
+            ).rowcount
+
+    # Consulta
+
+    def _where(
+        self,
+        sentimento=None,
+        termo=None,
+        date_range=None,
+        min_confidence=0,
+        date_field="publicacao",
+    ):
+        """Monta a cláusula WHERE com os filtros do dashboard
+
+        date_field="coleta" filtra pela data de coleta, usada quando o
+        dashboard não encontra datas de publicação válidas.
+        """
+        clauses, params = [], []
+
+        if sentimento and sentimento != "Todos":
+            clauses.append("a.sentimento = ?")
+            params.append(sentimento)
+        if min_confidence and min_confidence > 0:
+            clauses.append("a.confianca >= ?")
+            params.append(min_confidence)
+        if termo and termo != "Todos":
+            clauses.append(
+                "EXISTS (SELECT 1 FROM term_matches t "
+                "WHERE t.news_id = n.id AND t.termo = ?)"
+            )
+            params.append(termo)
+        if date_range and len(date_range) == 2 and date_field == "coleta":
+            clauses.append("DATE(n.data_coleta) BETWEEN ? AND ?")
+            params.extend(d.isoformat() for d in date_range)
+        elif date_range and len(date_range) == 2:
+            clauses.append("n.published_at >= ? AND n.published_at < ?")
+            params.extend(_day_bounds(date_range))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def _read(self, sql, params=()):
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def query_news(self, **filters):
+        """Retorna as notícias (com análise, quando houver) que atendem aos filtros"""
+        where, params = self._where(**filters)
+        df = self._read(
+            f"""
+            SELECT {NEWS_COLUMNS}, {ANALYSIS_COLUMNS}
+            FROM news n LEFT JOIN analysis a ON a.news_id = n.id
+            {where}
+            ORDER BY n.id
+            """,
+            params,
+        )
+        df["timestamp_publicacao"] = df["timestamp_publicacao"].astype("Int64")
+        return df
+
+    def news_ids(self, **filters):
+        """Ids das notícias que atendem aos filtros (sem montar as colunas)"""
+        where, params = self._where(**filters)
+        return self._read(
+            f"""
+            SELECT n.id FROM news n LEFT JOIN analysis a ON a.news_id = n.id
+            {where}
+            """,
+            params,
+        )["id"]
+
+    def pending_analysis(self, lexicon_version=None):
+        """Retorna id e texto das notícias ainda sem análise
+
+        Com lexicon_version, também as analisadas com outro léxico (por
+        exemplo, editado com o dashboard fora do ar).
+        """
+        stale = "" if lexicon_version is None else "OR a.lexicon_version IS NOT ?"
+        params = [] if lexicon_version is None else [lexicon_version]
+        return self._read(
+            f"""
+            SELECT n.id, n.titulo || ' ' || COALESCE(n.descricao, '') AS texto_completo
+            FROM news n LEFT JOIN analysis a ON a.news_id = n.id
+            WHERE a.news_id IS NULL {stale}
+            ORDER BY n.id
+            """,
+            params,
+        )
+
+    def news_texts(self, ids=None, after_id=None):
+        """Retorna id e texto das notícias: todas, as dos ids ou as posteriores a um id"""
+        sql = """
+            SELECT n.id, n.titulo || ' ' || COALESCE(n.descricao, '') AS texto_completo
+            FROM news n
+        """
+        if ids is None:
+            params = [] if after_id is None else [after_id]
+            where = "" if after_id is None else "WHERE n.id > ?"
+            return self._read(f"{sql} {where} ORDER BY n.id", params)
+
+        # Consulta em blocos por causa do limite de parâmetros do SQLite
+        ids = [int(i) for i in ids]
+        frames = [
+            self._read(
+                f"{sql} WHERE n.id IN ({','.join('?' * len(chunk))}) ORDER BY n.id",
+                chunk,
+            )
+            for chunk in (ids[i : i + 900] for i in range(0, len(ids), 900))
+        ]
+        if not frames:
+            return self._read(f"{sql} WHERE 0")
+        return pd.concat(frames, ignore_index=True)
+
+    def count_by(self, column, **filters):
+        """Conta notícias agrupadas por sentimento, termo ou dia de publicação"""
+        expressions = {
+            "sentimento": "a.sentimento",
+            "termo_busca": "t.termo",
+            "data": "DATE(n.published_at, 'unixepoch')",
+        }
+        if column not in expressions:
+            raise ValueError(f"Agrupamento não suportado: {column}")
+
+        where, params = self._where(**filters)
+        join_terms = (
+            "JOIN term_matches t ON t.news_id = n.id" if column == "termo_busca" else ""
+        )
+        df = self._read(
+            f"""
+            SELECT {expressions[column]} AS {column}, COUNT(*) AS count
+            FROM news n LEFT JOIN analysis a ON a.news_id = n.id {join_terms}
+            {where}
+            GROUP BY 1 ORDER BY 2 DESC
+            """,
+            params,
+        )
+        return dict(zip(df[column], df["count"]))
+
+    def distinct_terms(self):
+        """Lista os termos de busca registrados"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT termo FROM term_matches ORDER BY termo"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def date_range(self):
+        """Retorna (mínimo, máximo) das datas de publicação ou None"""
+        with self._lock:
+            low, high = self._conn.execute(
+                "SELECT MIN(published_at), MAX(published_at) FROM news"
+            ).fetchone()
+        if low is None:
+            return None
+        return (
+            datetime.fromtimestamp(low, timezone.utc).date(),
+            datetime.fromtimestamp(high, timezone.utc).date(),
+        )
+
+    # Exportação
+
+    def export_csv(self, filename="data/noticias.csv"):
+        """Exporta todas as notícias para CSV"""
+        if os.path.dirname(filename):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self.query_news()[EXPORT_COLUMNS].to_csv(
+            filename, index=False, encoding="utf-8"
+        )
+
+    def export_json(self, filename="data/noticias.json"):
+        """Exporta todas as notícias para JSON (termos como lista)"""
+        records = self.query_news()[EXPORT_COLUMNS].to_dict("records")
+        for record in records:
+            record["termos_busca"] = (record["termos_busca"] or "").split(
+                TERMS_SEPARATOR
+            )
+            timestamp = record["timestamp_publicacao"]
+            record["timestamp_publicacao"] = (
+                None if pd.isna(timestamp) else int(timestamp)
+            )
+
+        if os.path.dirname(filename):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False, indent=2)
@@ -2,10 +2,23 @@
 Testes básicos para o projeto Monitor IA Piauí
 """
 
+import asyncio
+import os
+import tempfile
 import unittest
+from unittest import mock
 import pandas as pd
-from sentiment_analysis import SentimentAnalyzer
+from sentiment_analysis import SentimentAnalyzer, Lexicon, compile_lexicon, dictionaries
 from utils.text_processing import clean_text_pipeline, extract_keywords
+from utils.text_processing import keywords_from_counts
+from news_collector import NewsCollector
+from collector import HttpTransport, CircuitOpenError, TransportError, FeedCache
+from collector import iter_feed_items, LXML_AVAILABLE
+from collector import SeenIndex, BloomFilter
+from collector import NearDuplicateIndex, item_signature
+from storage import NewsStore, PARQUET_AVAILABLE
+from testing import FixtureRSSServer, build_rss
+from utils.date_parsing import parse_rfc822_utc
 
 
 class TestSentimentAnalyzer(unittest.TestCase):
@@ -130,6 +143,1428 @@ class TestDataIntegrity(unittest.TestCase):
             self.skipTest("Arquivo de dados não encontrado")
 
 
+class TestNewsCollector(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FixtureRSSServer(num_items=5).__enter__()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.collector = NewsCollector(
+            base_url=self.server.base_url,
+            search_terms=["IA Piauí", "SIA Piauí"],
+            cache=FeedCache(self.cache_dir.name),
+        )
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+        self.cache_dir.cleanup()
+
+    @staticmethod
+    def _without_collection_time(news):
+        return [{k: v for k, v in n.items() if k != "data_coleta"} for n in news]
+
+    def test_async_matches_sequential(self):
+        """Testa que a coleta assíncrona retorna o mesmo conteúdo e ordem"""
+        sequential = self.collector.collect_all_news()
+        concurrent = asyncio.run(self.collector.collect_all_news_async())
+
+        self.assertEqual(len(concurrent), 10)
+        self.assertEqual(
+            self._without_collection_time(sequential),
+            self._without_collection_time(concurrent),
+        )
+        self.assertEqual(concurrent[0]["termo_busca"], "IA Piauí")
+
+    def test_cache_skips_fresh_and_unchanged_feeds(self):
+        """Testa cache dentro do TTL e GET condicional com resposta 304"""
+        fetch = self.collector.fetch_news_for_term
+        first = self._without_collection_time(fetch("IA Piauí"))
+        self.assertEqual(self._without_collection_time(fetch("IA Piauí")), first)
+        self.assertEqual(self.server.request_count, 1)
+
+        # TTL expirado: revalida com If-None-Match e reaproveita os itens
+        self.collector.cache.ttl_seconds = 0
+        self.assertEqual(self._without_collection_time(fetch("IA Piauí")), first)
+        self.assertEqual(self.server.request_count, 2)
+        self.assertEqual(self.server.not_modified_count, 1)
+
+    def test_cache_respects_item_limit(self):
+        """Testa que um limite menor não trunca as coletas seguintes"""
+        fetch = self.collector.fetch_news_for_term
+        self.assertEqual(len(fetch("IA Piauí", max_items=2)), 2)
+        full = fetch("IA Piauí")
+        self.assertEqual(len(full), 5)
+        self.assertEqual(self.server.request_count, 2)
+
+        # Itens do cache ganham a data de coleta da execução atual
+        with mock.patch("news_collector.datetime") as clock:
+            clock.now.return_value.isoformat.return_value = "2030-01-01T00:00:00"
+            cached = fetch("IA Piauí")
+        self.assertEqual(self.server.request_count, 2)
+        self.assertEqual({n["data_coleta"] for n in cached}, {"2030-01-01T00:00:00"})
+
+
+class TestHttpTransport(unittest.TestCase):
+
+    def test_circuit_opens_after_failures(self):
+        """Testa que um feed que falha para de consumir retentativas"""
+        transport = HttpTransport(min_interval=0, failure_threshold=3)
+        url = "http://127.0.0.1:9/rss"
+
+        with mock.patch("collector.transport.time.sleep"):
+            with self.assertRaises(TransportError):
+                transport.get(url, max_retries=3)
+
+            self.assertEqual(transport.breaker_for(url).state, "aberto")
+            with mock.patch.object(transport.session, "get") as session_get:
+                with self.assertRaises(CircuitOpenError):
+                    transport.get(url)
+                session_get.assert_not_called()
+
+    def test_client_error_fails_fast(self):
+        """Testa que 4xx não é retentado nem abre o circuito, e a resposta é fechada"""
+        import requests
+
+        transport = HttpTransport(min_interval=0, failure_threshold=1)
+        url = "http://127.0.0.1:9/rss"
+
+        def respond(status):
+            response = requests.Response()
+            response.status_code = status
+            response.url = url
+            response.close = mock.Mock()
+            return response
+
+        with mock.patch("collector.transport.time.sleep"):
+            not_found = respond(404)
+            with mock.patch.object(transport.session, "get", return_value=not_found):
+                with self.assertRaises(TransportError):
+                    transport.get(url, max_retries=3, stream=True)
+                self.assertEqual(transport.session.get.call_count, 1)
+            not_found.close.assert_called_once()
+            self.assertEqual(transport.breaker_for(url).state, "fechado")
+
+            # 429 continua sendo retentado
+            transport = HttpTransport(min_interval=0)
+            throttled = [respond(429), respond(429)]
+            with mock.patch.object(transport.session, "get", side_effect=throttled):
+                with self.assertRaises(TransportError):
+                    transport.get(url, max_retries=2)
+                self.assertEqual(transport.session.get.call_count, 2)
+            self.assertTrue(all(r.close.called for r in throttled))
+
+    def test_collector_shares_pooled_session(self):
+        """Testa que o coletor usa a sessão do transporte compartilhado"""
+        transport = HttpTransport(min_interval=0)
+        collector = NewsCollector(transport=transport)
+        self.assertIs(collector.session, transport.session)
+
+
+class TestRSSParser(unittest.TestCase):
+
+    def test_stdlib_and_lxml_paths_match(self):
+        """Testa que o parser da biblioteca padrão extrai os mesmos itens"""
+        if not LXML_AVAILABLE:
+            self.skipTest("lxml não instalado")
+        body = build_rss("IA Piauí", num_items=20)
+        chunks = [body[i : i + 100] for i in range(0, len(body), 100)]
+
+        self.assertEqual(
+            list(iter_feed_items(chunks, use_lxml=True)),
+            list(iter_feed_items(chunks, use_lxml=False)),
+        )
+
+    def test_early_stop_does_not_consume_whole_feed(self):
+        """Testa que o parse para ao atingir o limite de itens"""
+        body = build_rss("IA Piauí", num_items=500)
+        consumed = []
+
+        def chunks():
+            for i in range(0, len(body), 1024):
+                consumed.append(i)
+                yield body[i : i + 1024]
+
+        news = NewsCollector(use_cache=False).parse_feed(chunks(), "IA Piauí", 3)
+        self.assertEqual(len(news), 3)
+        self.assertLess(len(consumed), len(body) // 1024 // 10)
+
+
+class TestIncrementalIngest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.csv = os.path.join(self.tmp.name, "noticias.csv")
+        self.json = os.path.join(self.tmp.name, "noticias.json")
+        self.store = NewsStore(os.path.join(self.tmp.name, "noticias.db"))
+        self.collector = NewsCollector(use_cache=False, store=self.store)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def _item(self, term, link):
+        return {
+            "termo_busca": term,
+            "titulo": f"Notícia {link}",
+            "link": f"https://example.com/{link}?oc=5",
+            "descricao": "",
+            "data_publicacao": "",
+            "data_coleta": "",
+            "texto_completo": f"Notícia {link}",
+        }
+
+    def _ingest(self, items):
+        index = SeenIndex(os.path.join(self.tmp.name, "index"))
+        return self.collector.ingest_incremental(items, index, self.csv, self.json)
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        """Testa que toda chave adicionada ao filtro é encontrada"""
+        bloom = BloomFilter(capacity=1000)
+        keys = [f"https://example.com/{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+        self.assertTrue(all(key in restored for key in keys))
+
+    def test_only_new_items_are_appended(self):
+        """Testa que repetições viram um item com termos multivalorados"""
+        first = self._ingest([self._item("IA Piauí", 1), self._item("SIA Piauí", 1)])
+        self.assertEqual(len(first), 1)
+        self.assertEqual(first[0]["termos_busca"], ["IA Piauí", "SIA Piauí"])
+
+        second = self._ingest([self._item("IA Piauí", 1), self._item("IA Piauí", 2)])
+        self.assertEqual(len(second), 1)
+
+        df = pd.read_csv(self.csv)
+        self.assertEqual(len(df), 2)
+        self.assertEqual(df.loc[0, "termos_busca"], "IA Piauí|SIA Piauí")
+
+    def test_new_term_for_known_item_updates_terms(self):
+        """Testa que um novo termo para notícia conhecida não duplica linhas"""
+        self._ingest([self._item("IA Piauí", 1)])
+        self.assertEqual(self._ingest([self._item("SoberanIA Piauí", 1)]), [])
+
+        df = pd.read_csv(self.csv)
+        self.assertEqual(len(df), 1)
+        self.assertEqual(df.loc[0, "termos_busca"], "IA Piauí|SoberanIA Piauí")
+
+    def test_bootstrap_from_csv_with_empty_link(self):
+        """Testa a indexação do CSV legado com célula de link vazia"""
+        legacy = [self._item("IA Piauí", 1), self._item("IA Piauí", 2)]
+        legacy[0]["link"] = ""
+        pd.DataFrame(legacy).to_csv(self.csv, index=False)
+        self.assertTrue(pd.read_csv(self.csv)["link"].isna().any())
+
+        new = self._item("IA Piauí", 3)
+        new_items = self._ingest([self._item("SIA Piauí", 2), new])
+        self.assertEqual([item["link"] for item in new_items], [new["link"]])
+
+        df = pd.read_csv(self.csv)
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df.loc[1, "termos_busca"], "IA Piauí|SIA Piauí")
+
+
+class TestNearDuplicates(unittest.TestCase):
+
+    def test_syndicated_titles_share_cluster(self):
+        """Testa que títulos sindicados caem no mesmo cluster"""
+        index = NearDuplicateIndex()
+        a = index.add(
+            item_signature(
+                {"titulo": "Piauí lança SoberanIA, IA em português - pi.gov.br"}
+            )
+        )
+        b = index.add(
+            item_signature({"titulo": "Piauí lança a SoberanIA, IA em português - G1"})
+        )
+        c = index.add(
+            item_signature({"titulo": "Secretaria abre curso de robótica - G1"})
+        )
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+
+    def test_signature_ignores_empty_csv_cells(self):
+        """Testa assinatura de linha de CSV com descrição vazia (NaN)"""
+        title = "Governo do Piauí apresenta plano estadual de IA"
+        self.assertEqual(
+            item_signature({"titulo": title, "descricao": float("nan")}),
+            item_signature({"titulo": title, "descricao": ""}),
+        )
+
+    def test_clusters_persist_between_runs(self):
+        """Testa que o índice persistido reconhece clusters de execuções anteriores"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "near_duplicates.jsonl")
+            item = {"titulo": "Governo do Piauí apresenta plano estadual de IA"}
+
+            first = NearDuplicateIndex(path)
+            cluster = first.add(item_signature(item))
+            first.save()
+
+            self.assertEqual(
+                NearDuplicateIndex(path).find(item_signature(item)), cluster
+            )
+
+
+class TestNewsStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = NewsStore(os.path.join(self.tmp.name, "noticias.db"))
+        self.store.upsert_news(
+            [
+                {
+                    "termo_busca": "IA Piauí",
+                    "termos_busca": ["IA Piauí", "SIA Piauí"],
+                    "titulo": "Piauí lança excelente plataforma",
+                    "link": "https://example.com/1?oc=5",
+                    "descricao": "Inovação",
+                    "data_publicacao": "Thu, 06 Feb 2025 08:00:00 GMT",
+                    "data_coleta": "2025-09-02T15:02:31",
+                },
+                {
+                    "termo_busca": "IA Piauí",
+                    "titulo": "Riscos da automação",
+                    "link": "https://example.com/2",
+                    "descricao": "",
+                    "data_publicacao": "Mon, 23 Jun 2025 07:00:00 GMT",
+                    "data_coleta": "2025-09-02T15:02:31",
+                },
+            ]
+        )
+        ids = self.store.query_news()["id"].tolist()
+        self.store.save_analysis(
+            [
+                (ids[0], "positivo", 0.7, "excelente", ""),
+                (ids[1], "negativo", 0.5, "", "riscos"),
+            ]
+        )
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_duplicate_link_is_ignored(self):
+        """Testa que a mesma notícia não é inserida duas vezes"""
+        inserted = self.store.upsert_news(
+            [
+                {
+                    "termo_busca": "SoberanIA Piauí",
+                    "titulo": "Piauí lança excelente plataforma",
+                    "link": "https://example.com/1",
+                }
+            ]
+        )
+        self.assertEqual(inserted, [])
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.store.count_by("termo_busca")["SoberanIA Piauí"], 1)
+
+    def test_filters_run_in_sql(self):
+        """Testa filtros por termo multivalorado, sentimento e período"""
+        from datetime import date
+
+        self.assertEqual(len(self.store.query_news(termo="SIA Piauí")), 1)
+        self.assertEqual(len(self.store.query_news(sentimento="negativo")), 1)
+        self.assertEqual(len(self.store.query_news(min_confidence=0.6)), 1)
+        by_date = self.store.query_news(
+            date_range=(date(2025, 6, 1), date(2025, 6, 30))
+        )
+        self.assertEqual(by_date["titulo"].tolist(), ["Riscos da automação"])
+        self.assertEqual(
+            self.store.count_by("sentimento"), {"positivo": 1, "negativo": 1}
+        )
+
+    def test_export_csv_keeps_collector_columns(self):
+        """Testa que a exportação mantém as colunas do CSV original"""
+        filename = os.path.join(self.tmp.name, "noticias.csv")
+        self.store.export_csv(filename)
+        df = pd.read_csv(filename)
+        self.assertEqual(
+            df.loc[0, "texto_completo"], "Piauí lança excelente plataforma Inovação"
+        )
+        self.assertEqual(df.loc[0, "termos_busca"], "IA Piauí|SIA Piauí")
+
+    def test_collector_run_upserts_once(self):
+        """Testa que a coleta grava no banco uma vez e só exporta CSV/JSON"""
+        import news_collector
+
+        collector = NewsCollector(use_cache=False, store=self.store)
+        item = {
+            "termo_busca": "IA Piauí",
+            "titulo": "Nova notícia",
+            "link": "https://example.com/3",
+            "descricao": "",
+            "data_publicacao": "",
+            "data_coleta": "",
+        }
+        csv = os.path.join(self.tmp.name, "noticias.csv")
+        json_file = os.path.join(self.tmp.name, "noticias.json")
+        with mock.patch.object(
+            news_collector, "NewsCollector", return_value=collector
+        ), mock.patch.object(
+            collector, "collect_all_news", return_value=[item]
+        ), mock.patch.object(
+            collector, "save_to_csv", lambda: NewsCollector.save_to_csv(collector, csv)
+        ), mock.patch.object(
+            collector,
+            "save_to_json",
+            lambda: NewsCollector.save_to_json(collector, json_file),
+        ), mock.patch.object(
+            self.store, "upsert_news", wraps=self.store.upsert_news
+        ) as upsert, mock.patch.multiple(
+            news_collector.config, SALVAR_PARQUET=False, SALVAR_TOKENS=False
+        ):
+            news_collector.main([])
+
+        upsert.assert_called_once()
+        self.assertEqual(len(pd.read_csv(csv)), 3)
+        self.assertTrue(os.path.exists(json_file))
+
+    def test_dashboard_collection_uses_same_ingest(self):
+        """Testa o botão de coleta do dashboard: clusters, Parquet e tokens"""
+        import news_collector
+        from dashboard.components import sidebar
+
+        collector = NewsCollector(use_cache=False, store=self.store)
+        item = {"termo_busca": "IA Piauí", "titulo": "Nova", "link": "https://x/3"}
+        with mock.patch.object(
+            sidebar, "NewsCollector", return_value=collector
+        ), mock.patch.object(
+            collector, "collect_all_news", return_value=[item]
+        ), mock.patch.object(
+            collector, "save_to_csv"
+        ), mock.patch.object(
+            collector, "save_to_json"
+        ), mock.patch.object(
+            collector, "save_to_parquet"
+        ) as parquet, mock.patch.object(
+            collector, "save_tokens"
+        ) as tokens, mock.patch.object(
+            sidebar, "st"
+        ) as st, mock.patch.multiple(
+            news_collector.config, SALVAR_PARQUET=True, SALVAR_TOKENS=True
+        ):
+            st.button.return_value = True
+            sidebar.render_data_collection_controls()
+
+        news = self.store.query_news()
+        self.assertTrue(news["cluster_id"].iloc[-1])
+        if news_collector.PARQUET_AVAILABLE:
+            parquet.assert_called_once_with([item])
+        tokens.assert_called_once()
+
+    def test_filter_paths_agree_on_merged_terms(self):
+        """Testa o mesmo filtro no banco e no pandas, com rótulos só em memória"""
+        import dashboard.data_utils as data_utils
+
+        df = data_utils.apply_schema(self.store.query_news())
+        # Rótulo calculado nesta execução e ainda não gravado
+        df["sentimento"] = df["sentimento"].cat.add_categories("neutro")
+        df.loc[1, "sentimento"] = "neutro"
+
+        def filtered(store, sentimento="Todos"):
+            with mock.patch.object(data_utils, "get_store", return_value=store):
+                return data_utils.apply_filters(df, sentimento, "SIA Piauí", (), 0)
+
+        sql, pandas = filtered(self.store), filtered(None)
+        self.assertEqual(sql["id"].tolist(), pandas["id"].tolist())
+        self.assertEqual(sql["titulo"].tolist(), ["Piauí lança excelente plataforma"])
+        self.assertEqual(
+            filtered(self.store, "neutro")["id"].tolist(),
+            filtered(None, "neutro")["id"].tolist(),
+        )
+        with mock.patch.object(data_utils, "get_store", return_value=self.store):
+            unsaved = data_utils.apply_filters(df, "neutro", "Todos", (), 0)
+        self.assertEqual(unsaved["titulo"].tolist(), ["Riscos da automação"])
+
+    def test_results_from_other_lexicon_are_pending(self):
+        """Testa reanálise de resultados gravados com outro léxico (ou sem versão)"""
+        from dashboard.sentiment import analyze_pending_in_store
+
+        self.assertEqual(len(self.store.pending_analysis()), 0)
+        self.assertEqual(len(self.store.pending_analysis("v1")), 2)
+
+        analyze_pending_in_store(self.store, SentimentAnalyzer())
+        self.assertEqual(
+            len(self.store.pending_analysis(SentimentAnalyzer().lexicon_version)), 0
+        )
+
+        # Léxico editado com o dashboard fora do ar
+        edited = compile_lexicon(
+            positive={
+                w: v for w, v in dictionaries.POSITIVE_WORDS.items() if w != "excelente"
+            },
+            negative={**dictionaries.NEGATIVE_WORDS, "excelente": 3},
+        )
+        df = analyze_pending_in_store(self.store, SentimentAnalyzer(edited))
+        self.assertEqual(df["sentimento"].tolist(), ["negativo", "negativo"])
+        self.assertEqual(len(self.store.pending_analysis(edited.version)), 0)
+
+    def test_migrates_analysis_without_version(self):
+        """Testa banco antigo: coluna de versão criada e resultados pendentes"""
+        import sqlite3
+
+        path = os.path.join(self.tmp.name, "antigo.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            "CREATE TABLE analysis (news_id INTEGER PRIMARY KEY, "
+            "sentimento TEXT NOT NULL, confianca REAL NOT NULL, "
+            "palavras_positivas TEXT, palavras_negativas TEXT);"
+        )
+        conn.close()
+
+        store = NewsStore(path)
+        store.upsert_news([{"termo_busca": "IA", "titulo": "Projeto bom"}])
+        news_id = int(store.query_news()["id"][0])
+        store.save_analysis([(news_id, "positivo", 0.6, "bom", "")])
+        self.assertEqual(len(store.pending_analysis("v1")), 1)
+        store.close()
+
+
+@unittest.skipUnless(PARQUET_AVAILABLE, "pyarrow não instalado")
+class TestParquetStore(unittest.TestCase):
+
+    def setUp(self):
+        from storage import ParquetStore
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ParquetStore(os.path.join(self.tmp.name, "parquet"))
+        self.store.write(
+            [
+                {
+                    "termo_busca": "IA Piauí",
+                    "titulo": f"Notícia {month}",
+                    "link": f"https://example.com/{month}",
+                    "descricao": "Inovação",
+                    "data_publicacao": f"Mon, 02 {month} 2025 07:00:00 GMT",
+                    "data_coleta": "2025-09-02T15:02:31",
+                }
+                for month in ("Jun", "Jul", "Aug")
+            ]
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_partitions_by_month(self):
+        """Testa a criação de uma partição por mês de publicação"""
+        partitions = sorted(os.listdir(self.store.root))
+        self.assertEqual(partitions, ["mes=2025-06", "mes=2025-07", "mes=2025-08"])
+
+    def test_reads_only_requested_columns_and_period(self):
+        """Testa leitura seletiva de colunas e período com categoria no termo"""
+        from datetime import date
+
+        df = self.store.read(
+            columns=["termo_busca", "texto_completo"],
+            date_range=(date(2025, 7, 1), date(2025, 7, 31)),
+        )
+        self.assertEqual(df["texto_completo"].tolist(), ["Notícia Jul Inovação"])
+        self.assertEqual(str(df["termo_busca"].dtype), "category")
+        self.assertNotIn("link", df.columns)
+
+    def test_dashboard_prunes_by_selected_period(self):
+        """Testa a ordem das fontes e o período repassado à leitura do Parquet"""
+        from datetime import date
+        import dashboard.data_utils as data_utils
+
+        period = (date(2025, 7, 1), date(2025, 7, 31))
+        with mock.patch.multiple(
+            data_utils,
+            PARQUET_PATH=self.store.root,
+            DATABASE_PATH=os.path.join(self.tmp.name, "noticias.db"),
+            CSV_PATH=os.path.join(self.tmp.name, "noticias.csv"),
+        ):
+            open(data_utils.DATABASE_PATH, "w").close()
+            self.assertEqual(data_utils.data_source(), "sqlite")
+
+            with mock.patch.object(
+                data_utils, "DATA_SOURCES", ["parquet", "sqlite", "csv"]
+            ), mock.patch.object(self.store.__class__, "read", autospec=True) as read:
+                read.return_value = pd.DataFrame()
+                self.assertEqual(data_utils.data_source(), "parquet")
+                data_utils.load_data.__wrapped__(period)
+                self.assertEqual(read.call_args.kwargs["date_range"], period)
+
+
+class TestDateParsing(unittest.TestCase):
+
+    def test_matches_email_utils(self):
+        """Testa o parser de formato fixo contra o parser genérico"""
+        from email.utils import parsedate_to_datetime
+
+        for value in (
+            "Thu, 06 Feb 2025 08:00:00 GMT",
+            "Mon, 23 Jun 2025 07:00:00 +0300",
+            "23 Jun 2025 07:00 -0130",
+            "Mon, 23 Jun 2025 07:00:00 EST",
+        ):
+            expected = int(parsedate_to_datetime(value).timestamp())
+            self.assertEqual(parse_rfc822_utc(value), expected, value)
+
+        self.assertIsNone(parse_rfc822_utc("data inválida"))
+        self.assertIsNone(parse_rfc822_utc(None))
+
+    def test_rejects_out_of_range_fields(self):
+        """Testa ano com 2 dígitos e campos que calendar.timegm rolaria"""
+        from email.utils import parsedate_to_datetime
+
+        value = "Mon, 01 Jan 24 10:00:00 GMT"
+        self.assertEqual(
+            parse_rfc822_utc(value), int(parsedate_to_datetime(value).timestamp())
+        )
+        for value in (
+            "Thu, 32 Jan 2024 10:00:00 GMT",
+            "Fri, 30 Feb 2024 10:00:00 GMT",
+            "Mon, 01 Jan 2024 25:61:00 GMT",
+            "Mon, 01 Jan 2024 10:00:61 GMT",
+            "32 Jan 24 10:00 GMT",
+        ):
+            self.assertIsNone(parse_rfc822_utc(value), value)
+
+    def test_parse_feed_adds_timestamp(self):
+        """Testa o timestamp UTC calculado uma vez na coleta"""
+        collector = NewsCollector(use_cache=False)
+        items = collector.parse_feed(build_rss("IA", 1), "IA")
+        self.assertEqual(
+            items[0]["timestamp_publicacao"],
+            parse_rfc822_utc(items[0]["data_publicacao"]),
+        )
+
+    def test_dashboard_uses_preparsed_dates(self):
+        """Testa filtro de data sobre colunas datetime64 já preparadas"""
+        from datetime import date
+        from dashboard.data_utils import prepare_dates, apply_date_filter
+
+        df = prepare_dates(
+            pd.DataFrame(
+                {
+                    "data_publicacao": [
+                        "Thu, 06 Feb 2025 23:30:00 GMT",
+                        "Fri, 07 Feb 2025 00:30:00 GMT",
+                    ],
+                    "data_coleta": ["2025-02-07T10:00:00"] * 2,
+                }
+            )
+        )
+        self.assertEqual(str(df["data_publicacao_dt"].dtype), "datetime64[s]")
+
+        # Datas fora da janela de validade: fallback para a coleta
+        filtered = apply_date_filter(df, (date(2025, 2, 7), date(2025, 2, 7)))
+        self.assertEqual(len(filtered), 2)
+
+
+class TestDashboardSchema(unittest.TestCase):
+
+    def test_typed_schema(self):
+        """Testa categorias, float32, datas convertidas e texto derivado"""
+        from dashboard.data_utils import apply_schema, full_text
+
+        df = apply_schema(
+            pd.DataFrame(
+                {
+                    "termo_busca": ["IA Piauí", "IA Piauí"],
+                    "titulo": ["Avanço", "Crise"],
+                    "descricao": ["em Teresina", None],
+                    "data_publicacao": ["Thu, 06 Feb 2025 08:00:00 GMT"] * 2,
+                    "data_coleta": ["2025-02-07T10:00:00"] * 2,
+                    "texto_completo": ["Avanço em Teresina", "Crise "],
+                    "sentimento": ["positivo", "negativo"],
+                    "confianca": [0.8, 0.6],
+                }
+            )
+        )
+
+        self.assertEqual(str(df["termo_busca"].dtype), "category")
+        self.assertEqual(str(df["sentimento"].dtype), "category")
+        self.assertEqual(df["confianca"].dtype, "float32")
+        self.assertNotIn("texto_completo", df.columns)
+        self.assertNotIn("data_publicacao", df.columns)
+        self.assertEqual(df["data_publicacao_dt"].dt.day.tolist(), [6, 6])
+        self.assertEqual(full_text(df).tolist(), ["Avanço em Teresina", "Crise "])
+
+
+class TestLexicon(unittest.TestCase):
+
+    def test_single_table(self):
+        """Testa a fusão dos dicionários numa única tabela"""
+        from sentiment_analysis import dictionaries
+        from sentiment_analysis.lexicon import NEGATION, NEUTRAL, FLAGS
+
+        lexicon = compile_lexicon()
+        self.assertEqual(
+            lexicon.get("excelente")[0], dictionaries.POSITIVE_WORDS["excelente"]
+        )
+        self.assertEqual(lexicon.get("muito")[3], dictionaries.INTENSIFIERS["muito"])
+        self.assertTrue(lexicon.get("não")[FLAGS] & NEGATION)
+        self.assertEqual(
+            lexicon.words_with_flag(NEUTRAL), set(dictionaries.NEUTRAL_WORDS)
+        )
+
+    def test_binary_artifact_roundtrip(self):
+        """Testa gravação e carga do artefato com a mesma versão e resultados"""
+        lexicon = compile_lexicon()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "lexicon.bin")
+            lexicon.save(path)
+            analyzer = SentimentAnalyzer(path)
+
+        self.assertEqual(analyzer.lexicon_version, SentimentAnalyzer().lexicon_version)
+        text = "Não é uma boa solução, mas é muito excelente"
+        self.assertEqual(
+            analyzer.analyze_sentiment(text)[:2],
+            SentimentAnalyzer().analyze_sentiment(text)[:2],
+        )
+
+    def test_version_changes_with_content(self):
+        """Testa que editar um peso muda a versão do léxico"""
+        from sentiment_analysis import dictionaries
+
+        edited = dict(dictionaries.POSITIVE_WORDS, excelente=5)
+        self.assertNotEqual(
+            compile_lexicon(positive=edited).version, compile_lexicon().version
+        )
+
+
+class TestTokenizer(unittest.TestCase):
+
+    def test_matches_preprocess_text(self):
+        """Testa tokenize contra preprocess_text nos dados e em corpus sintético"""
+        from sentiment_analysis.text_processor import tokenize, preprocess_text
+        from testing import synthetic_corpus
+
+        texts = synthetic_corpus(500) + [
+            "Fim.Início... não!! é? bom-demais (IA) — 2025_ok",
+            "ÁGUA, É   ÓTIMO!!!",
+            "",
+        ]
+        csv_path = "data/noticias.csv"
+        if os.path.exists(csv_path):
+            texts += pd.read_csv(csv_path)["texto_completo"].astype(str).tolist()
+
+        for text in texts:
+            self.assertEqual(tokenize(text), preprocess_text(text), text)
+
+
+class TestScanner(unittest.TestCase):
+
+    def test_negation_scope(self):
+        """Testa alcance de 3 palavras da negação e a quebra por 'mas'"""
+        from sentiment_analysis.scanner import iter_context
+
+        words = ["não", "aaa", "bbb", "ccc", "ddd", "nunca", "mas", "boa"]
+        negated = [flag for _, flag, _ in iter_context(words)]
+        self.assertEqual(negated, [False, True, True, True, False, False, True, False])
+
+    def test_scan_matches_separate_passes(self):
+        """Testa scores e contadores fundidos contra o contexto em etapas"""
+        from sentiment_analysis.scanner import scan
+        from sentiment_analysis.text_processor import tokenize, analyze_with_context
+
+        text = "Não é uma boa solução, mas é muito excelente e pouco ruim"
+        words = tokenize(text)
+        context = analyze_with_context(words)
+        result = scan(words)
+
+        self.assertEqual(
+            result[:4],
+            (4.5, 5.4, ["muito_excelente"], ["não_boa", "não_solução", "ruim"]),
+        )
+        self.assertEqual(result.negations, sum(1 for _, n, _ in context if n))
+        self.assertEqual(result.intensifiers, sum(1 for _, _, i in context if i != 1.0))
+
+
+class TestExpressions(unittest.TestCase):
+
+    def setUp(self):
+        self.analyzer = SentimentAnalyzer()
+
+    def test_phrase_scored_as_unit(self):
+        """Testa expressão casada como unidade, com negação aplicada a ela"""
+        _, _, details = self.analyzer.analyze_sentiment(
+            "Há falta de transparência no programa"
+        )
+        self.assertEqual(details["negativas"], ["falta de transparência"])
+
+        sentiment, _, details = self.analyzer.analyze_sentiment(
+            "Não há falta de recursos"
+        )
+        self.assertEqual(sentiment, "positivo")
+        self.assertEqual(details["positivas"], ["não_falta de recursos"])
+
+    def test_breaker_phrase(self):
+        """Testa 'não apenas' sem negar a palavra seguinte"""
+        sentiment, _, details = self.analyzer.analyze_sentiment(
+            "Projeto não apenas bom"
+        )
+        self.assertEqual(sentiment, "positivo")
+        self.assertEqual(details["negacoes_detectadas"], 0)
+
+    def test_phrases_survive_artifact(self):
+        """Testa expressões no artefato binário e no caminho por contexto"""
+        from sentiment_analysis.text_processor import tokenize, analyze_with_context
+        from sentiment_analysis.scanner import scan
+
+        lexicon = compile_lexicon()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "lexicon.bin")
+            lexicon.save(path)
+            loaded = Lexicon.load(path)
+
+        self.assertEqual(loaded.phrases, lexicon.phrases)
+        words = tokenize("Sem dúvida, não há corte de gastos, cada vez mais bom")
+        context = analyze_with_context(words, loaded)
+        result = scan(words, loaded)
+        self.assertEqual(result[:8], scan(words, lexicon)[:8])
+        self.assertEqual(
+            result[2:4], (["sem dúvida", "não_corte de gastos"], ["não_bom"])
+        )
+        # O caminho por contexto casa as mesmas unidades
+        self.assertEqual(len(context), result.state.position)
+
+
+class TestBatchEngine(unittest.TestCase):
+
+    def test_matches_scalar_path(self):
+        """Testa o motor vetorizado contra analyze_sentiment, texto a texto"""
+        from sentiment_analysis.batch import analyze_columns, iter_details
+        from testing import synthetic_corpus, with_phrases
+
+        analyzer = SentimentAnalyzer()
+        texts = with_phrases(synthetic_corpus(300)) + [
+            "",
+            "!!!",
+            "não",
+            "Não há falta de recursos, sem dúvida muito bom",
+            "bom ruim",
+        ]
+        for text, (sentiment, confidence, details) in zip(
+            texts, iter_details(analyze_columns(texts))
+        ):
+            expected = analyzer.analyze_sentiment(text)
+            self.assertEqual((sentiment, confidence), expected[:2])
+            for key in ("positivas", "negativas"):
+                self.assertEqual(sorted(details[key]), sorted(expected[2][key]))
+                details[key] = expected[2][key]
+            self.assertEqual(details, expected[2])
+
+    def test_phrase_across_documents(self):
+        """Testa que expressões não casam na fronteira entre documentos"""
+        from sentiment_analysis.batch import analyze_tokens
+
+        columns = analyze_tokens([["projeto", "falta"], ["recursos", "ruim"]])
+        self.assertEqual(columns["negativas"], [[], ["ruim"]])
+        self.assertEqual(columns["total_palavras"].tolist(), [2, 2])
+
+    def test_expression_prefix_is_not_a_word(self):
+        """Testa que o início de uma expressão sozinho não tem polaridade"""
+        sentiment, _, details = SentimentAnalyzer().analyze_sentiment(
+            "Ainda falta definir o cronograma"
+        )
+        self.assertEqual(sentiment, "neutro")
+        self.assertEqual(details["negativas"], [])
+
+
+class TestParallelAnalysis(unittest.TestCase):
+
+    def test_order_preserved_across_workers(self):
+        """Testa ordem e resultados da análise em processos com gerador"""
+        texts = [f"Projeto {i} é ótimo" if i % 3 else f"Falha {i}" for i in range(60)]
+        analyzer = SentimentAnalyzer()
+
+        results = list(analyzer.analyze_parallel(iter(texts), workers=2, chunksize=7))
+        self.assertEqual(results, analyzer.analyze_batch(texts))
+
+    def test_auto_chunksize(self):
+        """Testa limites do tamanho automático de bloco"""
+        from sentiment_analysis.parallel import (
+            auto_chunksize,
+            MIN_CHUNKSIZE,
+            MAX_CHUNKSIZE,
+        )
+
+        self.assertEqual(auto_chunksize(100, 4), MIN_CHUNKSIZE)
+        self.assertEqual(auto_chunksize(10**8, 4), MAX_CHUNKSIZE)
+        self.assertEqual(auto_chunksize(160_000, 4), 10_000)
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        from sentiment_analysis import ResultCache
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(os.path.join(self.tmp.name, "cache.db"), 2)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_hit_matches_analysis(self):
+        """Testa resultado do cache igual ao analisado e normalização do texto"""
+        analyzer = SentimentAnalyzer(cache=self.cache)
+        first = analyzer.analyze_sentiment("Projeto excelente, mas com falhas")
+        again = analyzer.analyze_sentiment("  projeto EXCELENTE,  mas com falhas")
+
+        self.assertEqual(first, again)
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(
+            first[:2],
+            SentimentAnalyzer().analyze_sentiment("Projeto excelente, mas com falhas")[
+                :2
+            ],
+        )
+
+    def test_lexicon_version_and_lru(self):
+        """Testa invalidação por versão do léxico e descarte do menos usado"""
+        from sentiment_analysis.result_cache import cache_key
+
+        analyzer = SentimentAnalyzer(cache=self.cache)
+        edited = SentimentAnalyzer(
+            compile_lexicon(positive={"bom": 3}), cache=self.cache
+        )
+        self.assertEqual(
+            analyzer.analyze_sentiment("bom")[2]["peso_positivo"],
+            analyzer.lexicon.get("bom")[0],
+        )
+        self.assertEqual(edited.analyze_sentiment("bom")[2]["peso_positivo"], 3.0)
+
+        analyzer.analyze_sentiment("ruim")
+        self.assertEqual(len(self.cache), 2)
+        self.assertNotIn(
+            cache_key("bom", analyzer.lexicon_version),
+            self.cache.get_many([cache_key("bom", analyzer.lexicon_version)]),
+        )
+
+    def test_count_only_when_over_limit(self):
+        """Testa que gravações abaixo do limite não contam a tabela inteira"""
+        from sentiment_analysis import ResultCache
+
+        cache = ResultCache(os.path.join(self.tmp.name, "big.db"), 100)
+        statements = []
+        cache._conn.set_trace_callback(statements.append)
+        analyzer = SentimentAnalyzer(cache=cache)
+        for i in range(120):
+            analyzer.analyze_sentiment(f"texto {i}")
+        counts = [s for s in statements if "COUNT(*)" in s]
+        cache._conn.set_trace_callback(None)
+
+        self.assertEqual(len(counts), 2)
+        self.assertLessEqual(len(cache), 100)
+        cache.close()
+
+    def test_parallel_uses_cache(self):
+        """Testa que a análise em processos lê e grava o cache"""
+        from concurrent.futures import ProcessPoolExecutor
+        from sentiment_analysis import ResultCache
+
+        cache = ResultCache(os.path.join(self.tmp.name, "parallel.db"))
+        analyzer = SentimentAnalyzer(cache=cache)
+        texts = ["Projeto excelente", "Crise grave", "Relatório técnico"] * 4
+        expected = [r["sentiment"] for r in SentimentAnalyzer().analyze_batch(texts)]
+
+        first = list(analyzer.analyze_parallel(texts, workers=2, chunksize=2))
+        self.assertEqual([r["sentiment"] for r in first], expected)
+        self.assertEqual(len(cache), 3)
+
+        with mock.patch.object(ProcessPoolExecutor, "submit", autospec=True) as submit:
+            again = list(analyzer.analyze_parallel(texts, workers=2, chunksize=2))
+        submit.assert_not_called()
+        self.assertEqual(again, first)
+        cache.close()
+
+
+class TestSelectiveRescoring(unittest.TestCase):
+
+    def test_changed_tokens(self):
+        """Testa diff de palavras e do 1º token de expressões alteradas"""
+        from sentiment_analysis.rescoring import changed_tokens
+
+        old = compile_lexicon()
+        new = compile_lexicon(
+            positive={**dictionaries.POSITIVE_WORDS, "excelente": 9},
+            negative_expressions={"corte de verbas": 2},
+        )
+        changed = changed_tokens(old, new)
+        self.assertIn("excelente", changed)
+        self.assertIn("corte", changed)
+        self.assertIn("falta", changed)
+        self.assertNotIn("bom", changed)
+
+    def test_rescore_only_affected(self):
+        """Testa reanálise só das notícias afetadas e o índice gravado"""
+        from sentiment_analysis.rescoring import InvertedIndex, rescore_store
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = NewsStore(os.path.join(tmp, "noticias.db"))
+            store.upsert_news(
+                {"termo_busca": "IA", "titulo": title, "link": f"https://x/{i}"}
+                for i, title in enumerate(
+                    ["Projeto excelente", "Projeto ruim", "Governo digital"]
+                )
+            )
+            index = InvertedIndex()
+            index.sync(store)
+            path = os.path.join(tmp, "index.npz")
+            index.save(path)
+            index = InvertedIndex.load(path)
+
+            new = compile_lexicon(
+                positive={
+                    w: v
+                    for w, v in dictionaries.POSITIVE_WORDS.items()
+                    if w != "excelente"
+                },
+                negative={**dictionaries.NEGATIVE_WORDS, "excelente": 1},
+            )
+            old = compile_lexicon()
+            second = int(store.query_news()["id"][1])
+            store.save_analysis([(second, "negativo", 0.6, "", "ruim")], old.version)
+            ids = rescore_store(store, index, old, new)
+            news = store.query_news()
+            # O resultado não afetado passa para a versão nova sem reanálise
+            pending = store.pending_analysis(new.version)["id"].tolist()
+            store.close()
+
+        self.assertEqual(ids, [int(news["id"][0])])
+        self.assertEqual(news["sentimento"][0], "negativo")
+        self.assertEqual(news["sentimento"][1], "negativo")
+        self.assertTrue(news["sentimento"][2:].isna().all())
+        self.assertEqual(pending, [int(news["id"][2])])
+
+
+class TestResultModes(unittest.TestCase):
+
+    def setUp(self):
+        self.analyzer = SentimentAnalyzer()
+
+    def test_label_mode(self):
+        """Testa mode="label": mesmo rótulo e confiança, sem detalhes"""
+        text = "Não é uma boa solução, mas é muito excelente"
+        full = self.analyzer.analyze_sentiment(text)
+        label = self.analyzer.analyze_sentiment(text, mode="label")
+
+        self.assertEqual(label[:2], full[:2])
+        self.assertIsNone(label.details)
+        with self.assertRaises(ValueError):
+            self.analyzer.analyze_sentiment(text, mode="rapido")
+
+    def test_label_mode_with_cache(self):
+        """Testa mode="label" com cache: sem listas de palavras e sem gravar faltas"""
+        from sentiment_analysis import ResultCache
+        from sentiment_analysis import analyzer as analyzer_module
+
+        text = "Não é uma boa solução, mas é muito excelente"
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResultCache(os.path.join(tmp, "cache.db"))
+            analyzer = SentimentAnalyzer(cache=cache)
+            with mock.patch.object(
+                analyzer_module, "scan", wraps=analyzer_module.scan
+            ) as scan, mock.patch.object(
+                cache, "put_many", wraps=cache.put_many
+            ) as put_many:
+                label = analyzer.analyze_sentiment(text, mode="label")
+            scan.assert_called_once()
+            self.assertFalse(scan.call_args.kwargs["collect"])
+            put_many.assert_not_called()
+
+            full = analyzer.analyze_sentiment(text)
+            with mock.patch.object(analyzer_module, "scan") as scan:
+                cached = analyzer.analyze_sentiment(text, mode="label")
+            scan.assert_not_called()
+            cache.close()
+
+        self.assertEqual(label, cached)
+        self.assertEqual(label[:2], full[:2])
+        self.assertIsNone(cached.details)
+
+    def test_lazy_details(self):
+        """Testa Details como mapeamento com slots e tupla desempacotável"""
+        sentiment, confidence, details = self.analyzer.analyze_sentiment(
+            "Projeto excelente, excelente mesmo"
+        )
+        self.assertEqual(sentiment, "positivo")
+        self.assertEqual(details["positivas"], ["excelente"])
+        self.assertEqual(details["palavras_sentimento"], 2)
+        self.assertEqual(list(details), list(dict(details)))
+        self.assertFalse(hasattr(details, "__dict__"))
+
+
+class TestStreamingCLI(unittest.TestCase):
+
+    def test_jsonl_and_csv_round_trip(self):
+        """Testa a CLI em fluxo: JSONL → JSONL e JSONL → CSV (modo label)"""
+        import io
+        import json
+        from contextlib import redirect_stderr, redirect_stdout
+        from sentiment_analysis.__main__ import main
+
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "entrada.jsonl")
+            with open(source, "w", encoding="utf-8") as f:
+                f.write('{"id": 1, "texto_completo": "Projeto excelente"}\n')
+                f.write('{"id": 2, "titulo": "Crise", "descricao": "péssimo"}\n')
+
+            out, err = io.StringIO(), io.StringIO()
+            with redirect_stdout(out), redirect_stderr(err):
+                main([source, "--batch-size", "1"])
+            records = [json.loads(line) for line in out.getvalue().splitlines()]
+
+            # CSV: o cabeçalho vem do primeiro registro; campo novo é erro
+            target = os.path.join(tmp, "saida.csv")
+            failure = io.StringIO()
+            with redirect_stderr(failure), self.assertRaises(SystemExit):
+                main([source, "-o", target])
+            self.assertIn("titulo, descricao", failure.getvalue())
+
+            uniform = os.path.join(tmp, "uniforme.jsonl")
+            with open(uniform, "w", encoding="utf-8") as f:
+                f.write('{"id": 1, "texto_completo": "Projeto excelente"}\n')
+                f.write('{"id": 2, "texto_completo": "Crise péssima"}\n')
+            with redirect_stderr(io.StringIO()):
+                main([uniform, "-o", target, "--mode", "label"])
+            saved = pd.read_csv(target)
+
+            out = io.StringIO()
+            with redirect_stdout(out), redirect_stderr(io.StringIO()):
+                main(
+                    [uniform, "--mode", "label", "--workers", "2", "--batch-size", "1"]
+                )
+            parallel = [json.loads(line) for line in out.getvalue().splitlines()]
+
+        self.assertEqual([r["sentimento"] for r in records], ["positivo", "negativo"])
+        self.assertEqual(records[0]["palavras_positivas"], ["excelente"])
+        self.assertIn("2 documentos", err.getvalue())
+        self.assertEqual(saved["sentimento"].tolist(), ["positivo", "negativo"])
+        self.assertNotIn("palavras_positivas", saved.columns)
+        self.assertEqual([r["sentimento"] for r in parallel], ["positivo", "negativo"])
+        self.assertNotIn("palavras_positivas", parallel[0])
+
+    def test_parallel_label_mode_skips_words(self):
+        """Testa que words=False não monta listas de palavras nos processos"""
+        from sentiment_analysis.parallel import iter_parallel
+
+        texts = ["Projeto excelente", "Crise péssima", "Relatório"] * 3
+        with mock.patch(
+            "sentiment_analysis.batch._word_lists", side_effect=AssertionError
+        ):
+            results = list(iter_parallel(texts, workers=1, chunksize=4, words=False))
+        self.assertEqual(
+            [r[1] for r in results[:3]], ["positivo", "negativo", "neutro"]
+        )
+        self.assertTrue(all(r[3] is None for r in results))
+
+    def test_token_store(self):
+        """Testa TokenStore: reabertura, análise pelos ids e contagens"""
+        from sentiment_analysis.batch import analyze_columns
+        from sentiment_analysis.token_store import TokenStore
+
+        texts = ["Não é uma boa solução", "Governo digital excelente", ""]
+        with tempfile.TemporaryDirectory() as tmp:
+            TokenStore(tmp).append_texts([1, 2], texts[:2])
+            store = TokenStore(tmp)
+            store.append_texts([5], texts[2:])
+            store = TokenStore(tmp)
+            columns = SentimentAnalyzer().analyze_token_store(store)
+            counts = store.token_counts()
+
+        expected = analyze_columns(texts)
+        self.assertEqual(store.last_id, 5)
+        self.assertEqual(columns["id"].tolist(), [1, 2, 5])
+        self.assertEqual(
+            columns["sentimento"].tolist(), expected["sentimento"].tolist()
+        )
+        self.assertEqual(columns["positivas"], expected["positivas"])
+        self.assertEqual(counts["excelente"], 1)
+        self.assertEqual(
+            extract_keywords(" ".join(texts)),
+            keywords_from_counts(counts),
+        )
+
+
+class TestLexiconEvaluation(unittest.TestCase):
+
+    def test_variants_match_single_runs(self):
+        """Testa avaliação com tokenização única contra análises separadas"""
+        from sentiment_analysis.batch import analyze_columns
+        from sentiment_analysis.evaluation import evaluate
+
+        texts = ["Projeto excelente", "Não é uma boa solução", "Governo digital"]
+        variant = compile_lexicon(
+            positive={
+                w: v for w, v in dictionaries.POSITIVE_WORDS.items() if w != "excelente"
+            },
+            negative={**dictionaries.NEGATIVE_WORDS, "excelente": 1},
+        )
+        lexicons = {"padrao": compile_lexicon(), "variante": variant}
+        evaluation = evaluate(texts, lexicons, doc_ids=[10, 11, 12])
+
+        for name, lexicon in lexicons.items():
+            expected = analyze_columns(texts, lexicon, words=False)
+            self.assertEqual(
+                evaluation.columns[name]["confianca"].tolist(),
+                expected["confianca"].tolist(),
+            )
+        self.assertEqual(evaluation.distributions().loc["variante", "negativo"], 2)
+        self.assertEqual(evaluation.agreement().loc["padrao", "variante"], 2 / 3)
+        diffs = evaluation.diffs("padrao", "variante")
+        self.assertEqual(diffs["id"].tolist(), [10])
+        self.assertEqual(diffs["sentimento_variante"].tolist(), ["negativo"])
+        self.assertEqual(evaluation.confusion("padrao", "variante").values.sum(), 3)
+
+    def test_evaluate_token_store(self):
+        """Testa avaliação direto do TokenStore, nomeando pela versão"""
+        from sentiment_analysis.evaluation import evaluate_store
+        from sentiment_analysis.token_store import TokenStore
+
+        lexicon = compile_lexicon()
+        with tempfile.TemporaryDirectory() as tmp:
+            store = TokenStore(tmp)
+            store.append_texts([7, 9], ["Projeto excelente", "Crise grave"])
+            evaluation = evaluate_store(store, [lexicon, lexicon])
+
+        self.assertEqual(evaluation.names, [lexicon.version, lexicon.version + "'"])
+        self.assertEqual(evaluation.labels().index.tolist(), [7, 9])
+        self.assertTrue((evaluation.agreement().values == 1.0).all())
+
+
+class TestLinearModel(unittest.TestCase):
+
+    def setUp(self):
+        from sentiment_analysis.linear_model import HashingClassifier
+
+        self.texts = [
+            "Projeto excelente e inovador",
+            "Resultado ótimo para o estado",
+            "Crise grave no sistema",
+            "Problema péssimo na gestão",
+            "Governo anuncia reunião",
+            "Secretaria publica edital",
+        ]
+        self.labels = ["positivo"] * 2 + ["negativo"] * 2 + ["neutro"] * 2
+        self.model = HashingClassifier(n_features=2**12).fit(
+            self.texts, self.labels, epochs=30, batch_size=2
+        )
+
+    def test_fit_and_contract(self):
+        """Testa treino, rótulos e o contrato (sentimento, confiança, details)"""
+        from sentiment_analysis.results import DETAIL_KEYS
+
+        columns = self.model.analyze_columns(self.texts + [""])
+        self.assertEqual(columns["sentimento"].tolist(), self.labels + ["neutro"])
+        self.assertIn("excelente", columns["positivas"][0])
+        self.assertIn("crise", columns["negativas"][2])
+
+        sentiment, confidence, details = SentimentAnalyzer(
+            model=self.model
+        ).analyze_sentiment("Projeto excelente")
+        self.assertEqual(sentiment, "positivo")
+        self.assertTrue(0 < confidence <= 1)
+        self.assertEqual(list(details), list(DETAIL_KEYS))
+        self.assertIsNone(self.model.analyze_sentiment("crise", mode="label").details)
+
+    def test_save_and_bootstrap(self):
+        """Testa gravação do modelo e rótulos gerados pelo léxico"""
+        from sentiment_analysis.linear_model import HashingClassifier, bootstrap_labels
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "modelo.npz")
+            self.model.save(path)
+            loaded = HashingClassifier.load(path)
+        self.assertEqual(loaded.n_features, 2**12)
+        self.assertEqual(
+            loaded.predict_proba(self.texts).tolist(),
+            self.model.predict_proba(self.texts).tolist(),
+        )
+
+        texts, labels = bootstrap_labels(self.texts, min_confidence=0.5)
+        self.assertEqual(len(texts), len(labels))
+        self.assertIn("Projeto excelente e inovador", texts)
+        self.assertNotIn("Governo anuncia reunião", texts)
+
+
+class TestStreamingScorer(unittest.TestCase):
+
+    def test_chunks_match_whole_text(self):
+        """Testa trechos cortando palavras, negação e expressões no meio"""
+        from sentiment_analysis.streaming import score_chunks
+
+        analyzer = SentimentAnalyzer()
+        text = (
+            "O projeto não é bom. Muito excelente a iniciativa, porém há "
+            "falta de recursos e uma crise grave no sistema de saúde!"
+        )
+        expected = analyzer.analyze_sentiment(text)
+        for size in (1, 3, 7, len(text)):
+            chunks = [text[i : i + size] for i in range(0, len(text), size)]
+            result = score_chunks(chunks)
+            self.assertEqual(result[:2], expected[:2])
+            for key in ("peso_positivo", "peso_negativo", "negacoes_detectadas"):
+                self.assertEqual(result.details[key], expected.details[key])
+            self.assertEqual(
+                sorted(result.details["negativas"]),
+                sorted(expected.details["negativas"]),
+            )
+        self.assertEqual(analyzer.analyze_stream([]), ("neutro", 0.1, mock.ANY))
+
+    def test_scan_in_parts(self):
+        """Testa scan retomado do carry igual à varredura de uma vez"""
+        from sentiment_analysis.scanner import scan
+
+        words = "não muito bom porém falta recursos excelente".split()
+        whole = scan(words)
+        # Corte no meio de "falta recursos": a expressão passa do stop
+        first = scan(words, stop=5)
+        self.assertEqual(first.consumed, 6)
+        rest = scan(words[first.consumed :], carry=first)
+        self.assertEqual(rest[:8], whole[:8])
+        self.assertEqual(rest.state.position, whole.state.position)
+
+    def test_bounded_memory(self):
+        """Testa memória constante e só as palavras que mais pesaram"""
+        import tracemalloc
+        from sentiment_analysis.streaming import StreamingScorer
+
+        scorer = StreamingScorer(top_words=2)
+        chunk = "Resultado excelente, ótimo e bom para o estado. " * 200
+        tracemalloc.start()
+        for _ in range(200):
+            scorer.feed(chunk)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        sentiment, _, details = scorer.result()
+
+        self.assertLess(peak, 512 * 1024)
+        self.assertEqual(sentiment, "positivo")
+        self.assertEqual(details["total_palavras"], 200 * 200 * 6)
+        self.assertEqual(len(details["positivas"]), 2)
+
+
+class TestConfidenceArrays(unittest.TestCase):
+
+    def test_arrays_match_scalar(self):
+        """Testa as fórmulas em arrays contra as escalares, valor a valor"""
+        import itertools
+        import numpy as np
+        from sentiment_analysis.confidence import (
+            calculate_improved_confidence,
+            calculate_neutral_confidence,
+            improved_confidence_array,
+            neutral_confidence_array,
+            technical_mask,
+        )
+
+        rows = list(
+            itertools.product(
+                range(4), range(4), [0, 0.5, 1.5, 3], [0, 1, 2.5], [0, 5, 40]
+            )
+        )
+        columns = [np.array(column) for column in zip(*rows)]
+        self.assertEqual(
+            improved_confidence_array(*columns).tolist(),
+            [calculate_improved_confidence(*row) for row in rows],
+        )
+
+        texts = [[], ["sistema"], ["governo", "digital", "novo"], ["palavra"] * 20]
+        vocabulary = {"sistema": 0, "governo": 1, "digital": 2, "novo": 3, "palavra": 4}
+        mask = technical_mask(vocabulary)
+        self.assertEqual(mask.tolist(), [True, True, True, False, False])
+        technical = np.array(
+            [int(mask[[vocabulary[w] for w in t]].sum()) for t in texts]
+        )
+        self.assertEqual(
+            neutral_confidence_array(
+                np.array(list(map(len, texts))), technical
+            ).tolist(),
+            [calculate_neutral_confidence(t) for t in texts],
+        )
+
+
+class TestHotLexicon(unittest.TestCase):
+
+    def test_lexicon_file(self):
+        """Testa o léxico em JSON: exportação, carga e validação"""
+        from sentiment_analysis.lexicon import load_lexicon_file, save_lexicon_file
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "lexicon.json")
+            save_lexicon_file(path)
+            self.assertEqual(load_lexicon_file(path).version, compile_lexicon().version)
+            self.assertFalse(os.path.exists(path + ".tmp"))
+
+            save_lexicon_file(path, negative={"excelente": 2})
+            lexicon = SentimentAnalyzer(path).lexicon
+            self.assertEqual(lexicon.get("excelente")[1], 2)
+            self.assertIn("ótimo", lexicon)
+
+            with open(path, "w", encoding="utf-8") as f:
+                f.write('{"positivo": {"bom": 1}}')
+            with self.assertRaises(ValueError):
+                load_lexicon_file(path)
+
+    def test_watcher_swaps_snapshots(self):
+        """Testa troca a quente, arquivo inválido e cache chaveado pela versão"""
+        from sentiment_analysis import LexiconWatcher, ResultCache
+        from sentiment_analysis.lexicon import save_lexicon_file
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "lexicon.json")
+            save_lexicon_file(path)
+            watcher = LexiconWatcher(path, interval=3600)
+            cache = ResultCache(os.path.join(tmp, "cache.db"))
+            analyzer = SentimentAnalyzer(watcher, cache=cache)
+            first = analyzer.lexicon
+            self.assertEqual(
+                analyzer.analyze_sentiment("Projeto excelente")[0], "positivo"
+            )
+
+            positive = dict(dictionaries.POSITIVE_WORDS)
+            del positive["excelente"]
+            save_lexicon_file(
+                path,
+                positive=positive,
+                negative={**dictionaries.NEGATIVE_WORDS, "excelente": 1},
+            )
+            os.utime(path, ns=(1, 1))
+            # Dentro do intervalo o snapshot não muda; refresh força a verificação
+            self.assertIs(analyzer.lexicon, first)
+            self.assertTrue(watcher.refresh())
+            self.assertEqual(
+                analyzer.analyze_sentiment("Projeto excelente")[0], "negativo"
+            )
+            old, new = watcher.pop_change()
+            self.assertEqual((old, new), (first, analyzer.lexicon))
+            self.assertIsNone(watcher.pop_change())
+
+            with open(path, "w", encoding="utf-8") as f:
+                f.write('{"positive": ')
+            self.assertFalse(watcher.refresh())
+            self.assertIsNotNone(watcher.error)
+            self.assertIs(analyzer.lexicon, new)
+            cache.close()
+
+    def test_watcher_picks_up_file_created_later(self):
+        """Testa arquivo ausente (léxico padrão, sem erro) criado depois"""
+        from sentiment_analysis import LexiconWatcher
+        from sentiment_analysis.lexicon import default_lexicon, save_lexicon_file
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "lexicon.json")
+            watcher = LexiconWatcher(path, interval=3600)
+            self.assertIs(watcher.current(), default_lexicon())
+            self.assertIsNone(watcher.error)
+            self.assertFalse(watcher.refresh())
+
+            save_lexicon_file(path, positive={"excelente": 3})
+            self.assertTrue(watcher.refresh())
+            old, new = watcher.pop_change()
+            self.assertIs(old, default_lexicon())
+            self.assertNotEqual(new.version, old.version)
+
+            os.remove(path)
+            self.assertTrue(watcher.refresh())
+            self.assertIs(watcher.current(), default_lexicon())
+
+
 def run_tests():
     """Executa todos os testes"""
     # Cria suite de testes
@@ -140,6 +1575,30 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestSentimentAnalyzer))
     suite.addTests(loader.loadTestsFromTestCase(TestTextProcessing))
     suite.addTests(loader.loadTestsFromTestCase(TestDataIntegrity))
+    suite.addTests(loader.loadTestsFromTestCase(TestNewsCollector))
+    suite.addTests(loader.loadTestsFromTestCase(TestHttpTransport))
+    suite.addTests(loader.loadTestsFromTestCase(TestRSSParser))
+    suite.addTests(loader.loadTestsFromTestCase(TestIncrementalIngest))
+    suite.addTests(loader.loadTestsFromTestCase(TestNearDuplicates))
+    suite.addTests(loader.loadTestsFromTestCase(TestNewsStore))
+    suite.addTests(loader.loadTestsFromTestCase(TestParquetStore))
+    suite.addTests(loader.loadTestsFromTestCase(TestDateParsing))
+    suite.addTests(loader.loadTestsFromTestCase(TestDashboardSchema))
+    suite.addTests(loader.loadTestsFromTestCase(TestLexicon))
+    suite.addTests(loader.loadTestsFromTestCase(TestTokenizer))
+    suite.addTests(loader.loadTestsFromTestCase(TestScanner))
+    suite.addTests(loader.loadTestsFromTestCase(TestExpressions))
+    suite.addTests(loader.loadTestsFromTestCase(TestBatchEngine))
+    suite.addTests(loader.loadTestsFromTestCase(TestParallelAnalysis))
+    suite.addTests(loader.loadTestsFromTestCase(TestResultCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestSelectiveRescoring))
+    suite.addTests(loader.loadTestsFromTestCase(TestResultModes))
+    suite.addTests(loader.loadTestsFromTestCase(TestStreamingCLI))
+    suite.addTests(loader.loadTestsFromTestCase(TestLexiconEvaluation))
+    suite.addTests(loader.loadTestsFromTestCase(TestLinearModel))
+    suite.addTests(loader.loadTestsFromTestCase(TestStreamingScorer))
+    suite.addTests(loader.loadTestsFromTestCase(TestConfidenceArrays))
+    suite.addTests(loader.loadTestsFromTestCase(TestHotLexicon))
 
     # Executa testes com saída silenciosa
     import os
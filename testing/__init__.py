@@ -0,0 +1,8 @@
+"""
+Dados sintéticos compartilhados pelos testes e pelos benchmarks
+"""
+
+from .corpus import synthetic_corpus, with_phrases
+from .rss import FixtureRSSServer, build_rss
+
+__all__ = ["synthetic_corpus", "with_phrases", "FixtureRSSServer", "build_rss"]
@@ -0,0 +1,44 @@
+"""
+Corpus sintético no formato das notícias coletadas
+"""
+
+import random
+
+from sentiment_analysis import dictionaries
+
+FILLER = ["de", "a", "o", "em", "Piauí", "IA", "governo", "Teresina", "2025"]
+PUNCTUATION = [".", ",", "!", "?", "...", "-", ":", "(", ")", '"']
+
+
+def synthetic_corpus(docs, seed=42):
+    """Textos no formato título + descrição das notícias coletadas"""
+    rng = random.Random(seed)
+    vocab = (
+        list(dictionaries.POSITIVE_WORDS)
+        + list(dictionaries.NEGATIVE_WORDS)
+        + list(dictionaries.NEUTRAL_WORDS)
+        + list(dictionaries.NEGATION_WORDS)
+        + FILLER * 20
+    )
+    texts = []
+    for _ in range(docs):
+        parts = []
+        for _ in range(rng.randint(10, 40)):
+            word = rng.choice(vocab)
+            parts.append(word.capitalize() if rng.random() < 0.1 else word)
+            if rng.random() < 0.15:
+                parts.append(rng.choice(PUNCTUATION))
+        texts.append(" ".join(parts))
+    return texts
+
+
+def with_phrases(texts, seed=42):
+    """Insere expressões do dicionário em parte dos textos"""
+    rng = random.Random(seed)
+    phrases = list(dictionaries.POSITIVE_EXPRESSIONS) + list(
+        dictionaries.NEGATIVE_EXPRESSIONS
+    )
+    return [
+        f"{text} {rng.choice(phrases)}" if rng.random() < 0.3 else text
+        for text in texts
+    ]
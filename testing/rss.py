@@ -0,0 +1,97 @@
+"""
+Servidor RSS local para testes e benchmarks da coleta
+"""
+
+import hashlib
+import threading
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from xml.sax.saxutils import escape
+
+
+def build_rss(term, num_items=50):
+    """Gera um feed RSS sintético para o termo informado"""
+    base_date = datetime(2025, 9, 1, 12, 0, tzinfo=timezone.utc)
+    items = []
+
+    for i in range(num_items):
+        pub_date = format_datetime(base_date - timedelta(hours=i), usegmt=True)
+        items.append(
+            "<item>"
+            f"<title>{escape(term)} notícia {i} - Fonte {i % 7}</title>"
+            f"<link>https://example.com/{escape(term.replace(' ', '-'))}/{i}</link>"
+            f"<guid>{escape(term)}-{i}</guid>"
+            f"<description>Inovação e desenvolvimento em {escape(term)} "
+            f"número {i}</description>"
+            f"<pubDate>{pub_date}</pubDate>"
+            "</item>"
+        )
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0"><channel><title>Fixture</title>'
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode("utf-8")
+
+
+class FixtureRSSServer:
+    """Servidor HTTP em thread que responde feeds RSS com latência simulada"""
+
+    def __init__(self, latency=0.0, num_items=50):
+        self.latency = latency
+        self.num_items = num_items
+        self.request_count = 0
+        self.not_modified_count = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/rss/search"
+
+    def _make_handler(self):
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                fixture.request_count += 1
+                term = parse_qs(urlparse(self.path).query).get("q", [""])[0]
+                if fixture.latency:
+                    time.sleep(fixture.latency)
+
+                body = build_rss(term, fixture.num_items)
+                etag = '"%s"' % hashlib.md5(body).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    fixture.not_modified_count += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/rss+xml")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
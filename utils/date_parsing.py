@@ -0,0 +1,82 @@
+"""
+Parse rápido das datas de publicação do RSS (RFC 822) para timestamp UTC
+"""
+
+import calendar
+from email.utils import parsedate_tz, mktime_tz
+
+MONTHS = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+UTC_ZONES = {"GMT", "UTC", "UT", "Z"}
+
+
+def _zone_offset(zone):
+    """Converte 'GMT' ou '+0300' em deslocamento em segundos"""
+    if zone in UTC_ZONES:
+        return 0
+    if len(zone) == 5 and zone[0] in "+-" and zone[1:].isdigit():
+        sign = -1 if zone[0] == "-" else 1
+        return sign * (int(zone[1:3]) * 3600 + int(zone[3:5]) * 60)
+    raise ValueError(zone)
+
+
+def _in_range(year, month, day, hour, minute, second):
+    """Campos dentro dos limites (timegm aceitaria e "rolaria" os valores)"""
+    return (
+        1 <= day <= calendar.monthrange(year, month)[1]
+        and 0 <= hour <= 23
+        and 0 <= minute <= 59
+        # 60: segundo intercalar, permitido pela RFC 5322
+        and 0 <= second <= 60
+    )
+
+
+def parse_rfc822_utc(value):
+    """Converte 'Thu, 06 Feb 2025 08:00:00 GMT' em segundos desde a época (UTC)
+
+    Usa um caminho de formato fixo (split + calendar.timegm) e só recorre
+    ao parser genérico de email.utils para variações fora do padrão, como
+    ano com 2 dígitos. Retorna None para valores vazios ou inválidos
+    (inclusive dia, hora, minuto ou segundo fora dos limites).
+    """
+    if not value or not isinstance(value, str):
+        return None
+
+    parts = value.split()
+    try:
+        if parts[0].endswith(","):
+            parts = parts[1:]
+        day = int(parts[0])
+        month = MONTHS[parts[1][:3].lower()]
+        year = int(parts[2])
+        clock = parts[3].split(":")
+        hour, minute = int(clock[0]), int(clock[1])
+        second = int(clock[2]) if len(clock) > 2 else 0
+        offset = _zone_offset(parts[4]) if len(parts) > 4 else 0
+        if len(parts[2]) == 4 and _in_range(year, month, day, hour, minute, second):
+            return calendar.timegm((year, month, day, hour, minute, second)) - offset
+    except (IndexError, KeyError, ValueError):
+        pass
+
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    try:
+        if not _in_range(*parsed[:6]):
+            return None
+        return int(mktime_tz(parsed))
+    except (OverflowError, ValueError):
+        return None
@@ -6,6 +6,54 @@ import re
 from collections import Counter
 import pandas as pd
 
+# Palavras irrelevantes para filtrar nas palavras-chave
+STOP_WORDS = frozenset(
+    {
+        "para",
+        "com",
+        "uma",
+        "como",
+        "mais",
+        "ser",
+        "ter",
+        "fazer",
+        "esse",
+        "essa",
+        "este",
+        "esta",
+        "isso",
+        "aquele",
+        "aquela",
+        "pelo",
+        "pela",
+        "pelos",
+        "pelas",
+        "desde",
+        "ainda",
+        "também",
+        "apenas",
+        "todos",
+        "todas",
+        "muito",
+        "muita",
+        "onde",
+        "quando",
+        "porque",
+        "então",
+        "assim",
+        "depois",
+        "antes",
+        "durante",
+        "sobre",
+        "entre",
+        "através",
+        "mediante",
+        "segundo",
+        "conforme",
+        "enquanto",
+    }
+)
+
 
 def clean_html_tags(text):
     """Remove tags HTML do texto"""
@@ -76,69 +124,32 @@ def extract_keywords(text, min_length=4, max_keywords=20):
     if not text:
         return []
 
-    # Palavras irrelevantes para filtrar
-    stop_words = {
-        "para",
-        "com",
-        "uma",
-        "como",
-        "mais",
-        "ser",
-        "ter",
-        "fazer",
-        "esse",
-        "essa",
-        "este",
-        "esta",
-        "isso",
-        "aquele",
-        "aquela",
-        "pelo",
-        "pela",
-        "pelos",
-        "pelas",
-        "desde",
-        "ainda",
-        "também",
-        "apenas",
-        "todos",
-        "todas",
-        "muito",
-        "muita",
-        "onde",
-        "quando",
-        "porque",
-        "então",
-        "assim",
-        "depois",
-        "antes",
-        "durante",
-        "sobre",
-        "entre",
-        "através",
-        "mediante",
-        "segundo",
-        "conforme",
-        "enquanto",
-    }
-
     # Preprocessa o texto
     text = text.lower()
     text = re.sub(r"[^\w\s\-áéíóúàèìòùâêîôûãõç]", " ", text)
     words = text.split()
 
-    # Filtra palavras
-    keywords = [
-        word
-        for word in words
-        if len(word) >= min_length and word not in stop_words and not word.isdigit()
-    ]
+    return extract_keywords_from_tokens(words, min_length, max_keywords)
+
+
+def extract_keywords_from_tokens(tokens, min_length=4, max_keywords=20):
+    """Extrai palavras-chave de tokens já separados (ex.: do TokenStore)"""
+    return keywords_from_counts(Counter(tokens), min_length, max_keywords)
 
-    # Conta frequências
-    word_freq = Counter(keywords)
+
+def keywords_from_counts(word_freq, min_length=4, max_keywords=20):
+    """Palavras-chave mais frequentes a partir de contagens token → frequência"""
+    # Filtra palavras
+    keywords = Counter(
+        {
+            word: count
+            for word, count in word_freq.items()
+            if len(word) >= min_length and word not in STOP_WORDS and not word.isdigit()
+        }
+    )
 
     # Retorna as mais frequentes
-    return [word for word, count in word_freq.most_common(max_keywords)]
+    return [word for word, count in keywords.most_common(max_keywords)]
 
 
 def calculate_text_stats(text):